@@ -3,7 +3,7 @@
 
 import json
 import re
-from typing import Dict, List, Set, Union
+from typing import Dict, FrozenSet, List, Set, Union
 from pathlib import Path
 
 class SkillValidator:
@@ -13,6 +13,7 @@ class SkillValidator:
         self.reference_path = Path(reference_path)
         self.canonical_skills: List[Dict[str, Union[str, List[str]]]] = []
         self.skill_patterns: List[tuple[str, List[str]]] = []
+        self.canonical_names: FrozenSet[str] = frozenset()
         self._load_reference()
     
     def _load_reference(self) -> None:
@@ -26,6 +27,7 @@ class SkillValidator:
             name = str(skill['name'])
             patterns = list(skill['patterns']) if isinstance(skill['patterns'], list) else []
             self.skill_patterns.append((name, patterns))
+        self.canonical_names = frozenset(name for name, _ in self.skill_patterns)
     
     def validate_and_extract(self, job_description: str) -> Set[str]:
         """Extract ONLY skills matching canonical 557 patterns"""
@@ -1,7 +1,7 @@
 # Database Module - LinkedIn Jobs Storage
 # EMD Compliance: ≤80 lines
 
-from src.db.connection import DatabaseConnection
+from src.db.connection import DatabaseConnection, open_db
 from src.db.schema import SchemaManager
 from src.db.operations import JobStorageOperations
 
@@ -9,4 +9,5 @@ __all__ = [
     "DatabaseConnection",
     "SchemaManager",
     "JobStorageOperations",
+    "open_db",
 ]
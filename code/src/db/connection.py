@@ -5,6 +5,7 @@ import sqlite3
 import logging
 from contextlib import contextmanager, AbstractContextManager
 from collections.abc import Iterator
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -59,3 +60,22 @@ class DatabaseConnection:
     def get_connection_context(self) -> AbstractContextManager[sqlite3.Connection]:
         """Get connection context for external use"""
         return self._get_connection()
+
+
+def open_db(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    """Plain connection with the WAL/sync/cache pragmas, for batch scripts and tools
+
+    Read-only connections open with mode=ro and leave journal_mode alone
+    (it is a database-wide setting that needs a write).
+    """
+    if read_only:
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=30.0)
+    else:
+        conn = sqlite3.connect(db_path, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    conn.execute("PRAGMA cache_size=-131072")  # 128 MB
+    return conn
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
 import threading
+from collections import Counter
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
@@ -14,6 +17,11 @@ from src.db.schema import SchemaManager
 
 logger = logging.getLogger(__name__)
 
+_INSERT_URL_SQL = """
+    INSERT OR IGNORE INTO job_urls (job_id, platform, input_role, actual_role, url)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 
 class RoleStats(TypedDict):
     role: str | None
@@ -50,29 +58,39 @@ class JobStorageOperations:
         logger.info("Two-phase storage initialized")
 
     def store_urls(self, urls: list["JobUrlModel"]) -> int:
-        """Phase 1: Store URLs for fast collection"""
+        """Phase 1: Store URLs for fast collection
+
+        Inserted as one batch; if a row makes the batch fail, the batch is rolled
+        back and retried row by row, skipping (and logging) only the bad rows.
+        """
         if not urls:
             return 0
+        rows = [
+            (
+                url_model.job_id,
+                url_model.platform,
+                url_model.input_role,
+                url_model.actual_role,
+                url_model.url,
+            )
+            for url_model in urls
+        ]
         with self.lock, self.connection.get_connection_context() as conn:
-            stored = 0
-            for url_model in urls:
-                try:
-                    conn.execute(
-                        """
-                        INSERT OR IGNORE INTO job_urls (job_id, platform, input_role, actual_role, url)
-                        VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (
-                            url_model.job_id,
-                            url_model.platform,
-                            url_model.input_role,
-                            url_model.actual_role,
-                            url_model.url,
-                        ),
-                    )
-                    stored += 1
-                except Exception as error:
-                    logger.warning(f"Failed to store URL {url_model.url}: {error}")
+            try:
+                # One statement for the whole batch in one transaction; OR IGNORE skips
+                # constraint hits (duplicates) per row, so rowcount is the NEW rows only
+                cursor = conn.executemany(_INSERT_URL_SQL, rows)
+                stored = cursor.rowcount
+            except sqlite3.Error as error:
+                # One bad row aborts executemany - redo row by row so the rest still land
+                conn.rollback()
+                logger.warning(f"Batch URL insert failed ({error}), retrying row by row")
+                stored = 0
+                for row in rows:
+                    try:
+                        stored += conn.execute(_INSERT_URL_SQL, row).rowcount
+                    except sqlite3.Error as row_error:
+                        logger.warning(f"Failed to store URL {row[4]}: {row_error}")
             conn.commit()
             logger.info(f"Stored {stored}/{len(urls)} URLs")
             return stored
@@ -160,6 +178,37 @@ class JobStorageOperations:
             )
             return cursor.fetchall()
 
+    def iter_unscraped_urls(
+        self, platform: str, input_role: str, limit: int | None = None
+    ) -> Iterator[tuple[str, str, str, str]]:
+        """Stream the rows get_unscraped_urls returns, one at a time off the cursor
+
+        The connection stays open until the iterator is exhausted or closed, so
+        consume it promptly. No lock is held between rows.
+        """
+        query = """
+            SELECT u.url, u.job_id, u.platform, u.actual_role FROM job_urls u
+            WHERE u.platform = ? AND u.input_role = ? AND u.scraped = 0
+        """
+        params: tuple[str | int, ...] = (platform, input_role)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+        with self.connection.get_connection_context() as conn:
+            yield from conn.execute(query, params)
+
+    def count_unscraped(self, platform: str, input_role: str) -> int:
+        """Count URLs still waiting for detail scraping (scraped = 0) for a platform/role"""
+        with self.connection.get_connection_context() as conn:
+            cursor = conn.execute(
+                """
+                SELECT COUNT(1) FROM job_urls
+                WHERE platform = ? AND input_role = ? AND scraped = 0
+            """,
+                (platform, input_role),
+            )
+            return int(cursor.fetchone()[0])
+
     def get_urls_to_scrape(self, platform: str, limit: int = 100) -> list[JobUrlModel]:
         """Get unscraped URLs as JobUrlModel objects (LinkedIn/unified scraper compatibility)
         FIX FP-3: Use lock to prevent race condition where same URL is fetched by concurrent scrapers
@@ -261,6 +310,22 @@ class JobStorageOperations:
                 for row in cursor.fetchall()
             ]
 
+    def count_jobs(self) -> int:
+        """Count stored jobs without materializing rows"""
+        with self.connection.get_connection_context() as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM jobs")
+            return int(cursor.fetchone()[0])
+
+    def count_jobs_by_platform(self) -> dict[str, int]:
+        """Stored jobs per lowercased platform, aggregated in SQLite (idx_jobs_platform)"""
+        with self.connection.get_connection_context() as conn:
+            cursor = conn.execute("SELECT platform, COUNT(*) FROM jobs GROUP BY platform")
+            # Folds 'LinkedIn'/'linkedin' groups together in one pass
+            counts: Counter[str] = Counter()
+            for platform, count in cursor:
+                counts[(platform or "").lower()] += count
+            return dict(counts)
+
     def get_scraping_stats(self) -> ScrapingStats:
         """Get comprehensive scraping statistics for KPI dashboard"""
         with self.connection.get_connection_context() as conn:
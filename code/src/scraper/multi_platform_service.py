@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import AsyncGenerator, List
 
 from src.models.models import JobDetailModel
 from .unified.linkedin_unified import scrape_linkedin_jobs_unified
@@ -12,50 +12,75 @@ from .unified.naukri_unified import scrape_naukri_jobs_unified
 logger = logging.getLogger(__name__)
 
 
-async def scrape_jobs_with_skills(
+async def scrape_jobs_with_skills_stream(
     platforms: list[str],
     keyword: str,
     location: str = "United States",
     limit: int = 100,
     headless: bool = False,
-    store_to_db: bool = True,
-) -> List[JobDetailModel]:
-    """2-Platform scraper with Playwright unified architecture
-    
-    Platforms:
-        - linkedin: Playwright unified (URL collection + detail scraping with skills)
-        - naukri: Playwright unified (headless=False for anti-detection)
-    
-    Returns:
-        List of JobDetailModel with skills extracted and stored
+    max_in_flight: int | None = None,
+) -> AsyncGenerator[tuple[str, List[JobDetailModel]], None]:
+    """Yield (platform, jobs) as each platform finishes, so callers can report between platforms
+
+    Each unified scraper stores its own jobs to the database as it goes.
+    max_in_flight caps concurrent detail fetches (None keeps each scraper's default).
     """
-    all_jobs: List[JobDetailModel] = []
-    linkedin_requested = "linkedin" in platforms
-    naukri_requested = "naukri" in platforms
-    
+    limits = {} if max_in_flight is None else {"max_in_flight": max_in_flight}
     # Scrape LinkedIn via unified Playwright scraper
-    if linkedin_requested:
+    if "linkedin" in platforms:
         logger.info("Scraping LinkedIn via unified Playwright (2-phase: URLs + Details + Skills)...")
         linkedin_jobs = await scrape_linkedin_jobs_unified(
             keyword=keyword,
             location=location,
             limit=limit,
             headless=headless,
+            **limits,
         )
         logger.info(f"✅ LinkedIn: Collected {len(linkedin_jobs)} jobs with skills")
-        all_jobs.extend(linkedin_jobs)
-    
+        yield "linkedin", linkedin_jobs
+
     # Scrape Naukri via unified Playwright scraper
-    if naukri_requested:
+    if "naukri" in platforms:
         logger.info("Scraping Naukri via unified Playwright (headless=False, visible browser)...")
         naukri_jobs = await scrape_naukri_jobs_unified(
             keyword=keyword,
             location=location,
             limit=limit,
             headless=False,
+            **limits,
         )
         logger.info(f"✅ Naukri: Collected {len(naukri_jobs)} jobs with skills")
-        all_jobs.extend(naukri_jobs)
+        yield "naukri", naukri_jobs
+
+
+async def scrape_jobs_with_skills(
+    platforms: list[str],
+    keyword: str,
+    location: str = "United States",
+    limit: int = 100,
+    headless: bool = False,
+    store_to_db: bool = True,
+    max_in_flight: int | None = None,
+) -> List[JobDetailModel]:
+    """2-Platform scraper with Playwright unified architecture
+    
+    Platforms:
+        - linkedin: Playwright unified (URL collection + detail scraping with skills)
+        - naukri: Playwright unified (headless=False for anti-detection)
+    
+    Returns:
+        List of JobDetailModel with skills extracted and stored
+    """
+    all_jobs: List[JobDetailModel] = []
+    async for _, platform_jobs in scrape_jobs_with_skills_stream(
+        platforms,
+        keyword,
+        location=location,
+        limit=limit,
+        headless=headless,
+        max_in_flight=max_in_flight,
+    ):
+        all_jobs.extend(platform_jobs)
     
     logger.info(f"Total jobs scraped: {len(all_jobs)} with skills extracted")
     if store_to_db:
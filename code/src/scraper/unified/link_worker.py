@@ -0,0 +1,140 @@
+"""Link Scraper Worker - Phase 1 URL collection for the Streamlit link form
+
+Runs inside the form's long-lived process pool: the functions are top-level so a
+spawn-context pool can pickle them by reference, and init_worker() prepares the
+process once instead of per scrape. Each call returns the result dict directly.
+All calls share one event loop, so LinkedIn single-location runs keep a warm
+chromium between clicks.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from collections.abc import Coroutine
+from multiprocessing.util import Finalize
+from typing import Any
+
+from src.db.operations import JobStorageOperations
+from src.scraper.unified.linkedin.shared_browser import close_shared_browsers
+
+# Created by init_worker; the shared browser is bound to it
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def init_worker(project_root: str, playwright_browsers_path: str) -> None:
+    """Pool initializer: temp dirs, Playwright browsers and project root, once per process"""
+    temp_dir = tempfile.gettempdir()
+    os.environ["TMPDIR"] = temp_dir
+    os.environ["TMP"] = temp_dir
+    os.environ["TEMP"] = temp_dir
+    os.environ["PLAYWRIGHT_BROWSERS_PATH"] = playwright_browsers_path
+
+    global _loop
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    # Pool workers skip atexit; multiprocessing finalizers still run on exit
+    Finalize(None, _shutdown, exitpriority=10)
+
+    # Relative paths (data/jobs.db, cookies) resolve against the project root
+    os.chdir(project_root)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+
+def _shutdown() -> None:
+    if _loop is None or _loop.is_closed():
+        return
+    _loop.run_until_complete(close_shared_browsers())
+    _loop.close()
+
+
+def _run(coro: Coroutine[Any, Any, dict[str, int | str | None]]) -> dict[str, int | str | None]:
+    """Run on the worker's persistent loop (fresh asyncio.run() outside a pool)"""
+    if _loop is None:
+        return asyncio.run(coro)
+    return _loop.run_until_complete(coro)
+
+
+async def _scrape_single(
+    platform: str, job_role: str, location: str, num_jobs: int
+) -> dict[str, int | str | None]:
+    result: dict[str, int | str | None] = {"urls_collected": 0, "urls_stored": 0, "error": None}
+
+    try:
+        if platform.lower() == "linkedin":
+            from src.scraper.unified.linkedin.infinite_scroll_scraper import (
+                scrape_linkedin_urls_infinite_scroll,
+            )
+
+            urls = await scrape_linkedin_urls_infinite_scroll(
+                keyword=job_role,
+                location=location,
+                limit=num_jobs,
+                headless=False,
+                reuse_browser=_loop is not None,  # Warm chromium only with a persistent loop
+            )
+        else:
+            from src.config.naukri_locations import NAUKRI_ALL_LOCATIONS
+            from src.scraper.unified.naukri.url_scraper import scrape_naukri_urls
+
+            city_gid = NAUKRI_ALL_LOCATIONS.get(location)
+            urls = await scrape_naukri_urls(
+                keyword=job_role,
+                location=location,
+                limit=num_jobs,
+                headless=False,
+                store_to_db=False,
+                city_gid=city_gid,
+            )
+
+        result["urls_collected"] = len(urls) if urls else 0
+
+        if urls:
+            db = JobStorageOperations("data/jobs.db")
+            result["urls_stored"] = db.store_urls(urls)
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
+async def _scrape_worldwide(
+    job_role: str, threshold: int, concurrent_tabs: int
+) -> dict[str, int | str | None]:
+    from src.scraper.unified.linkedin.concurrent_url_scraper import (
+        scrape_worldwide_concurrent,
+    )
+
+    result: dict[str, int | str | None] = {"urls_collected": 0, "urls_stored": 0, "error": None}
+
+    try:
+        urls = await scrape_worldwide_concurrent(
+            keyword=job_role,
+            threshold=threshold,
+            max_concurrent=concurrent_tabs,
+            headless=False,
+        )
+
+        result["urls_collected"] = len(urls) if urls else 0
+        result["urls_stored"] = result["urls_collected"]  # Already stored by the scraper
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
+def scrape_single_location(
+    platform: str, job_role: str, location: str, num_jobs: int
+) -> dict[str, int | str | None]:
+    """Scrape one location's job URLs and store them"""
+    return _run(_scrape_single(platform, job_role, location, num_jobs))
+
+
+def scrape_worldwide(
+    job_role: str, threshold: int, concurrent_tabs: int
+) -> dict[str, int | str | None]:
+    """Scrape LinkedIn countries concurrently until threshold URLs are stored"""
+    return _run(_scrape_worldwide(job_role, threshold, concurrent_tabs))
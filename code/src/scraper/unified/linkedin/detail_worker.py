@@ -0,0 +1,202 @@
+"""Detail Scraper Worker - subprocess entrypoint for the Streamlit Phase 2 form
+
+One batch:  python -u -m src.scraper.unified.linkedin.detail_worker --platform linkedin ...
+Persistent: python -u -m src.scraper.unified.linkedin.detail_worker --serve
+            then newline-delimited JSON commands on stdin:
+            {"cmd": "scrape", "batch_id": 1, "platform": ..., "job_role": ..., ...}
+            {"cmd": "abort"} | {"cmd": "exit"}  (stdin EOF also exits)
+Streams progress events from the staggered scraper, then one result. Events go as
+length-prefixed frames on the pipe named by SCRAPER_PROGRESS_FD when the parent
+provides one, else as PROGRESS: / JSON lines on stdout.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import threading
+from collections import deque
+from typing import Any
+
+from src.db.operations import JobStorageOperations
+from src.scraper.unified.linkedin.shared_browser import close_shared_browsers
+from src.scraper.unified.linkedin.staggered_queue_scraper import (
+    emit_progress,
+    scrape_job_details_staggered,
+)
+from src.utils.progress_channel import write_result
+
+logger = logging.getLogger(__name__)
+
+
+async def scrape(
+    platform: str,
+    job_role: str,
+    batch_size: int,
+    concurrent_tabs: int,
+    delay_seconds: float,
+    sequential: bool,
+    db_path: str = "data/jobs.db",
+    batch_id: int | None = None,
+    reuse_browser: bool = False,
+) -> None:
+    """Scrape one batch of unscraped URLs and print the final result as JSON"""
+    result: dict[str, int | str | None] = {
+        "jobs_scraped": 0,
+        "expired_removed": 0,
+        "failed": 0,
+        "error": None,
+    }
+    if batch_id is not None:
+        result["batch_id"] = batch_id
+
+    try:
+        db_ops = JobStorageOperations(db_path)
+        urls = db_ops.get_unscraped_urls(platform, job_role, limit=batch_size)
+
+        if not urls:
+            write_result(result)
+            return
+
+        # Round-robin scraper with real-time progress
+        jobs = await scrape_job_details_staggered(
+            urls=urls,
+            headless=False,
+            num_workers=concurrent_tabs,
+            stagger_delay=delay_seconds,
+            sequential=sequential,
+            reuse_browser=reuse_browser,
+        )
+
+        result["jobs_scraped"] = len(jobs)
+
+    except asyncio.CancelledError:
+        result["error"] = "Aborted by user"
+    except Exception as e:
+        result["error"] = str(e)
+
+    write_result(result)
+
+
+def _read_commands(
+    loop: asyncio.AbstractEventLoop, commands: "asyncio.Queue[dict[str, Any] | None]"
+) -> None:
+    """stdin reader thread: forward parsed commands to the event loop, None on EOF"""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed worker command: {line[:80]}")
+            continue
+        loop.call_soon_threadsafe(commands.put_nowait, command)
+    loop.call_soon_threadsafe(commands.put_nowait, None)
+
+
+async def serve(db_path: str = "data/jobs.db") -> None:
+    """Persistent mode: keep the interpreter, imports and chromium warm across batches"""
+    loop = asyncio.get_running_loop()
+    commands: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    threading.Thread(
+        target=_read_commands, args=(loop, commands), name="worker-stdin", daemon=True
+    ).start()
+
+    try:
+        await _serve_commands(commands, db_path)
+    finally:
+        await close_shared_browsers()
+
+
+async def _serve_commands(
+    commands: "asyncio.Queue[dict[str, Any] | None]", db_path: str
+) -> None:
+    """Run scrape commands one batch at a time until exit or stdin EOF"""
+    # Commands that arrive while a batch is still unwinding run after it
+    backlog: deque[dict[str, Any]] = deque()
+
+    while True:
+        command = backlog.popleft() if backlog else await commands.get()
+        if command is None or command.get("cmd") == "exit":
+            return
+        if command.get("cmd") != "scrape":
+            continue  # abort while idle - nothing to do
+
+        batch_id = int(command.get("batch_id", 0))
+        # Marks where this batch's output starts in the shared stdout stream
+        emit_progress("batch_start", {"batch_id": batch_id})
+        task = asyncio.create_task(
+            scrape(
+                platform=str(command["platform"]),
+                job_role=str(command["job_role"]),
+                batch_size=int(command.get("batch_size", 100)),
+                concurrent_tabs=int(command.get("concurrent_tabs", 2)),
+                delay_seconds=float(command.get("delay_seconds", 3.0)),
+                sequential=bool(command.get("sequential", True)),
+                db_path=db_path,
+                batch_id=batch_id,
+                reuse_browser=True,
+            )
+        )
+
+        # Watch stdin while the batch runs so abort/exit take effect mid-batch
+        while not task.done():
+            next_command = asyncio.create_task(commands.get())
+            done, _ = await asyncio.wait(
+                {task, next_command}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if next_command not in done:
+                next_command.cancel()
+                continue
+
+            received = next_command.result()
+            if received is None or received.get("cmd") in ("abort", "exit"):
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                if received is None or received.get("cmd") == "exit":
+                    return
+            else:
+                backlog.append(received)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job details for one batch")
+    parser.add_argument(
+        "--serve", action="store_true", help="Run batches from stdin commands until EOF"
+    )
+    parser.add_argument("--platform", help="Platform (lowercase)")
+    parser.add_argument("--job-role", help="Input role to pull URLs for")
+    parser.add_argument("--batch-size", type=int, default=100, help="URLs per batch")
+    parser.add_argument("--concurrent-tabs", type=int, default=2, help="Browser tabs")
+    parser.add_argument("--delay", type=float, default=3.0, help="Base delay (seconds)")
+    parser.add_argument(
+        "--parallel", action="store_true", help="Multi-tab mode instead of sequential"
+    )
+    parser.add_argument("--db", default="data/jobs.db", help="Database path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+    if args.serve:
+        asyncio.run(serve(args.db))
+        return
+    if not args.platform or not args.job_role:
+        parser.error("--platform and --job-role are required without --serve")
+
+    asyncio.run(
+        scrape(
+            platform=args.platform,
+            job_role=args.job_role,
+            batch_size=args.batch_size,
+            concurrent_tabs=args.concurrent_tabs,
+            delay_seconds=args.delay,
+            sequential=not args.parallel,
+            db_path=args.db,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
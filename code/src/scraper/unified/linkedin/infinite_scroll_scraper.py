@@ -4,11 +4,12 @@ import os
 import asyncio
 import logging
 from typing import List
-from playwright.async_api import async_playwright, ProxySettings
+from playwright.async_api import ProxySettings
 from src.models.models import JobUrlModel
 from src.db.operations import JobStorageOperations
 from .selector_config import SEARCH_SELECTORS
 from .network_monitor import NetworkMonitor
+from .shared_browser import browser_session
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +17,14 @@ async def scrape_linkedin_urls_infinite_scroll(
     keyword: str,
     location: str,
     limit: int = 10000,
-    headless: bool = False
+    headless: bool = False,
+    reuse_browser: bool = False
 ) -> List[JobUrlModel]:
-    """Infinite scroll scraper with real-time deduplication"""
+    """Infinite scroll scraper with real-time deduplication
+
+    reuse_browser=True (long-lived workers only) runs in the warm shared browser
+    and leaves it up for the next call; only this run's context is closed.
+    """
     
     # Database for real-time deduplication
     db_ops = JobStorageOperations()
@@ -51,8 +57,7 @@ async def scrape_linkedin_urls_infinite_scroll(
     all_urls: list[str] = []
     total_scroll_rounds = 0
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless, proxy=proxy_config)
+    async with browser_session(headless, proxy_config, reuse_browser) as browser:
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -228,7 +233,6 @@ async def scrape_linkedin_urls_infinite_scroll(
             # Print network summary before closing
             network_monitor.print_summary()
             await context.close()
-            await browser.close()
     
     print(f"\n{'='*70}")
     print(f"✅ SCRAPING COMPLETED")
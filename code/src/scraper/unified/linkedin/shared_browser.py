@@ -0,0 +1,97 @@
+# Shared Browser - warm chromium reused across scrapes in long-lived workers
+# Used by the detail worker (batches) and the link worker (single-location runs)
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+from playwright.async_api import Browser, Playwright, ProxySettings, async_playwright
+
+logger = logging.getLogger(__name__)
+
+# One driver + chromium per launch options, so a changed PROXY_URL gets a fresh
+# browser. Playwright objects belong to the loop that created them: callers must
+# keep one event loop for the life of the worker.
+_shared_browsers: dict[tuple[bool, str | None], tuple[Playwright, Browser]] = {}
+
+
+async def launch_browser(
+    headless: bool, proxy_config: Optional[ProxySettings]
+) -> tuple[Playwright, Browser] | None:
+    """Start a driver and launch chromium WITH TIMEOUT, None if launch hangs"""
+    p = await async_playwright().start()
+    try:
+        browser = await asyncio.wait_for(
+            p.chromium.launch(headless=headless, proxy=proxy_config),
+            timeout=30.0  # 30s timeout for browser launch
+        )
+    except asyncio.TimeoutError:
+        logger.error("❌ Browser launch timed out after 30s")
+        await p.stop()
+        return None
+    except BaseException:
+        await p.stop()
+        raise
+    return p, browser
+
+
+async def get_shared_browser(
+    headless: bool, proxy_config: Optional[ProxySettings]
+) -> Browser | None:
+    """Reuse the warm browser for these launch options, relaunching if it died"""
+    server = proxy_config.get("server") if proxy_config is not None else None
+    key = (headless, server)
+    cached = _shared_browsers.get(key)
+    if cached is not None:
+        if cached[1].is_connected():
+            return cached[1]
+        del _shared_browsers[key]
+        try:
+            await cached[0].stop()
+        except Exception:
+            pass
+
+    launched = await launch_browser(headless, proxy_config)
+    if launched is None:
+        return None
+    _shared_browsers[key] = launched
+    return launched[1]
+
+
+@asynccontextmanager
+async def browser_session(
+    headless: bool, proxy_config: Optional[ProxySettings], reuse_browser: bool = False
+) -> AsyncGenerator[Browser, None]:
+    """Shared warm browser when reusing (left running), else one closed on exit"""
+    if reuse_browser:
+        browser = await get_shared_browser(headless, proxy_config)
+        if browser is None:
+            raise RuntimeError("Browser launch timed out")
+        yield browser
+        return
+
+    launched = await launch_browser(headless, proxy_config)
+    if launched is None:
+        raise RuntimeError("Browser launch timed out")
+    p, browser = launched
+    try:
+        yield browser
+    finally:
+        try:
+            await asyncio.wait_for(browser.close(), timeout=10.0)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close browser: {e}")
+        await p.stop()
+
+
+async def close_shared_browsers() -> None:
+    """Shut down every warm browser (persistent worker exit)"""
+    while _shared_browsers:
+        _, (p, browser) = _shared_browsers.popitem()
+        try:
+            await asyncio.wait_for(browser.close(), timeout=10.0)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close browser: {e}")
+        await p.stop()
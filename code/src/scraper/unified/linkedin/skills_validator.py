@@ -63,7 +63,7 @@ class SkillsValidator:
             return "", False
 
         # Parse skills
-        skills_list = [s.strip() for s in extracted_skills.split(",") if s.strip()]
+        skills_list = list(filter(None, map(str.strip, extracted_skills.split(","))))
 
         if not skills_list:
             return "", False
@@ -18,7 +18,6 @@ Flow:
 
 import asyncio
 import html
-import json
 import logging
 import os
 import random
@@ -28,9 +27,10 @@ from dataclasses import dataclass
 from typing import List, Optional, Set, Union
 
 from playwright.async_api import (
+    Browser,
     Page,
+    Playwright,
     ProxySettings,
-    async_playwright,
 )
 
 from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
@@ -47,16 +47,17 @@ from src.scraper.unified.linkedin.selector_config import (
     DETAIL_SELECTORS,
     EXPIRED_JOB_INDICATORS,
 )
+from src.scraper.unified.linkedin.shared_browser import get_shared_browser, launch_browser
 from src.scraper.unified.scalable.user_agent_pool import get_random_user_agent
+from src.utils.progress_channel import write_progress
 
 logger = logging.getLogger(__name__)
 
 
 def emit_progress(event_type: str, data: dict[str, Union[str, int, float, bool, None, dict[str, int]]]) -> None:
-    """Emit progress event as JSON line to stdout for real-time UI updates"""
-    event = {"event": event_type, "timestamp": time.time(), **data}
-    # Print to stdout with flush for immediate visibility
-    print(f"PROGRESS:{json.dumps(event)}", flush=True)
+    """Emit progress event for real-time UI updates (frame channel, else stdout JSON line)"""
+    # Batched: up to 16 events share one write, none waits more than 50ms
+    write_progress({"event": event_type, "timestamp": time.time(), **data})
 
 
 @dataclass
@@ -188,6 +189,7 @@ class RoundRobinScraper:
         max_retries: int = 3,
         rate_limit_backoff_base: float = 60.0,  # INCREASED: Base backoff for 429
         sequential: bool = False,  # Use simple sequential mode (more reliable)
+        reuse_browser: bool = False,  # Keep chromium warm for the next batch
     ):
         # Validate and clamp num_slots to 1-10
         self.num_slots = max(1, min(10, num_slots))
@@ -196,6 +198,8 @@ class RoundRobinScraper:
         self.max_retries = max_retries
         self.rate_limit_backoff_base = rate_limit_backoff_base
         self.sequential = sequential  # Simple sequential mode (more reliable)
+        self.reuse_browser = reuse_browser
+        self._playwright: Playwright | None = None  # Own driver when not reusing
 
         # Slots (tabs)
         self.slots: dict[int, Page] = {}
@@ -961,6 +965,29 @@ class RoundRobinScraper:
 
         return job
 
+    async def _open_browser(
+        self, proxy_config: Optional[ProxySettings]
+    ) -> Browser | None:
+        """Warm shared browser when reusing, else a fresh launch owned by this run"""
+        if self.reuse_browser:
+            return await get_shared_browser(self.headless, proxy_config)
+        launched = await launch_browser(self.headless, proxy_config)
+        if launched is None:
+            return None
+        self._playwright, browser = launched
+        return browser
+
+    async def _release_browser(self, browser: Browser) -> None:
+        """Close the browser this run launched; a shared one stays up for the next batch"""
+        if self._playwright is None:
+            return
+        try:
+            await asyncio.wait_for(browser.close(), timeout=10.0)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close browser: {e}")
+        await self._playwright.stop()
+        self._playwright = None
+
     async def _scrape_sequential(
         self, urls: List[tuple[str, str, str, str]]
     ) -> List[JobDetailModel]:
@@ -1014,16 +1041,9 @@ class RoundRobinScraper:
                     password=password,
                 )
 
-        # Launch browser WITH TIMEOUT to prevent hanging on browser issues
-        p = await async_playwright().start()
-        try:
-            browser = await asyncio.wait_for(
-                p.chromium.launch(headless=self.headless, proxy=proxy_config),
-                timeout=30.0  # 30s timeout for browser launch
-            )
-        except asyncio.TimeoutError:
-            logger.error("❌ Browser launch timed out after 30s")
-            await p.stop()
+        # Launch (or reuse) browser WITH TIMEOUT to prevent hanging on browser issues
+        browser = await self._open_browser(proxy_config)
+        if browser is None:
             return []
 
         try:
@@ -1036,8 +1056,7 @@ class RoundRobinScraper:
             )
         except asyncio.TimeoutError:
             logger.error("❌ Context creation timed out after 10s")
-            await browser.close()
-            await p.stop()
+            await self._release_browser(browser)
             return []
 
         page: Page | None = None  # Initialize to None for cleanup safety
@@ -1198,11 +1217,7 @@ class RoundRobinScraper:
                 await asyncio.wait_for(context.close(), timeout=10.0)
             except Exception:
                 pass
-            try:
-                await asyncio.wait_for(browser.close(), timeout=10.0)
-            except Exception:
-                pass
-            await p.stop()
+            await self._release_browser(browser)
 
         self._print_summary()
         return self.results
@@ -1264,16 +1279,9 @@ class RoundRobinScraper:
                     password=password,
                 )
 
-        # Launch browser WITH TIMEOUTS to prevent hanging
-        p = await async_playwright().start()
-        try:
-            browser = await asyncio.wait_for(
-                p.chromium.launch(headless=self.headless, proxy=proxy_config),
-                timeout=30.0  # 30s timeout for browser launch
-            )
-        except asyncio.TimeoutError:
-            logger.error("❌ Browser launch timed out after 30s")
-            await p.stop()
+        # Launch (or reuse) browser WITH TIMEOUTS to prevent hanging
+        browser = await self._open_browser(proxy_config)
+        if browser is None:
             return []
 
         try:
@@ -1286,8 +1294,7 @@ class RoundRobinScraper:
             )
         except asyncio.TimeoutError:
             logger.error("❌ Context creation timed out after 10s")
-            await browser.close()
-            await p.stop()
+            await self._release_browser(browser)
             return []
 
         try:
@@ -1320,8 +1327,7 @@ class RoundRobinScraper:
                         except Exception:
                             pass
                     await context.close()
-                    await browser.close()
-                    await p.stop()
+                    await self._release_browser(browser)
                     return []
             logger.info(f"✅ {self.num_slots} slots created (staggered)")
 
@@ -1645,11 +1651,7 @@ class RoundRobinScraper:
             except Exception as e:
                 logger.warning(f"⚠️ Failed to close context: {e}")
 
-            try:
-                await asyncio.wait_for(browser.close(), timeout=10.0)
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to close browser: {e}")
-            await p.stop()
+            await self._release_browser(browser)
 
         self._print_summary()
         return self.results
@@ -1699,6 +1701,7 @@ async def scrape_job_details_staggered(
     num_workers: int = 2,  # REDUCED: 2 tabs (much safer for LinkedIn)
     stagger_delay: float = 5.0,  # INCREASED: 5s delay to avoid 429
     sequential: bool = True,  # DEFAULT TO SEQUENTIAL (most reliable)
+    reuse_browser: bool = False,
 ) -> List[JobDetailModel]:
     """Round-Robin Scraper with Adaptive Rate Limiting
 
@@ -1718,6 +1721,9 @@ async def scrape_job_details_staggered(
     - After 15 successes: reduces delay by 0.2s
     - On 429 error: resets to base delay
     - Jitter: ±0.3s randomization on every delay
+
+    reuse_browser=True keeps chromium running after the batch so the next
+    call skips the cold launch (call close_shared_browsers() when done).
     """
 
     scraper = RoundRobinScraper(
@@ -1727,6 +1733,7 @@ async def scrape_job_details_staggered(
         max_retries=3,
         rate_limit_backoff_base=30.0,
         sequential=sequential,  # Pass sequential flag
+        reuse_browser=reuse_browser,
     )
 
     return await scraper.scrape(urls)
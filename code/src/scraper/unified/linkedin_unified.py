@@ -126,7 +126,11 @@ async def consumer_task(
 
 
 async def scrape_linkedin_jobs_unified(
-    keyword: str, location: str, limit: int = 200, headless: bool = False
+    keyword: str,
+    location: str,
+    limit: int = 200,
+    headless: bool = False,
+    max_in_flight: int = 10,  # Detail tabs working at once (scraper caps at 10)
 ) -> List[JobDetailModel]:
     """2-Window Parallel Scraper: Producer-Consumer Pattern with Shutdown Coordination"""
     logger.info("🚀 Starting PARALLEL scraping (2 windows simultaneously)")
@@ -139,7 +143,7 @@ async def scrape_linkedin_jobs_unified(
         producer_task(keyword, location, limit, headless, producer_done)
     )
     consumer = asyncio.create_task(
-        consumer_task(keyword, limit, headless, producer_done)
+        consumer_task(keyword, limit, headless, producer_done, num_workers=max_in_flight)
     )
 
     # Wait for both to complete gracefully
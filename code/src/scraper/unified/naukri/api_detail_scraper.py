@@ -49,16 +49,17 @@ async def scrape_naukri_details_api(
     limit: int = 100,
     headless: bool = False,  # Always visible browser to avoid rate limits
     store_to_db: bool = True,
+    max_in_flight: int = 5,
 ) -> list[JobDetailModel]:
-    """Phase 2: Fetch job details via API (5 concurrent)"""
+    """Phase 2: Fetch job details via API (max_in_flight concurrent, default 5)"""
 
     # Step 1: Get unscraped URLs (deduplication)
     db_ops = JobStorageOperations()
-    url_tuples = db_ops.get_unscraped_urls(
+    url_rows = db_ops.iter_unscraped_urls(
         platform, input_role or "python_developer", limit
     )
 
-    # Convert tuples to JobUrlModel
+    # Convert rows to JobUrlModel straight off the cursor
     url_models = [
         JobUrlModel(
             url=url,
@@ -67,7 +68,7 @@ async def scrape_naukri_details_api(
             input_role=input_role or "python_developer",
             actual_role=actual,
         )
-        for url, job_id, plat, actual in url_tuples
+        for url, job_id, plat, actual in url_rows
     ]
 
     if not url_models:
@@ -81,8 +82,8 @@ async def scrape_naukri_details_api(
     client = NaukriAPIClient(cookies)
 
     try:
-        # Step 4: Fetch details concurrently (5 concurrent)
-        semaphore = asyncio.Semaphore(5)
+        # Step 4: Fetch details concurrently, never more than max_in_flight at once
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
 
         async def fetch_detail(url_model: JobUrlModel) -> JobDetailModel | None:
             async with semaphore:
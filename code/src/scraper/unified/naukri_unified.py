@@ -22,6 +22,7 @@ async def scrape_naukri_jobs_unified(
     location: str,
     limit: int = 100,
     headless: bool = False,  # Always visible browser to avoid rate limits
+    max_in_flight: int = 5,  # Concurrent detail API requests
 ) -> List[JobDetailModel]:
     """Unified API-based Naukri scraper
 
@@ -29,7 +30,7 @@ async def scrape_naukri_jobs_unified(
     1. Playwright establishes session (bypass captcha)
     2. Extract cookies for API authentication
     3. Phase 1: API URL extraction (5 concurrent pages)
-    4. Phase 2: API detail scraping (5 concurrent jobs)
+    4. Phase 2: API detail scraping (max_in_flight concurrent jobs)
     """
 
     # Phase 1: API-based URL extraction
@@ -49,6 +50,7 @@ async def scrape_naukri_jobs_unified(
         limit=limit,
         headless=headless,
         store_to_db=True,
+        max_in_flight=max_in_flight,
     )
     logger.info(f"✅ Phase 2 (API): Scraped {len(jobs)} details")
 
@@ -10,9 +10,10 @@ import streamlit as st
 
 
 class JobData(TypedDict, total=False):
-    """Type for job data dict from database"""
+    """Type for job data dict from database (shared by all analytics components)"""
     job_id: str
     platform: str
+    input_role: str | None
     actual_role: str
     url: str
     job_description: str
@@ -3,7 +3,14 @@
 
 import json
 import re
-from typing import Dict, List
+from typing import Dict, List, Set
+
+# Regex syntax that can make part of a pattern optional or alternative;
+# patterns using it get no literal prefilter and are always checked
+_NON_LITERAL_SYNTAX = re.compile(r'[|()\[\]?*{}]')
+_ESCAPE_SEQUENCE = re.compile(r'\\.')
+_LITERAL_RUN = re.compile(r'[a-z0-9]{3,}')
+
 
 class RoleNormalizer:
     """Normalizes job roles using pattern matching from reference file"""
@@ -11,7 +18,12 @@ class RoleNormalizer:
     def __init__(self, reference_file: str = "src/config/roles_reference_2025.json"):
         self.reference_file = reference_file
         self.role_patterns: Dict[str, List[re.Pattern[str]]] = {}
+        # Required literal -> categories with a pattern containing it
+        self._literal_index: Dict[str, List[str]] = {}
+        # Categories with a pattern that has no usable literal
+        self._unindexed: Set[str] = set()
         self._load_patterns()
+        self._build_literal_index()
     
     def _load_patterns(self) -> None:
         """Load and compile regex patterns from reference file"""
@@ -30,6 +42,26 @@ class RoleNormalizer:
             print(f"Warning: Could not load role reference file: {e}")
             self.role_patterns = {}
     
+    def _build_literal_index(self) -> None:
+        """
+        Index each category by one required literal per pattern, so
+        normalize_role only runs the regexes of categories that can match
+        """
+        for category, patterns in self.role_patterns.items():
+            for pattern in patterns:
+                source = pattern.pattern
+                literals = (
+                    [] if _NON_LITERAL_SYNTAX.search(source)
+                    else _LITERAL_RUN.findall(_ESCAPE_SEQUENCE.sub(' ', source.casefold()))
+                )
+                if not literals:
+                    self._unindexed.add(category)
+                    continue
+                # Longest literal is the most selective
+                categories = self._literal_index.setdefault(max(literals, key=len), [])
+                if category not in categories:
+                    categories.append(category)
+
     def normalize_role(self, raw_role: str) -> str:
         """
         Normalize a raw role to standardized category
@@ -38,8 +70,19 @@ class RoleNormalizer:
         if not raw_role or not self.role_patterns:
             return "Other"
         
-        # Try to match against each category's patterns
+        # Only categories with a literal present in the role can match
+        lowered = raw_role.casefold()
+        candidates = set(self._unindexed)
+        for literal, categories in self._literal_index.items():
+            if literal in lowered:
+                candidates.update(categories)
+        if not candidates:
+            return "Other"
+
+        # Try to match against each candidate category's patterns (in order)
         for category, patterns in self.role_patterns.items():
+            if category not in candidates:
+                continue
             for pattern in patterns:
                 if pattern.search(raw_role):
                     return category
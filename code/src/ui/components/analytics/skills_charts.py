@@ -5,26 +5,31 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from typing import TypedDict
+from typing import Sequence, cast
 
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
+from src.ui.components.analytics.overview_metrics import JobData
 from src.ui.components.analytics.role_normalizer import RoleNormalizer
 
 
-class JobData(TypedDict, total=False):
-    """Type for job data dict from database"""
-    job_id: str
-    platform: str
-    actual_role: str
-    url: str
-    job_description: str
-    skills: str | list[str]
-    company_name: str
-    posted_date: str | None
-    scraped_at: str | None
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U00002600-\U000026FF"  # misc symbols
+    "\U00002700-\U000027BF"  # dingbats
+    "]+",
+    flags=re.UNICODE
+)
 
 
 def _format_percentage(value: int | float) -> str:
@@ -34,21 +39,156 @@ def _format_percentage(value: int | float) -> str:
 
 def _clean_emoji(text: str) -> str:
     """Remove emojis and special Unicode symbols from text"""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U00002600-\U000026FF"  # misc symbols
-        "\U00002700-\U000027BF"  # dingbats
-        "]+",
-        flags=re.UNICODE
+    # ASCII-only titles (the common case) cannot contain any of these ranges
+    if text.isascii():
+        return text.strip()
+    return _EMOJI_RE.sub('', text).strip()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_role_normalizer() -> RoleNormalizer:
+    """Shared RoleNormalizer so reruns skip the JSON parse and regex compile"""
+    return RoleNormalizer()
+
+
+def _unique_values(df: pd.DataFrame, column: str) -> list[str]:
+    """Return the distinct non-empty values of a column (empty if missing)"""
+    if column not in df.columns:
+        return []
+    values = cast(pd.Series, df[column]).dropna()
+    return values[values.astype(bool)].unique().tolist()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _prep_roles(
+    job_ids: tuple[str | None, ...], _jobs_df: pd.DataFrame
+) -> tuple[list[str], list[str], pd.Series]:
+    """
+    Build role filter options and per-job normalized roles for a job set.
+    Cached on job_ids; the frame itself is not hashed.
+    """
+    normalizer: RoleNormalizer = _get_role_normalizer()
+
+    # Extract unique input_roles (what was searched) and normalized actual_roles.
+    # Normalization runs once per unique title rather than once per job.
+    input_role_list: list[str] = sorted(_unique_values(_jobs_df, 'input_role'))
+    role_map: dict[str, str] = {
+        actual_role: normalizer.normalize_role(_clean_emoji(actual_role))
+        for actual_role in _unique_values(_jobs_df, 'actual_role')
+    }
+    job_roles: list[str] = sorted(set(role_map.values()))
+    # Per-job normalized role, reused by the job-title filter
+    # (jobs without a title normalize to "Other", as normalize_role('') does).
+    # Categorical: one small int code per job, compared without string equality.
+    if 'actual_role' in _jobs_df.columns:
+        actual_roles = cast(pd.Series, _jobs_df['actual_role'])
+    else:
+        actual_roles = pd.Series(None, index=_jobs_df.index, dtype=object)
+    norm_roles = actual_roles.map(role_map.get).fillna("Other").astype('category')
+    return input_role_list, job_roles, norm_roles
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _prep_skills(skills_key: int, _skills_col: pd.Series) -> tuple[Counter[str], int]:
+    """
+    Count skills under their canonical capitalization for a skills column.
+    Returns (skill_counts, total skill tokens); cached on skills_key.
+    """
+    # Split comma-separated skill strings (list values pass through) and
+    # flatten to one row per skill in a single vectorized pass
+    split_skills: pd.Series = _skills_col.str.split(',')
+    skills_series: pd.Series = (
+        split_skills.where(split_skills.notna(), _skills_col)
+        .explode()
+        .str.strip()
     )
-    return emoji_pattern.sub('', text).strip()
+    skills_series = cast(pd.Series, skills_series[skills_series.str.len() > 0])
+
+    if skills_series.empty:
+        return Counter(), 0
+
+    # Count each variation, keeping first-seen order so ties in
+    # most_common() stay stable
+    variation_counts: pd.Series = skills_series.value_counts(sort=False)
+
+    # Canonicalize capitalization over the aggregated variations:
+    # lowercase -> most common variation (ties broken alphabetically).
+    # Each variation already carries its count, so one flat grouping pass
+    # over (lower, variation) pairs replaces per-token nested dict updates.
+    variations_by_lower: dict[str, list[tuple[str, int]]] = {}
+    for skill, count in variation_counts.items():
+        skill = str(skill)
+        variations_by_lower.setdefault(skill.lower(), []).append((skill, int(count)))
+    canonical_map: dict[str, str] = {}
+    for skill_lower, variations in variations_by_lower.items():
+        if len(variations) == 1:
+            canonical_map[skill_lower] = variations[0][0]
+            continue
+        # Of the variations with the highest count, pick alphabetically first
+        max_count: int = max(count for _, count in variations)
+        canonical_map[skill_lower] = min(
+            skill for skill, count in variations if count == max_count
+        )
+
+    # Count skills under their canonical form
+    skill_counts: Counter[str] = Counter()
+    for skill, count in variation_counts.items():
+        skill_counts[canonical_map[str(skill).lower()]] += int(count)
+    return skill_counts, len(skills_series)
+
+
+def _build_skills_df(top_skills: Sequence[tuple[str, int]], total_jobs: int) -> pd.DataFrame:
+    """Build the Skill/Count/Percentage table for the top skills"""
+    # Calculate percentages: (skill_count / total_jobs) * 100
+    skills_data: list[dict[str, str | int | float]] = []
+    for skill, count in top_skills:
+        percentage: float = (count / total_jobs) * 100
+        skills_data.append({
+            'Skill': skill,
+            'Count': count,
+            'Percentage': round(percentage, 1)
+        })
+    return pd.DataFrame(skills_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_skills_fig(
+    top_skills: tuple[tuple[str, int], ...], num_skills: int, total_jobs: int
+) -> go.Figure:
+    """Build the top-skills bar chart (last few slider/filter combinations cached)"""
+    skills_df: pd.DataFrame = _build_skills_df(top_skills, total_jobs)
+
+    # Sort by Count descending for chart (most populated at top)
+    chart_df: pd.DataFrame = skills_df.sort_values('Count', ascending=True)
+
+    # Create horizontal bar chart with gradient colors using Plotly.
+    # Percentage rides along as custom_data with a fixed hovertemplate
+    # instead of hover_data, keeping the emitted figure JSON minimal.
+    fig = px.bar(
+        chart_df,
+        x='Count',
+        y='Skill',
+        orientation='h',
+        color='Count',
+        color_continuous_scale='Viridis',
+        custom_data=['Percentage']
+    )
+    fig.update_traces(hovertemplate="%{y}: %{x} jobs (%{customdata[0]}%)<extra></extra>")
+
+    # Update layout for better appearance
+    # Height scales with number of skills (25px per bar, min 400px)
+    chart_height: int = max(400, num_skills * 25)
+    fig.update_layout(
+        height=chart_height,
+        showlegend=False,
+        coloraxis_showscale=True,
+        coloraxis_colorbar={"title": "Count"},
+        yaxis={"tickfont": {"size": 11}},
+        xaxis={"title": "Job Count"},
+        margin={"l": 10, "r": 10, "t": 10, "b": 10}
+    )
+    return fig
+
 
 def render_skills_analysis(all_jobs: list[JobData]) -> None:
     """Render skills analysis charts and metrics with job role filtering"""
@@ -56,26 +196,11 @@ def render_skills_analysis(all_jobs: list[JobData]) -> None:
         st.info("No data available yet. Please scrape some jobs first!")
         return
 
-    # Initialize role normalizer
-    normalizer = RoleNormalizer()
-
-    # Extract unique input_roles (what was searched) and normalized actual_roles
-    input_roles: set[str] = set()
-    normalized_roles: set[str] = set()
-    for job in all_jobs:
-        # Input role (original search term)
-        input_role: str | None = job.get('input_role')
-        if input_role:
-            input_roles.add(input_role)
-        # Actual role (normalized from LinkedIn/Naukri title)
-        actual_role: str | None = job.get('actual_role')
-        if actual_role:
-            cleaned: str = _clean_emoji(actual_role)
-            normalized: str = normalizer.normalize_role(cleaned)
-            normalized_roles.add(normalized)
-
-    input_role_list: list[str] = sorted(input_roles)
-    job_roles: list[str] = sorted(normalized_roles)
+    jobs_df: pd.DataFrame = pd.DataFrame(all_jobs)
+    # Role prep is keyed by the job IDs, so reruns over the same job set
+    # (e.g. flipping an unrelated widget) skip normalization entirely
+    job_ids: tuple[str | None, ...] = tuple(job.get('job_id') for job in all_jobs)
+    input_role_list, job_roles, norm_roles = _prep_roles(job_ids, jobs_df)
 
     # Filter controls in two columns
     st.markdown("### Filter by Job Role")
@@ -103,27 +228,24 @@ def render_skills_analysis(all_jobs: list[JobData]) -> None:
                 help="Filter by normalized job title from LinkedIn/Naukri"
             )
 
-    # Filter jobs based on selected role
-    filtered_jobs: list[JobData]
+    # Filter jobs based on selected role (boolean mask over the columns)
+    filtered_df: pd.DataFrame
     role_display: str
     if selected_role and selected_role != "All Roles":
         if filter_type == "Search Term (Input Role)":
-            filtered_jobs = [
-                job for job in all_jobs
-                if job.get('input_role') == selected_role
-            ]
+            filtered_df = cast(pd.DataFrame, jobs_df[jobs_df['input_role'] == selected_role])
             role_display = f" for '{selected_role}' searches"
         else:
-            filtered_jobs = [
-                job for job in all_jobs
-                if normalizer.normalize_role(_clean_emoji(job.get('actual_role') or '')) == selected_role
-            ]
+            filtered_df = cast(pd.DataFrame, jobs_df[(norm_roles == selected_role).to_numpy()])
             role_display = f" for {selected_role}"
     else:
-        filtered_jobs = list(all_jobs)
+        filtered_df = jobs_df
         role_display = " (All Roles)"
 
-    if not filtered_jobs:
+    # Calculate total jobs from filtered set
+    total_jobs: int = len(filtered_df)
+
+    if not total_jobs:
         st.warning(f"No jobs found for role: {selected_role}")
         return
 
@@ -131,64 +253,28 @@ def render_skills_analysis(all_jobs: list[JobData]) -> None:
     if selected_role and selected_role != "All Roles":
         st.metric(
             label=f"{selected_role}",
-            value=f"{len(filtered_jobs):,} Jobs",
+            value=f"{total_jobs:,} Jobs",
             help=f"Total jobs matching {selected_role}"
         )
     else:
         st.metric(
             label="All Roles",
-            value=f"{len(filtered_jobs):,} Jobs",
+            value=f"{total_jobs:,} Jobs",
             help="Total jobs across all roles"
         )
 
-    # Flatten all skills from filtered jobs
-    all_skills: list[str] = []
-    for job in filtered_jobs:
-        skills_val: str | list[str] | None = job.get('skills')
-        if skills_val:
-            # Parse comma-separated skills string into list
-            if isinstance(skills_val, str):
-                skills_list: list[str] = [s.strip() for s in skills_val.split(',') if s.strip()]
-                all_skills.extend(skills_list)
-            else:
-                all_skills.extend(skills_val)
-
-    # Step 1: Build canonical mapping (lowercase -> most common capitalization)
-    skill_variations: dict[str, dict[str, int]] = {}
-    for skill in all_skills:
-        skill_clean: str = skill.strip()
-        if skill_clean:
-            skill_lower: str = skill_clean.lower()
-            if skill_lower not in skill_variations:
-                skill_variations[skill_lower] = {skill_clean: 1}
-            else:
-                if skill_clean in skill_variations[skill_lower]:
-                    skill_variations[skill_lower][skill_clean] += 1
-                else:
-                    skill_variations[skill_lower][skill_clean] = 1
-
-    # Step 2: Pick most common capitalization for each skill
-    canonical_map: dict[str, str] = {}
-    for skill_lower, variations in skill_variations.items():
-        # Get the variation with highest count
-        max_count: int = max(variations.values())
-        # Get all variations with max count, pick alphabetically first
-        top_variations: list[str] = [k for k, v in variations.items() if v == max_count]
-        sorted_variations: list[str] = sorted(top_variations)
-        canonical_form: str = sorted_variations[0]
-        canonical_map[skill_lower] = canonical_form
-
-    # Step 3: Normalize all skills using canonical map
-    all_skills = [canonical_map[s.strip().lower()] for s in all_skills if s.strip()]
-
-    if not all_skills:
+    # Skill prep is cached on a content fingerprint of the filtered skills
+    # column, so only the widgets below rerun when the filter is unchanged
+    skills_col = cast(pd.Series, filtered_df['skills']).astype(object)
+    skills_key: int = int(
+        pd.util.hash_pandas_object(skills_col.astype(str), index=False).sum()
+    )
+    skill_counts, total_skill_tokens = _prep_skills(skills_key, skills_col)
+
+    if not skill_counts:
         st.warning("No skills data available for analysis")
         return
 
-    # Calculate total jobs from filtered set
-    total_jobs: int = len(filtered_jobs)
-    skill_counts: Counter[str] = Counter(all_skills)
-
     # Slider for number of skills to display (default: 30, optimal for readability)
     num_skills: int = st.slider(
         "Number of skills to display",
@@ -205,44 +291,8 @@ def render_skills_analysis(all_jobs: list[JobData]) -> None:
     top_skills: list[tuple[str, int]] = skill_counts.most_common(num_skills)
 
     if top_skills:
-        # Calculate percentages: (skill_count / total_jobs) * 100
-        skills_data: list[dict[str, str | int | float]] = []
-        for skill, count in top_skills:
-            percentage: float = (count / total_jobs) * 100
-            skills_data.append({
-                'Skill': skill,
-                'Count': count,
-                'Percentage': round(percentage, 1)
-            })
-
-        skills_df: pd.DataFrame = pd.DataFrame(skills_data)
-
-        # Sort by Count descending for chart (most populated at top)
-        chart_df: pd.DataFrame = skills_df.sort_values('Count', ascending=True)
-
-        # Create horizontal bar chart with gradient colors using Plotly
-        fig = px.bar(
-            chart_df,
-            x='Count',
-            y='Skill',
-            orientation='h',
-            color='Count',
-            color_continuous_scale='Viridis',
-            hover_data={'Percentage': True, 'Count': True}
-        )
-
-        # Update layout for better appearance
-        # Height scales with number of skills (25px per bar, min 400px)
-        chart_height: int = max(400, num_skills * 25)
-        fig.update_layout(
-            height=chart_height,
-            showlegend=False,
-            coloraxis_showscale=True,
-            coloraxis_colorbar={"title": "Count"},
-            yaxis={"tickfont": {"size": 11}},
-            xaxis={"title": "Job Count"},
-            margin={"l": 10, "r": 10, "t": 10, "b": 10}
-        )
+        skills_df: pd.DataFrame = _build_skills_df(top_skills, total_jobs)
+        fig: go.Figure = _build_skills_fig(tuple(top_skills), num_skills, total_jobs)
 
         col1, col2 = st.columns([2, 1])
         with col1:
@@ -259,7 +309,7 @@ def render_skills_analysis(all_jobs: list[JobData]) -> None:
 
     # Skills distribution metrics
     total_unique_skills: int = len(skill_counts)
-    avg_skills_per_job: float = len(all_skills) / total_jobs if total_jobs > 0 else 0.0
+    avg_skills_per_job: float = total_skill_tokens / total_jobs if total_jobs > 0 else 0.0
 
     col1, col2 = st.columns(2)
     with col1:
@@ -2,19 +2,40 @@
 # Real-time progress updates | Round-robin tabs | Rate limiting
 from __future__ import annotations
 
-import json
 import logging
 import os
+import queue
+import selectors
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Generator, TypedDict
+from typing import IO, Callable, Generator, Literal, NoReturn, cast
 
+import orjson
 import psutil
 import streamlit as st
-from src.db import JobStorageOperations
+from streamlit.errors import StreamlitAPIException
+from src.ui.components.process_containment import ProcessContainment
+from src.ui.components.progress_parser import (
+    ProgressEvent,
+    ScraperResult,
+    parse_progress_line,
+    parse_result_line,
+)
 from src.ui.components.slot_monitor import SlotMonitor
+from src.ui.components.storage_handle import count_unscraped, get_db_ops
+from src.utils.progress_channel import (
+    FRAME_HEADER,
+    KIND_PROGRESS,
+    KIND_RESULT,
+    PROGRESS_FD_ENV,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,11 +80,24 @@ os.environ["TMP"] = TEMP_DIR
 os.environ["TEMP"] = TEMP_DIR
 os.environ["PLAYWRIGHT_BROWSERS_PATH"] = playwright_browsers_path
 
+# Worker environment is invariant - build it once instead of copying per spawn
+_CHILD_ENV: dict[str, str] = {
+    **os.environ,
+    "TMPDIR": TEMP_DIR,
+    "TMP": TEMP_DIR,
+    "TEMP": TEMP_DIR,
+    "PLAYWRIGHT_BROWSERS_PATH": playwright_browsers_path,
+    "PYTHONUNBUFFERED": "1",  # Force unbuffered output
+}
 
 def _init_scraper_session_state() -> None:
     """Initialize session state for scraper control"""
     if "scraper_process" not in st.session_state:
         st.session_state.scraper_process = None
+    if "scraper_containment" not in st.session_state:
+        st.session_state.scraper_containment = None
+    if "scraper_worker" not in st.session_state:
+        st.session_state.scraper_worker = None
     if "scraper_running" not in st.session_state:
         st.session_state.scraper_running = False
     if "scraper_stopped" not in st.session_state:
@@ -75,6 +109,74 @@ def _init_scraper_session_state() -> None:
         st.session_state.scrape_params = None
 
 
+def _process_group_kwargs() -> dict[str, object]:
+    """Popen kwargs that put the scraper (and its browser) in its own process group"""
+    if IS_WINDOWS:
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _kill_process_group(process: subprocess.Popen[bytes]) -> None:
+    """POSIX: SIGTERM the whole group at once, SIGKILL whatever survives"""
+    try:
+        pgid = os.getpgid(process.pid)
+    except ProcessLookupError:
+        logger.info(f"Process {process.pid} already terminated")
+        return
+
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+        process.wait(timeout=2)
+    except ProcessLookupError:
+        return
+    except subprocess.TimeoutExpired:
+        pass
+
+    # Browser helpers may outlive the leader - always sweep the group
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+        logger.info(f"Killed scraper process group {pgid}")
+    except ProcessLookupError:
+        pass
+
+
+def _kill_process_tree(process: subprocess.Popen[bytes]) -> None:
+    """Windows: CTRL_BREAK the process group, then terminate remaining children in parallel"""
+    pid = process.pid
+    try:
+        parent = psutil.Process(pid)
+        # Collect children before signalling, they re-parent once the leader dies
+        children = parent.children(recursive=True)
+    except psutil.NoSuchProcess:
+        logger.info(f"Process {pid} already terminated")
+        return
+
+    try:
+        process.send_signal(signal.CTRL_BREAK_EVENT)  # type: ignore[attr-defined]
+        process.wait(timeout=2)
+    except Exception:
+        pass
+
+    # Fire terminate at every process, wait on them together, kill the stragglers
+    procs = [*children, parent]
+    for proc in procs:
+        try:
+            proc.terminate()
+        except psutil.NoSuchProcess:
+            pass  # Already terminated
+        except Exception as e:
+            logger.warning(f"Failed to terminate process {proc.pid}: {e}")
+
+    _, alive = psutil.wait_procs(procs, timeout=1)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to kill process {proc.pid}: {e}")
+
+
 def stop_scraper() -> bool:
     """Stop the scraper process and all child processes (browser)
 
@@ -84,39 +186,25 @@ def stop_scraper() -> bool:
     if process is None:
         return False
 
+    worker: _ScraperWorker | None = st.session_state.get("scraper_worker")
     try:
-        pid = process.pid
-        logger.info(f"Stopping scraper process {pid} and all children...")
-
-        try:
-            parent = psutil.Process(pid)
-            # Get all child processes first (browser processes, etc.)
-            children = parent.children(recursive=True)
-
-            # Kill children first (browser processes)
-            for child in children:
-                try:
-                    logger.info(f"Killing child process {child.pid}: {child.name()}")
-                    child.kill()
-                except psutil.NoSuchProcess:
-                    pass  # Already terminated
-                except Exception as e:
-                    logger.warning(f"Failed to kill child {child.pid}: {e}")
-
-            # Now kill the main process
-            try:
-                parent.kill()
-                logger.info(f"Killed main scraper process {pid}")
-            except psutil.NoSuchProcess:
-                pass  # Already terminated
+        logger.info(f"Stopping scraper process {process.pid} and all children...")
+        # Wake the UI loop first so it stops waiting on output right away
+        if worker is not None:
+            worker.wake()
 
-        except psutil.NoSuchProcess:
-            # Process already terminated
-            logger.info(f"Process {pid} already terminated")
+        containment: ProcessContainment | None = st.session_state.get(
+            "scraper_containment"
+        )
+        if containment is not None and containment.kill():
+            pass  # Job Object / cgroup took the whole tree down in one call
+        elif IS_WINDOWS:
+            _kill_process_tree(process)
+        else:
+            _kill_process_group(process)
 
-        # Also try subprocess terminate as backup
+        # Reap the leader so it does not linger as a zombie
         try:
-            process.terminate()
             process.wait(timeout=2)
         except Exception:
             try:
@@ -127,52 +215,282 @@ def stop_scraper() -> bool:
     except Exception as e:
         logger.error(f"Error stopping scraper: {e}")
     finally:
+        if worker is not None:
+            worker.release()  # No-op after a successful container kill
         st.session_state.scraper_process = None
+        st.session_state.scraper_containment = None
+        st.session_state.scraper_worker = None
         st.session_state.scraper_running = False
         st.session_state.scraper_stopped = True
 
     return True
 
 
-class ScraperResult(TypedDict):
-    jobs_scraped: int
-    expired_removed: int
-    failed: int
-    error: str | None
+_ReaderItem = (
+    tuple[Literal["progress"], ProgressEvent]
+    | tuple[Literal["final"], ScraperResult]
+    | tuple[Literal["stop"], None]
+    | tuple[Literal["eof"], None]
+)
+
+
+_PROGRESS_PREFIX = b"PROGRESS:"
+_UI_REFRESH_SECONDS = 0.1  # Min gap between progress repaints (<= 10 Hz)
+_RECENT_JOBS_SHOWN = 20
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _handle_output_line(line: memoryview, output_queue: queue.Queue[_ReaderItem]) -> None:
+    """Route one raw output line: progress event, final result, or log noise"""
+    # Check for progress events (payload sliced without copying)
+    if line[: len(_PROGRESS_PREFIX)] == _PROGRESS_PREFIX:
+        event = parse_progress_line(line[len(_PROGRESS_PREFIX) :])
+        if event is not None:
+            output_queue.put(("progress", event))
+        return
+
+    # Check for final result
+    text = bytes(line).strip()
+    if text.startswith(b"{"):
+        result = parse_result_line(text)
+        if result is not None:
+            output_queue.put(("final", result))
+
+
+def _drain_lines(buffer: bytearray, output_queue: queue.Queue[_ReaderItem]) -> None:
+    """Handle every complete line in buffer, keeping only the trailing partial line"""
+    start = 0
+    with memoryview(buffer) as view:
+        while (end := buffer.find(b"\n", start)) != -1:
+            _handle_output_line(view[start:end], output_queue)
+            start = end + 1
+    del buffer[:start]
+
+
+def _drain_frames(buffer: bytearray, output_queue: queue.Queue[_ReaderItem]) -> None:
+    """Handle every complete length-prefixed frame in buffer, keeping any partial one"""
+    start = 0
+    header_size = FRAME_HEADER.size
+    with memoryview(buffer) as view:
+        while len(buffer) - start >= header_size:
+            length, kind = FRAME_HEADER.unpack_from(buffer, start)
+            end = start + header_size + length
+            if len(buffer) < end:
+                break
+            # Release each slice before the buffer is resized below
+            with view[start + header_size : end] as payload:
+                if kind == KIND_PROGRESS:
+                    event = parse_progress_line(payload)
+                    if event is not None:
+                        output_queue.put(("progress", event))
+                elif kind == KIND_RESULT:
+                    result = parse_result_line(bytes(payload))
+                    if result is not None:
+                        output_queue.put(("final", result))
+            start = end
+    del buffer[:start]
+
+
+def _read_available(fd: int) -> bytes | None:
+    """Up to _READ_CHUNK_SIZE bytes already in the pipe, b"" on EOF, None if empty"""
+    try:
+        return os.read(fd, _READ_CHUNK_SIZE)
+    except BlockingIOError:
+        return None
+
+
+def _read_scraper_output(
+    stdout: IO[bytes],
+    output_queue: queue.Queue[_ReaderItem],
+    wake_fd: int | None = None,
+    frame_fd: int | None = None,
+) -> None:
+    """Reader thread: turn raw subprocess output into events for the UI thread
+
+    POSIX: events arrive as length-prefixed frames on frame_fd (stdout only carries
+    logs), and a wake_fd self-pipe lets STOP be noticed immediately. Elsewhere,
+    PROGRESS: lines are framed out of stdout.
+    """
+    line_buffer = bytearray()
+    frame_buffer = bytearray()
+    stdout_fd = stdout.fileno()
+    stdout_open = True
+    frame_open = frame_fd is not None
+    selector: selectors.BaseSelector | None = None
+    if wake_fd is not None or frame_fd is not None:
+        # Non-blocking fds: a spurious wakeup can never stall the thread in read()
+        for fd in (stdout_fd, frame_fd):
+            if fd is not None:
+                os.set_blocking(fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(stdout_fd, selectors.EVENT_READ)
+        if wake_fd is not None:
+            selector.register(wake_fd, selectors.EVENT_READ)
+        if frame_fd is not None:
+            selector.register(frame_fd, selectors.EVENT_READ)
 
+    try:
+        # Keep going until both streams hit EOF so no trailing frame is lost
+        while stdout_open or frame_open:
+            ready = (
+                {key.fd for key, _ in selector.select()}
+                if selector is not None
+                else {stdout_fd}
+            )
 
-class ProgressEvent(TypedDict, total=False):
-    """Progress event from scraper subprocess"""
+            if wake_fd is not None and wake_fd in ready and selector is not None:
+                # One-shot: STOP always ends this worker
+                selector.unregister(wake_fd)
+                output_queue.put(("stop", None))
 
-    event: str
+            if frame_open and frame_fd in ready and frame_fd is not None:
+                chunk = _read_available(frame_fd)
+                if chunk is None:
+                    pass
+                elif chunk:
+                    frame_buffer += chunk
+                    _drain_frames(frame_buffer, output_queue)
+                else:
+                    frame_open = False
+                    if selector is not None:
+                        selector.unregister(frame_fd)
+
+            if stdout_open and stdout_fd in ready:
+                # Raw fd read: whatever the pipe holds, one syscall, no wrapper scan
+                chunk = _read_available(stdout_fd)
+                if chunk is None:
+                    pass
+                elif chunk:
+                    line_buffer += chunk
+                    _drain_lines(line_buffer, output_queue)
+                else:
+                    stdout_open = False
+                    if selector is not None:
+                        selector.unregister(stdout_fd)
+
+        if line_buffer:
+            with memoryview(line_buffer) as view:
+                _handle_output_line(view, output_queue)
+    except (OSError, ValueError) as e:
+        # Pipe closed underneath us (e.g. process killed by STOP)
+        logger.debug(f"Scraper output reader stopped: {e}")
+    finally:
+        if selector is not None:
+            selector.close()
+        for fd in (wake_fd, frame_fd):
+            if fd is not None:
+                os.close(fd)
+        output_queue.put(("eof", None))
+
+
+@dataclass
+class _ScraperWorker:
+    """Long-lived scraper subprocess shared by consecutive batches of one session"""
+
+    process: subprocess.Popen[bytes]
+    containment: ProcessContainment
+    output_queue: queue.Queue[_ReaderItem]
+    batch_id: int = 0
+    wake_fd: int | None = None  # Write end of the STOP self-pipe (POSIX only)
+
+    def wake(self) -> None:
+        """Tell the reader thread STOP was pressed, ahead of the kill itself"""
+        if self.wake_fd is None:
+            return
+        try:
+            os.write(self.wake_fd, b"x")
+            os.close(self.wake_fd)
+        except OSError:
+            pass
+        self.wake_fd = None
+
+    def release(self) -> None:
+        """Free an exited worker's STOP pipe and container (cgroup dir / Job Object)"""
+        if self.wake_fd is not None:
+            try:
+                os.close(self.wake_fd)
+            except OSError:
+                pass
+            self.wake_fd = None
+        # Kill whatever helpers outlived the worker so the cgroup can be removed
+        if not self.containment.kill():
+            self.containment.close()
+
+
+def _forget_scraper_worker(worker: _ScraperWorker) -> None:
+    """Release an exited worker and drop it from the session"""
+    worker.release()
+    if st.session_state.get("scraper_worker") is worker:
+        st.session_state.scraper_worker = None
+        st.session_state.scraper_containment = None
+        st.session_state.scraper_process = None
 
-    event: str
-    timestamp: float
-    # scraper_start event
-    total_jobs: int
-    num_slots: int
-    # job_dispatch event
-    slot_id: int
-    job_index: int
-    # job_complete event
-    status: str
-    stats: dict[str, int]
-    current_delay: float
-    delay_changed: bool
-    company: str
-    title: str
-    skills_count: int
-    job_id: str
-    error: str
-    # rate_limit event
-    wait_seconds: float
-    # cookie_expired / deadlock_warning event
-    message: str
-    # scraper_finish event
-    success: int
-    expired: int
-    failed: int
-    total_processed: int
+
+def _get_scraper_worker() -> _ScraperWorker:
+    """Reuse this session's warm worker, spawning one if none is alive"""
+    worker: _ScraperWorker | None = st.session_state.get("scraper_worker")
+    if worker is not None:
+        if worker.process.poll() is None:
+            return worker
+        _forget_scraper_worker(worker)  # Exited or crashed since the last batch
+
+    # POSIX: progress events get their own pipe (length-prefixed frames) and STOP
+    # gets a self-pipe to wake the reader. Windows pipes can't be selected, so there
+    # events stay PROGRESS: lines on stdout.
+    wake_read, wake_write = (None, None) if IS_WINDOWS else os.pipe()
+    frame_read, frame_write = (None, None) if IS_WINDOWS else os.pipe()
+    env = (
+        _CHILD_ENV
+        if frame_write is None
+        else {**_CHILD_ENV, PROGRESS_FD_ENV: str(frame_write)}
+    )
+
+    # Use Popen for streaming
+    # CRITICAL FIX: Redirect stderr to stdout to prevent pipe deadlock!
+    # Without this, if stderr buffer fills up (64KB), subprocess blocks
+    # waiting to write, while main process blocks waiting to read stdout.
+    try:
+        process = subprocess.Popen(
+            # Stable module entrypoint: compiled once to .pyc, no code built from user input
+            [VENV_PYTHON, "-u", "-m", "src.scraper.unified.linkedin.detail_worker", "--serve"],
+            stdin=subprocess.PIPE,  # Batch commands; closing it (session gone) ends the worker
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # MERGE stderr into stdout to prevent deadlock
+            cwd=PROJECT_ROOT,
+            env=env,
+            bufsize=0,  # Unbuffered: the reader thread os.read()s the raw fd
+            pass_fds=() if frame_write is None else (frame_write,),
+            **_process_group_kwargs(),  # type: ignore[arg-type]
+        )
+    finally:
+        # Only the child writes frames - our copy must close so EOF can arrive
+        if frame_write is not None:
+            os.close(frame_write)
+    if process.stdout is None:
+        raise RuntimeError("Process stdout is not available")
+
+    # Drain the pipes on a background thread so a slow UI never blocks the child
+    output_queue: queue.Queue[_ReaderItem] = queue.Queue()
+    threading.Thread(
+        target=_read_scraper_output,
+        args=(process.stdout, output_queue, wake_read, frame_read),
+        name="scraper-stdout-reader",
+        daemon=True,
+    ).start()
+
+    # Kernel-enforced container so STOP (or a crash) can't leak chromium helpers
+    worker = _ScraperWorker(
+        process, ProcessContainment(process), output_queue, wake_fd=wake_write
+    )
+    st.session_state.scraper_worker = worker
+    return worker
+
+
+def _send_worker_command(worker: _ScraperWorker, command: dict[str, object]) -> None:
+    if worker.process.stdin is None:
+        raise RuntimeError("Process stdin is not available")
+    worker.process.stdin.write(orjson.dumps(command) + b"\n")
+    worker.process.stdin.flush()
 
 
 def stream_scraper_progress(
@@ -182,250 +500,462 @@ def stream_scraper_progress(
     concurrent_tabs: int,
     delay_seconds: float = 3.0,
     sequential: bool = True,  # Default to sequential mode (most reliable)
-) -> Generator[ProgressEvent, None, ScraperResult]:
-    """Stream real-time progress from scraper subprocess
+) -> Generator[ProgressEvent, None, None]:
+    """Stream real-time progress from the scraper worker
 
-    Yields progress events as they happen, returns final result
+    Yields progress events as they happen; the last one is a "final_result"
+    event carrying the ScraperResult fields
     """
-    escaped_project_root = PROJECT_ROOT.replace("\\", "\\\\")
-    escaped_playwright_path = playwright_browsers_path.replace("\\", "\\\\")
+    final_result = ScraperResult(
+        jobs_scraped=0, expired_removed=0, failed=0, error=None
+    )
+    worker: _ScraperWorker | None = None
+    finished = False
 
-    script = f'''
-import os
-import sys
-import json
-import tempfile
+    try:
+        worker = _get_scraper_worker()
+        worker.batch_id += 1
+        batch_id = worker.batch_id
+
+        # Store process in session state for stop button functionality
+        st.session_state.scraper_process = worker.process
+        st.session_state.scraper_containment = worker.containment
+        st.session_state.scraper_running = True
+        st.session_state.scraper_stopped = False
 
-# Cross-platform temp directory
-TEMP_DIR = tempfile.gettempdir()
-os.environ["TMPDIR"] = TEMP_DIR
-os.environ["TMP"] = TEMP_DIR
-os.environ["TEMP"] = TEMP_DIR
+        _send_worker_command(
+            worker,
+            {
+                "cmd": "scrape",
+                "batch_id": batch_id,
+                "platform": platform.lower(),
+                "job_role": job_role,
+                "batch_size": batch_size,
+                "concurrent_tabs": concurrent_tabs,
+                "delay_seconds": delay_seconds,
+                "sequential": sequential,
+            },
+        )
 
-# Set Playwright browsers path for Windows
-os.environ["PLAYWRIGHT_BROWSERS_PATH"] = r"{escaped_playwright_path}"
+        # Output left over from an earlier, abandoned batch precedes our batch_start
+        started = False
+        while True:
+            try:
+                item = worker.output_queue.get(timeout=0.1)
+            except queue.Empty:
+                if st.session_state.get("scraper_stopped"):
+                    break
+                continue
 
-# Add project root to path
-sys.path.insert(0, r"{escaped_project_root}")
+            if item[0] == "stop":
+                finished = True  # Worker is being killed, nothing left to abort
+                break
+            if item[0] == "eof":
+                finished = True
+                returncode = worker.process.wait()
+                if returncode != 0 and not final_result.get("error"):
+                    final_result["error"] = f"Scraper worker exited with code {returncode}"
+                _forget_scraper_worker(worker)
+                break
+            if not started:
+                started = (
+                    item[0] == "progress"
+                    and item[1].get("event") == "batch_start"
+                    and item[1].get("batch_id") == batch_id
+                )
+                continue
+
+            if item[0] == "progress":
+                yield item[1]
+            else:  # final
+                final_result = item[1]
+                finished = True
+                break
+
+    except Exception as e:
+        final_result["error"] = str(e)
+    finally:
+        # Interrupted mid-batch (rerun/navigation): abort the batch, keep the worker warm
+        if worker is not None and not finished and worker.process.poll() is None:
+            try:
+                _send_worker_command(worker, {"cmd": "abort"})
+            except (OSError, ValueError):
+                pass
+        st.session_state.scraper_running = False
+
+    yield cast(ProgressEvent, {"event": "final_result", **final_result})
 
-import asyncio
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 
-from src.db.operations import JobStorageOperations
-from src.scraper.unified.linkedin.staggered_queue_scraper import scrape_job_details_staggered
+@st.cache_data(ttl=5, show_spinner=False)
+def _count_jobs(db_path: str) -> int:
+    return get_db_ops(db_path).count_jobs()
 
-async def scrape():
-    result = {{"jobs_scraped": 0, "expired_removed": 0, "failed": 0, "error": None}}
 
+def _rerun_controls() -> NoReturn:
+    """Rerun only the controls fragment (whole app if this isn't a fragment run)"""
     try:
-        db_ops = JobStorageOperations("data/jobs.db")
-        urls = db_ops.get_unscraped_urls("{platform.lower()}", "{job_role}", limit={batch_size})
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+def _format_job_line(event: ProgressEvent) -> str | None:
+    """One markdown line for a finished job, None for statuses not listed"""
+    status_val = event.get("status", "unknown")
+    if status_val == "success":
+        company_val: str = event.get("company", "")
+        title_val: str = event.get("title", "")
+        skills_count_val: int = event.get("skills_count", 0)
+        return f"✅ **{title_val[:40]}** @ {company_val[:30]} ({skills_count_val} skills)"
+    if status_val == "expired":
+        # Could be expired OR non-English content
+        error_msg: str = event.get("error", "")
+        if "Non-English" in error_msg or "CJK" in error_msg:
+            return f"⏭️ Skipped: {error_msg[:40]}"
+        job_id_val: str = event.get("job_id", "")
+        return f"🗑️ Job {job_id_val[:20]}... expired/removed"
+    if status_val == "error":
+        error_msg_val: str = event.get("error") or "Unknown"
+        return f"❌ Error: {error_msg_val[:50]}"
+    return None
+
+
+@dataclass
+class _LiveRun:
+    """Widgets and counters of one running batch, shared by the event handlers"""
+
+    progress_bar: st.delta_generator.DeltaGenerator
+    status_container: st.delta_generator.DeltaGenerator
+    metrics: list[st.delta_generator.DeltaGenerator]  # success..delay placeholders
+    latest_job_container: st.delta_generator.DeltaGenerator
+    slot_monitor: SlotMonitor
+    total_jobs: int
+    num_slots: int
+    current_delay: float
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"success": 0, "expired": 0, "failed": 0, "processed": 0}
+    )
+    # Streamlit round-trips every element update to the browser, so fast
+    # job_complete bursts are coalesced into one repaint per interval
+    last_render: float = 0.0
+    # Ring buffer of formatted job outcomes, painted as one block per flush
+    recent_jobs: deque[str] = field(
+        default_factory=lambda: deque(maxlen=_RECENT_JOBS_SHOWN)
+    )
+    jobs_dirty: bool = False
+    finished: bool = False
 
-        if not urls:
-            print(json.dumps(result), flush=True)
+    def update_metrics(self) -> None:
+        success_metric, expired_metric, failed_metric, processed_metric, delay_metric = (
+            self.metrics
+        )
+        success_metric.metric("✅ Success", self.stats["success"])
+        expired_metric.metric("🗑️ Expired", self.stats["expired"])
+        failed_metric.metric("❌ Failed", self.stats["failed"])
+        processed_metric.metric(
+            "📊 Processed", f"{self.stats['processed']}/{self.total_jobs}"
+        )
+        delay_metric.metric("⚡ Delay", f"{self.current_delay:.2f}s")
+
+    def ui_due(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if not force and now - self.last_render < _UI_REFRESH_SECONDS:
+            return False
+        self.last_render = now
+        return True
+
+    def add_job(self, event: ProgressEvent) -> None:
+        line = _format_job_line(event)
+        if line is not None:
+            self.recent_jobs.appendleft(line)  # Newest first
+            self.jobs_dirty = True
+
+    def show_recent_jobs(self) -> None:
+        if not self.jobs_dirty:
             return
+        self.jobs_dirty = False
+        self.latest_job_container.markdown("  \n".join(self.recent_jobs))
 
-        # Round-robin scraper with real-time progress
-        jobs = await scrape_job_details_staggered(
-            urls=urls,
-            headless=False,
-            num_workers={concurrent_tabs},
-            stagger_delay={delay_seconds},
-            sequential={sequential}
+    def flush_ui(self, force: bool = False) -> None:
+        if not self.ui_due(force):
+            return
+        progress = (
+            self.stats["processed"] / self.total_jobs if self.total_jobs > 0 else 0
+        )
+        self.progress_bar.progress(
+            min(progress, 1.0),
+            text=f"Processed {self.stats['processed']}/{self.total_jobs}",
         )
+        self.update_metrics()
+        self.show_recent_jobs()
 
-        result["jobs_scraped"] = len(jobs)
 
-    except Exception as e:
-        result["error"] = str(e)
+def _on_scraper_start(event: ProgressEvent, run: _LiveRun) -> None:
+    run.total_jobs = event.get("total_jobs", run.total_jobs)
+    num_slots_val: int = event.get("num_slots", run.num_slots)
+    with run.status_container:
+        st.info(f"Started scraping {run.total_jobs} jobs with {num_slots_val} slots")
+        st.caption(
+            "Content-based filtering: Non-English content will be skipped automatically"
+        )
 
-    print(json.dumps(result), flush=True)
 
-asyncio.run(scrape())
-'''
+def _on_job_dispatch(event: ProgressEvent, run: _LiveRun) -> None:
+    if not run.ui_due():
+        return
+    slot_id_val: int = event.get("slot_id", 0)
+    job_index_val: int = event.get("job_index", 0)
+    progress = job_index_val / run.total_jobs if run.total_jobs > 0 else 0.0
+    run.progress_bar.progress(
+        progress,
+        text=f"Dispatching Job {job_index_val}/{run.total_jobs} -> Slot {slot_id_val}",
+    )
 
-    env = os.environ.copy()
-    env["TMPDIR"] = TEMP_DIR
-    env["TMP"] = TEMP_DIR
-    env["TEMP"] = TEMP_DIR
-    env["PLAYWRIGHT_BROWSERS_PATH"] = playwright_browsers_path
-    env["PYTHONUNBUFFERED"] = "1"  # Force unbuffered output
 
-    # Use Popen for streaming
-    # CRITICAL FIX: Redirect stderr to stdout to prevent pipe deadlock!
-    # Without this, if stderr buffer fills up (64KB), subprocess blocks
-    # waiting to write, while main process blocks waiting to read stdout.
-    process = subprocess.Popen(
-        [VENV_PYTHON, "-u", "-c", script],  # Use venv Python for all platforms
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,  # MERGE stderr into stdout to prevent deadlock
-        text=True,
-        cwd=PROJECT_ROOT,
-        env=env,
-        bufsize=1,  # Line buffered
-    )
+def _on_job_complete(event: ProgressEvent, run: _LiveRun) -> None:
+    # Update stats from event
+    event_stats = event.get("stats")
+    if event_stats is not None:
+        run.stats.update(event_stats)
 
-    # Store process in session state for stop button functionality
-    st.session_state.scraper_process = process
-    st.session_state.scraper_running = True
-    st.session_state.scraper_stopped = False
+    # Update adaptive delay from event
+    current_delay_val = event.get("current_delay")
+    if current_delay_val is not None:
+        run.current_delay = current_delay_val
 
-    final_result = ScraperResult(
-        jobs_scraped=0, expired_removed=0, failed=0, error=None
+    # Show adaptive throttle notification
+    if event.get("delay_changed"):
+        with run.status_container:
+            st.success(f"Adaptive throttle: delay reduced to {run.current_delay:.2f}s")
+
+    # Progress, metrics and recent jobs are repainted at most once per interval
+    run.add_job(event)
+    run.flush_ui()
+
+
+def _on_deadlock_warning(event: ProgressEvent, run: _LiveRun) -> None:
+    run.flush_ui(force=True)
+    # Empty message is meaningless here, so `or` (not a .get default) is intended
+    message_val: str = event.get("message") or "All slots busy"
+    with run.status_container:
+        st.error(f"**POTENTIAL DEADLOCK**: {message_val}")
+
+
+def _on_rate_limit(event: ProgressEvent, run: _LiveRun) -> None:
+    wait_time: float = event.get("wait_seconds", 30.0)
+    with run.status_container:
+        st.warning(f"Rate limit detected - backing off for {wait_time:.0f}s")
+
+
+def _on_cookie_expired(event: ProgressEvent, run: _LiveRun) -> None:
+    run.flush_ui(force=True)
+    message_val: str = event.get("message") or "Cookies may be expired!"
+    with run.status_container:
+        st.error(f"**COOKIES EXPIRED**: {message_val}")
+        st.warning(
+            "Please refresh your LinkedIn cookies in `linkedin_cookies.json` and restart the scraper."
+        )
+
+
+def _on_session_valid(event: ProgressEvent, run: _LiveRun) -> None:
+    with run.status_container:
+        st.success("LinkedIn session validated successfully")
+
+
+def _on_scraper_finish(event: ProgressEvent, run: _LiveRun) -> None:
+    run.finished = True
+    run.show_recent_jobs()
+    run.stats.update(
+        {
+            "success": event.get("success", 0),
+            "expired": event.get("expired", 0),
+            "failed": event.get("failed", 0),
+            "processed": event.get("total_processed", 0),
+        }
     )
+    run.update_metrics()
+    run.progress_bar.progress(1.0, text="Complete!")
 
-    try:
-        # Stream stdout line by line
-        if process.stdout is None:
-            raise RuntimeError("Process stdout is not available")
-        for line in iter(process.stdout.readline, ""):
-            line = line.strip()
-            if not line:
-                continue
 
-            # Check for progress events
-            if line.startswith("PROGRESS:"):
-                try:
-                    event_json: str = line[9:]  # Remove "PROGRESS:" prefix
-                    raw_event: dict[str, object] = json.loads(event_json)
-                    # Cast to ProgressEvent TypedDict
-                    event: ProgressEvent = {
-                        "event": str(raw_event.get("event", "")),
-                    }
-                    # Copy all known fields with proper defaults
-                    if "timestamp" in raw_event:
-                        val = raw_event["timestamp"]
-                        event["timestamp"] = (
-                            float(val) if isinstance(val, (int, float)) else 0.0
-                        )
-                    if "total_jobs" in raw_event:
-                        val = raw_event["total_jobs"]
-                        event["total_jobs"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "num_slots" in raw_event:
-                        val = raw_event["num_slots"]
-                        event["num_slots"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "slot_id" in raw_event:
-                        val = raw_event["slot_id"]
-                        event["slot_id"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "job_index" in raw_event:
-                        val = raw_event["job_index"]
-                        event["job_index"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "status" in raw_event:
-                        val = raw_event["status"]
-                        event["status"] = str(val) if val is not None else ""
-                    if "stats" in raw_event:
-                        val = raw_event["stats"]
-                        if isinstance(val, dict):
-                            event["stats"] = {
-                                str(k): int(v) if isinstance(v, (int, float)) else 0
-                                for k, v in val.items()
-                            }
-                    if "current_delay" in raw_event:
-                        val = raw_event["current_delay"]
-                        event["current_delay"] = (
-                            float(val) if isinstance(val, (int, float)) else 0.0
-                        )
-                    if "delay_changed" in raw_event:
-                        val = raw_event["delay_changed"]
-                        event["delay_changed"] = bool(val)
-                    if "company" in raw_event:
-                        val = raw_event["company"]
-                        event["company"] = str(val) if val is not None else ""
-                    if "title" in raw_event:
-                        val = raw_event["title"]
-                        event["title"] = str(val) if val is not None else ""
-                    if "skills_count" in raw_event:
-                        val = raw_event["skills_count"]
-                        event["skills_count"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "job_id" in raw_event:
-                        val = raw_event["job_id"]
-                        event["job_id"] = str(val) if val is not None else ""
-                    if "error" in raw_event:
-                        val = raw_event["error"]
-                        event["error"] = str(val) if val is not None else ""
-                    if "wait_seconds" in raw_event:
-                        val = raw_event["wait_seconds"]
-                        event["wait_seconds"] = (
-                            float(val) if isinstance(val, (int, float)) else 0.0
-                        )
-                    if "message" in raw_event:
-                        val = raw_event["message"]
-                        event["message"] = str(val) if val is not None else ""
-                    if "success" in raw_event:
-                        val = raw_event["success"]
-                        event["success"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "expired" in raw_event:
-                        val = raw_event["expired"]
-                        event["expired"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "failed" in raw_event:
-                        val = raw_event["failed"]
-                        event["failed"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    if "total_processed" in raw_event:
-                        val = raw_event["total_processed"]
-                        event["total_processed"] = (
-                            int(val) if isinstance(val, (int, float)) else 0
-                        )
-                    yield event
-                except json.JSONDecodeError:
-                    pass
-            # Check for final result
-            elif line.startswith("{"):
-                try:
-                    data: dict[str, object] = json.loads(line)
-                    if "jobs_scraped" in data:
-                        jobs_scraped_val = data.get("jobs_scraped", 0)
-                        expired_val = data.get("expired_removed", 0)
-                        failed_val = data.get("failed", 0)
-                        error_val = data.get("error")
-                        final_result = ScraperResult(
-                            jobs_scraped=int(jobs_scraped_val)
-                            if isinstance(jobs_scraped_val, (int, float))
-                            else 0,
-                            expired_removed=int(expired_val)
-                            if isinstance(expired_val, (int, float))
-                            else 0,
-                            failed=int(failed_val)
-                            if isinstance(failed_val, (int, float))
-                            else 0,
-                            error=str(error_val) if error_val is not None else None,
-                        )
-                except json.JSONDecodeError:
-                    pass
+# One dict lookup per event instead of walking an if/elif chain
+_EVENT_HANDLERS: dict[str, Callable[[ProgressEvent, _LiveRun], None]] = {
+    "scraper_start": _on_scraper_start,
+    "job_dispatch": _on_job_dispatch,
+    "job_complete": _on_job_complete,
+    "deadlock_warning": _on_deadlock_warning,
+    "rate_limit": _on_rate_limit,
+    "cookie_expired": _on_cookie_expired,
+    "session_valid": _on_session_valid,
+    "scraper_finish": _on_scraper_finish,
+}
 
-        process.wait()
+# Non slot_* events the SlotMonitor also tracks
+_SLOT_MONITOR_EVENTS = frozenset({"job_dispatch", "job_complete", "deadlock_warning"})
 
-        if process.returncode != 0:
-            stderr = process.stderr.read() if process.stderr else ""
-            if stderr and not final_result.get("error"):
-                final_result["error"] = stderr[:500]
 
-    except Exception as e:
-        final_result["error"] = str(e)
-    finally:
-        if process.poll() is None:
-            process.terminate()
-        # Clear session state
-        st.session_state.scraper_process = None
-        st.session_state.scraper_running = False
+@st.fragment
+def _render_scrape_controls(
+    platform: str,
+    job_role: str,
+    batch_size: int,
+    num_slots: int,
+    delay_seconds: float,
+    sequential_mode: bool,
+    actual_batch: int,
+) -> None:
+    """Start/STOP buttons and the live run - a fragment, so the two-phase start
+    reruns only this block instead of every widget and DB query above it"""
+    # Create buttons in columns - Start and Stop
+    btn_col1, btn_col2 = st.columns([3, 1])
+
+    # Check if scraping is pending (two-phase start)
+    is_pending = st.session_state.get("start_scraping_pending", False)
+    is_running = st.session_state.get("scraper_running", False)
+
+    with btn_col1:
+        process_button = st.button(
+            f"📝 Scrape {actual_batch} Jobs",
+            type="primary",
+            use_container_width=True,
+            disabled=is_running or is_pending,
+        )
+
+    with btn_col2:
+        stop_button = st.button(
+            "⏹️ STOP",
+            type="primary" if (is_running or is_pending) else "secondary",
+            use_container_width=True,
+            disabled=not (is_running or is_pending),
+            help="Immediately stop scraper and close browser",
+        )
+
+    # Handle stop button click
+    if stop_button:
+        # Cancel pending start if not yet running
+        if is_pending and not is_running:
+            st.session_state.start_scraping_pending = False
+            st.session_state.scrape_params = None
+            st.warning("⏹️ Scraping cancelled before start.")
+            _rerun_controls()
+        elif stop_scraper():
+            st.session_state.start_scraping_pending = False
+            st.warning("⏹️ Stopping scraper... Please wait.")
+            _rerun_controls()
+
+    # PHASE 1: Button clicked - save params and rerun to show enabled STOP button
+    if process_button:
+        st.session_state.start_scraping_pending = True
+        st.session_state.scraper_running = True
+        st.session_state.scrape_params = {
+            "platform": platform,
+            "job_role": job_role,
+            "batch_size": batch_size,
+            "num_slots": num_slots,
+            "delay_seconds": delay_seconds,
+            "sequential_mode": sequential_mode,
+        }
+        _rerun_controls()  # Rerun to show enabled STOP button
+
+    # PHASE 2: Pending start - now actually run the scraper (STOP button is already enabled)
+    should_start_scraping = (
+        is_pending and st.session_state.get("scrape_params") is not None
+    )
+
+    if should_start_scraping:
+        # Clear pending flag
+        st.session_state.start_scraping_pending = False
+        params = st.session_state.scrape_params
+
+        # Create placeholders for real-time updates
+        progress_bar = st.progress(0, text="Initializing...")
+
+        # Status container
+        status_container = st.container()
+
+        # Create columns for live stats
+        stat_cols = st.columns(5)
+        metrics = [col.empty() for col in stat_cols]
+
+        # Recent job outcomes (newest first)
+        latest_job_container = st.empty()
+
+        # Slot Monitor - detailed per-slot logging
+        st.markdown("---")
+        slot_monitor = SlotMonitor(params["num_slots"])
+        slot_monitor.setup_ui()
+        st.markdown("---")
+
+        run = _LiveRun(
+            progress_bar=progress_bar,
+            status_container=status_container,
+            metrics=metrics,
+            latest_job_container=latest_job_container,
+            slot_monitor=slot_monitor,
+            total_jobs=params["batch_size"],
+            num_slots=num_slots,
+            current_delay=params["delay_seconds"],
+        )
+        run.update_metrics()
+
+        try:
+            # Stream progress events (using saved params)
+            generator = stream_scraper_progress(
+                platform=params["platform"],
+                job_role=params["job_role"],
+                batch_size=params["batch_size"],
+                concurrent_tabs=params["num_slots"],
+                delay_seconds=params["delay_seconds"],
+                sequential=params["sequential_mode"],
+            )
 
-    return final_result
+            final_result: ProgressEvent | None = None
+
+            for event in generator:
+                event_type: str = event.get("event", "")
+                if event_type == "final_result":
+                    final_result = event
+                    continue
+
+                # Pass ALL slot-related events to the SlotMonitor
+                if event_type in _SLOT_MONITOR_EVENTS or event_type.startswith("slot_"):
+                    # TypedDict structural mismatch with Mapping - types are verified at definition
+                    slot_monitor.update_from_event(event)  # type: ignore[arg-type]
+
+                handler = _EVENT_HANDLERS.get(event_type)
+                if handler is not None:
+                    handler(event, run)
+
+            # Paint anything still held back by the repaint throttles
+            slot_monitor.flush()
+            if not run.finished:
+                run.flush_ui(force=True)
+
+            # Counts changed underneath the 5s stats cache
+            count_unscraped.clear()
+            _count_jobs.clear()
+
+            if final_result:
+                error_result: str | None = final_result.get("error")
+                if error_result:
+                    st.error(f"Error: {error_result}")
+                else:
+                    jobs_scraped_result: int = (
+                        final_result.get("jobs_scraped") or run.stats["success"]
+                    )
+                    st.success(
+                        f"**Scraping Complete!**\n\n"
+                        f"- Jobs scraped: **{jobs_scraped_result}**\n"
+                        f"- Expired removed: **{run.stats['expired']}**\n"
+                        f"- Failed: **{run.stats['failed']}**"
+                    )
+                    st.balloons()
+
+        except Exception as e:
+            st.error(f"Error during scraping: {e!s}")
+
+        # Refresh button
+        if st.button("Refresh Stats", use_container_width=True):
+            st.rerun()
 
 
 def render_detail_scraper_form(db_path: str) -> None:
@@ -539,11 +1069,8 @@ def render_detail_scraper_form(db_path: str) -> None:
             )
 
     # Database stats
-    db_ops = JobStorageOperations(db_path)
-    unscraped_count = len(
-        db_ops.get_unscraped_urls(platform.lower(), job_role, limit=10000)
-    )
-    total_jobs = len(db_ops.get_all_jobs())
+    unscraped_count = count_unscraped(db_path, platform.lower(), job_role)
+    total_jobs = _count_jobs(db_path)
 
     # Calculate speed using effective delay and parallel tabs
     # With parallel tabs, throughput = tabs / effective_delay
@@ -579,277 +1106,13 @@ def render_detail_scraper_form(db_path: str) -> None:
             f"{mode_info}"
         )
 
-        # Create buttons in columns - Start and Stop
-        btn_col1, btn_col2 = st.columns([3, 1])
-
-        # Check if scraping is pending (two-phase start)
-        is_pending = st.session_state.get("start_scraping_pending", False)
-        is_running = st.session_state.get("scraper_running", False)
-
-        with btn_col1:
-            process_button = st.button(
-                f"📝 Scrape {actual_batch} Jobs",
-                type="primary",
-                use_container_width=True,
-                disabled=unscraped_count == 0 or is_running or is_pending,
-            )
-
-        with btn_col2:
-            stop_button = st.button(
-                "⏹️ STOP",
-                type="primary" if (is_running or is_pending) else "secondary",
-                use_container_width=True,
-                disabled=not (is_running or is_pending),
-                help="Immediately stop scraper and close browser",
-            )
-
-        # Handle stop button click
-        if stop_button:
-            # Cancel pending start if not yet running
-            if is_pending and not is_running:
-                st.session_state.start_scraping_pending = False
-                st.session_state.scrape_params = None
-                st.warning("⏹️ Scraping cancelled before start.")
-                st.rerun()
-            elif stop_scraper():
-                st.session_state.start_scraping_pending = False
-                st.warning("⏹️ Stopping scraper... Please wait.")
-                st.rerun()
-
-        # PHASE 1: Button clicked - save params and rerun to show enabled STOP button
-        if process_button:
-            st.session_state.start_scraping_pending = True
-            st.session_state.scraper_running = True
-            st.session_state.scrape_params = {
-                "platform": platform,
-                "job_role": job_role,
-                "batch_size": batch_size,
-                "num_slots": num_slots,
-                "delay_seconds": delay_seconds,
-                "sequential_mode": sequential_mode,
-            }
-            st.rerun()  # Rerun to show enabled STOP button
-
-        # PHASE 2: Pending start - now actually run the scraper (STOP button is already enabled)
-        should_start_scraping = (
-            is_pending and st.session_state.get("scrape_params") is not None
+        # Buttons + live run (fragment-scoped reruns)
+        _render_scrape_controls(
+            platform=platform,
+            job_role=job_role,
+            batch_size=batch_size,
+            num_slots=num_slots,
+            delay_seconds=delay_seconds,
+            sequential_mode=sequential_mode,
+            actual_batch=actual_batch,
         )
-
-        if should_start_scraping:
-            # Clear pending flag
-            st.session_state.start_scraping_pending = False
-            params = st.session_state.scrape_params
-
-            # Create placeholders for real-time updates
-            progress_bar = st.progress(0, text="Initializing...")
-
-            # Status container
-            status_container = st.container()
-
-            # Create columns for live stats
-            stat_cols = st.columns(5)
-            success_metric = stat_cols[0].empty()
-            expired_metric = stat_cols[1].empty()
-            failed_metric = stat_cols[2].empty()
-            processed_metric = stat_cols[3].empty()
-            delay_metric = stat_cols[4].empty()
-
-            # Latest job info
-            latest_job_container = st.empty()
-
-            # Slot Monitor - detailed per-slot logging
-            st.markdown("---")
-            slot_monitor = SlotMonitor(params["num_slots"])
-            slot_monitor.setup_ui()
-            st.markdown("---")
-
-            # Initialize stats (using dict for mutable state)
-            stats = {"success": 0, "expired": 0, "failed": 0, "processed": 0}
-            state = {
-                "current_delay": params["delay_seconds"]
-            }  # Mutable container for adaptive delay
-            total_jobs_count = params["batch_size"]
-
-            def update_metrics():
-                success_metric.metric("✅ Success", stats["success"])
-                expired_metric.metric("🗑️ Expired", stats["expired"])
-                failed_metric.metric("❌ Failed", stats["failed"])
-                processed_metric.metric(
-                    "📊 Processed", f"{stats['processed']}/{total_jobs_count}"
-                )
-                delay_metric.metric("⚡ Delay", f"{state['current_delay']:.2f}s")
-
-            update_metrics()
-
-            try:
-                # Stream progress events (using saved params)
-                generator = stream_scraper_progress(
-                    platform=params["platform"],
-                    job_role=params["job_role"],
-                    batch_size=params["batch_size"],
-                    concurrent_tabs=params["num_slots"],
-                    delay_seconds=params["delay_seconds"],
-                    sequential=params["sequential_mode"],
-                )
-
-                final_result = None
-
-                for event in generator:
-                    event_type: str = event.get("event", "")
-
-                    # Pass ALL slot-related events to the SlotMonitor
-                    if event_type.startswith("slot_") or event_type in [
-                        "job_dispatch",
-                        "job_complete",
-                        "deadlock_warning",
-                    ]:
-                        # TypedDict structural mismatch with Mapping - types are verified at definition
-                        slot_monitor.update_from_event(event)  # type: ignore[arg-type]
-
-                    if event_type == "scraper_start":
-                        total_jobs_count = event.get("total_jobs") or actual_batch
-                        num_slots_val: int = event.get("num_slots") or num_slots
-                        with status_container:
-                            st.info(
-                                f"Started scraping {total_jobs_count} jobs with {num_slots_val} slots"
-                            )
-                            st.caption(
-                                "Content-based filtering: Non-English content will be skipped automatically"
-                            )
-
-                    elif event_type == "job_dispatch":
-                        slot_id_val: int = event.get("slot_id") or 0
-                        job_index_val: int = event.get("job_index") or 0
-                        progress: float = (
-                            job_index_val / total_jobs_count
-                            if total_jobs_count > 0
-                            else 0.0
-                        )
-                        progress_bar.progress(
-                            progress,
-                            text=f"Dispatching Job {job_index_val}/{total_jobs_count} -> Slot {slot_id_val}",
-                        )
-
-                    elif event_type == "job_complete":
-                        slot_id_val = event.get("slot_id") or 0
-                        status_val: str = event.get("status") or "unknown"
-                        job_index_val = event.get("job_index") or 0
-
-                        # Update stats from event
-                        event_stats = event.get("stats")
-                        if event_stats is not None:
-                            stats.update(event_stats)
-
-                        # Update adaptive delay from event
-                        current_delay_val = event.get("current_delay")
-                        if current_delay_val is not None:
-                            state["current_delay"] = current_delay_val
-
-                        # Update progress
-                        progress = (
-                            stats["processed"] / total_jobs_count
-                            if total_jobs_count > 0
-                            else 0
-                        )
-                        progress_bar.progress(
-                            min(progress, 1.0),
-                            text=f"Processed {stats['processed']}/{total_jobs_count}",
-                        )
-
-                        # Update metrics
-                        update_metrics()
-
-                        # Show adaptive throttle notification
-                        if event.get("delay_changed"):
-                            with status_container:
-                                st.success(
-                                    f"Adaptive throttle: delay reduced to {state['current_delay']:.2f}s"
-                                )
-
-                        # Show latest job info for successful jobs
-                        if status_val == "success":
-                            company_val: str = event.get("company") or ""
-                            title_val: str = event.get("title") or ""
-                            skills_count_val: int = event.get("skills_count") or 0
-                            latest_job_container.success(
-                                f"**Latest:** {title_val[:40]} @ {company_val[:30]} ({skills_count_val} skills)"
-                            )
-                        elif status_val == "expired":
-                            # Could be expired OR non-English content
-                            error_msg: str = event.get("error") or ""
-                            if "Non-English" in error_msg or "CJK" in error_msg:
-                                latest_job_container.info(f"Skipped: {error_msg[:40]}")
-                            else:
-                                job_id_val: str = event.get("job_id") or ""
-                                latest_job_container.warning(
-                                    f"Job {job_id_val[:20]}... expired/removed"
-                                )
-                        elif status_val == "error":
-                            error_msg_val: str = event.get("error") or "Unknown"
-                            latest_job_container.error(f"Error: {error_msg_val[:50]}")
-
-                    elif event_type == "deadlock_warning":
-                        # Show deadlock warning prominently
-                        message_val: str = event.get("message") or "All slots busy"
-                        with status_container:
-                            st.error(f"**POTENTIAL DEADLOCK**: {message_val}")
-
-                    elif event_type == "rate_limit":
-                        wait_time: float = event.get("wait_seconds") or 30.0
-                        with status_container:
-                            st.warning(
-                                f"Rate limit detected - backing off for {wait_time:.0f}s"
-                            )
-
-                    elif event_type == "cookie_expired":
-                        message_val = event.get("message") or "Cookies may be expired!"
-                        with status_container:
-                            st.error(f"**COOKIES EXPIRED**: {message_val}")
-                            st.warning(
-                                "Please refresh your LinkedIn cookies in `linkedin_cookies.json` and restart the scraper."
-                            )
-
-                    elif event_type == "session_valid":
-                        with status_container:
-                            st.success("LinkedIn session validated successfully")
-
-                    elif event_type == "scraper_finish":
-                        stats.update(
-                            {
-                                "success": event.get("success") or 0,
-                                "expired": event.get("expired") or 0,
-                                "failed": event.get("failed") or 0,
-                                "processed": event.get("total_processed") or 0,
-                            }
-                        )
-                        update_metrics()
-                        progress_bar.progress(1.0, text="Complete!")
-
-                # Get final result (returned from generator)
-                try:
-                    final_result = generator.send(None)
-                except StopIteration as e:
-                    final_result = e.value
-
-                if final_result:
-                    error_result: str | None = final_result.get("error")
-                    if error_result:
-                        st.error(f"Error: {error_result}")
-                    else:
-                        jobs_scraped_result: int = (
-                            final_result.get("jobs_scraped") or stats["success"]
-                        )
-                        st.success(
-                            f"**Scraping Complete!**\n\n"
-                            f"- Jobs scraped: **{jobs_scraped_result}**\n"
-                            f"- Expired removed: **{stats['expired']}**\n"
-                            f"- Failed: **{stats['failed']}**"
-                        )
-                        st.balloons()
-
-            except Exception as e:
-                st.error(f"Error during scraping: {e!s}")
-
-            # Refresh button
-            if st.button("Refresh Stats", use_container_width=True):
-                st.rerun()
@@ -0,0 +1,45 @@
+# Throttled Progress - EMD Component
+# Coalesces progress bar / status updates so loops can report freely
+
+import time
+
+from streamlit.delta_generator import DeltaGenerator
+
+
+class ThrottledProgress:
+    """Progress bar + status line that skip repeats and cap updates per second
+
+    Every progress()/write() call on a Streamlit element is a websocket send.
+    Calls that change nothing, or arrive within min_interval of the last paint,
+    are dropped. A dropped update is not replayed, so pass force=True for
+    milestones that stay on screen while long work is awaited, and the final state.
+    """
+
+    def __init__(
+        self,
+        bar: DeltaGenerator,
+        status: DeltaGenerator | None = None,
+        min_interval: float = 0.05,
+    ) -> None:
+        self._bar = bar
+        self._status = status
+        self._min_interval = min_interval
+        self._last_value: float | None = None
+        self._last_message: str | None = None
+        self._last_paint = 0.0
+
+    def set(self, value: float, message: str | None = None, force: bool = False) -> None:
+        """Move the bar (0-1) and optionally replace the status line"""
+        if value == self._last_value and (message is None or message == self._last_message):
+            return
+        now = time.monotonic()
+        if not force and now - self._last_paint < self._min_interval:
+            return
+        self._last_paint = now
+
+        if value != self._last_value:
+            self._bar.progress(value)
+            self._last_value = value
+        if message is not None and message != self._last_message and self._status is not None:
+            self._status.write(message)
+            self._last_message = message
@@ -3,11 +3,18 @@
 import streamlit as st
 from datetime import datetime
 
-from src.scraper.multi_platform_service import scrape_jobs_with_skills
+from src.scraper.multi_platform_service import scrape_jobs_with_skills_stream
+
+from .throttled_progress import ThrottledProgress
 
 
 async def execute_scraping_workflow(
-    platforms: list[str], job_role: str, location: str, num_jobs: int, db_path: str
+    platforms: list[str],
+    job_role: str,
+    location: str,
+    num_jobs: int,
+    db_path: str,
+    max_in_flight: int | None = None,
 ) -> None:
     """Execute multi-platform scraping workflow with skills"""
     progress_container = st.container()
@@ -15,6 +22,7 @@ async def execute_scraping_workflow(
         st.info(f"🎬 Scraping from {', '.join([p.capitalize() for p in platforms])}...")
         progress_bar = st.progress(0)
         status_text = st.empty()
+        progress = ThrottledProgress(progress_bar, status_text)
         
         col1, col2 = st.columns(2)
         jobs_metric = col1.empty()
@@ -23,25 +31,30 @@ async def execute_scraping_workflow(
     start_time = datetime.now()
     
     try:
-        status_text.write(f"⚡ Initializing scrapers for {', '.join(platforms)}...")
-        progress_bar.progress(0.2)
+        progress.set(0.2, f"⚡ Initializing scrapers for {', '.join(platforms)}...", force=True)
         
-        # Call unified scraping service
-        jobs = await scrape_jobs_with_skills(
+        # Call unified scraping service - progress advances as each platform finishes
+        jobs_count = 0
+        done_platforms = 0
+        async for platform, platform_jobs in scrape_jobs_with_skills_stream(
             platforms=platforms,
             keyword=job_role,
             location=location,
             limit=num_jobs,
-            store_to_db=True
-        )
-        
-        progress_bar.progress(0.9)
-        status_text.write("✅ Scraping completed!")
+            max_in_flight=max_in_flight,
+        ):
+            jobs_count += len(platform_jobs)
+            done_platforms += 1
+            jobs_metric.metric("Jobs Scraped", jobs_count)
+            # Next platform's scrape is awaited right after - this must stay on screen
+            progress.set(
+                0.2 + 0.7 * done_platforms / len(platforms),
+                f"✅ {platform.capitalize()}: {len(platform_jobs)} jobs stored",
+                force=True,
+            )
         
         elapsed = (datetime.now() - start_time).total_seconds()
-        jobs_count = len(jobs) if jobs else 0
-        
-        progress_bar.progress(1.0)
+        progress.set(1.0, "✅ Scraping completed!", force=True)
         jobs_metric.metric("Jobs Scraped", jobs_count, "✓ Stored with Skills")
         time_metric.metric("Time", f"{elapsed:.1f}s")
         
@@ -1,10 +1,26 @@
 # 2-Platform Scraper Configuration Panel - EMD Component
 # LinkedIn + Naukri with multi-layer fuzzy deduplication
 import streamlit as st
-from src.db import JobStorageOperations
+from src.ui.components.storage_handle import get_db_ops
 
+# Per-platform detail-fetch concurrency: scraper default and hard ceiling
+# (LinkedIn clamps its tab pool at 10; Naukri's API semaphore has no cap of its own)
+_MAX_IN_FLIGHT_DEFAULT = {"linkedin": 10, "naukri": 5}
+_MAX_IN_FLIGHT_LIMIT = {"linkedin": 10, "naukri": 16}
 
-def render_two_phase_panel(db_path: str) -> tuple[list[str], str, str, int, str]:
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _load_platform_counts(db_path: str) -> dict[str, int]:
+    """Job counts per platform, aggregated once per cache window instead of every rerun"""
+    by_platform = get_db_ops(db_path).count_jobs_by_platform()
+    return {
+        "total": sum(by_platform.values()),
+        "linkedin": by_platform.get("linkedin", 0),
+        "naukri": by_platform.get("naukri", 0),
+    }
+
+
+def render_two_phase_panel(db_path: str) -> tuple[list[str], str, str, int, int | None, str]:
     """Render 2-platform scraper configuration panel"""
     col1, col2 = st.columns(2)
     
@@ -34,21 +50,25 @@ def render_two_phase_panel(db_path: str) -> tuple[list[str], str, str, int, str]
             step=10,
             help="Number of jobs to scrape per platform"
         )
+        # Strictest ceiling among the selected platforms; empty means each scraper's own default
+        selected = platforms or list(_MAX_IN_FLIGHT_LIMIT)
+        defaults = ", ".join(f"{'LinkedIn' if p == 'linkedin' else p.title()} {_MAX_IN_FLIGHT_DEFAULT[p]}" for p in selected)
+        max_in_flight = st.number_input(
+            "Max concurrent detail fetches",
+            min_value=1,
+            max_value=min(_MAX_IN_FLIGHT_LIMIT[p] for p in selected),
+            value=None,
+            step=1,
+            placeholder=f"Platform default ({defaults})",
+            help="Cap on detail requests/tabs in flight at once (leave empty for each platform's default)"
+        )
     
     with col2:
         st.markdown("### 📊 Database Status")
-        db_ops = JobStorageOperations(db_path)
-        
-        # Query total jobs in database
-        all_jobs = db_ops.get_all_jobs()
-        total_count = len(all_jobs)
-        
-        # Count by platform
-        linkedin_count = len([j for j in all_jobs if j.get('platform', '').lower() == 'linkedin'])
-        naukri_count = len([j for j in all_jobs if j.get('platform', '').lower() == 'naukri'])
+        counts = _load_platform_counts(db_path)
         
-        st.metric("Total Jobs", total_count, help="Total jobs in database")
-        st.info(f"**LinkedIn:** {linkedin_count} | **Naukri:** {naukri_count}")
+        st.metric("Total Jobs", counts["total"], help="Total jobs in database")
+        st.info(f"**LinkedIn:** {counts['linkedin']} | **Naukri:** {counts['naukri']}")
     
     st.divider()
     
@@ -63,4 +83,4 @@ def render_two_phase_panel(db_path: str) -> tuple[list[str], str, str, int, str]
     
     action = "scrape" if scrape_clicked else "none"
     
-    return platforms, job_role, location, num_jobs, action
+    return platforms, job_role, location, num_jobs, max_in_flight, action
@@ -1,62 +1,105 @@
 """KPI Dashboard Component - Real-time Scraping Progress Visualization"""
 
+import html
+
 import streamlit as st
 
-from src.db.operations import JobStorageOperations
+from src.db.operations import ScrapingStats
+from src.ui.components.storage_handle import get_db_ops
 
 
-def render_kpi_dashboard(db_path: str = "data/jobs.db") -> None:
-    """Render KPI dashboard showing scraping progress"""
+# (min progress %, icon) - first match wins
+_ROLE_ICONS = ((90, "✅"), (50, "🔄"), (float("-inf"), "⏳"))
 
-    db_ops = JobStorageOperations(db_path)
-    stats = db_ops.get_scraping_stats()
 
-    st.header("📊 Scraping Progress KPIs")
+@st.cache_data(ttl=15, show_spinner=False)
+def _load_stats(db_path: str) -> ScrapingStats:
+    """Scraping stats snapshot shared by every rerun within the cache window"""
+    return get_db_ops(db_path).get_scraping_stats()
 
-    # Main KPI Metrics Row
-    col1, col2, col3, col4 = st.columns(4)
 
-    with col1:
-        st.metric(
-            label="🔗 Total URLs Collected",
-            value=f"{stats['total_urls']:,}",
-            help="Phase 1: Total job URLs discovered",
-        )
+_PLATFORM_ROW_TMPL = """
+        <tr>
+            <td style="padding: 6px 8px; font-weight: bold;">{platform}</td>
+            <td style="padding: 6px 8px; text-align: right;">{total:,}</td>
+            <td style="padding: 6px 8px; text-align: right;">{jobs:,}</td>
+            <td style="padding: 6px 8px; text-align: right;">{pending:,}</td>
+            <td style="padding: 6px 8px; width: 35%;">
+                <progress value="{jobs}" max="{total}" style="width: 75%;"></progress> {progress}%
+            </td>
+        </tr>"""
 
-    with col2:
-        st.metric(
-            label="✅ Jobs Scraped",
-            value=f"{stats['total_jobs']:,}",
-            delta=f"{stats['progress_percent']}% complete",
-            help="Phase 2: Jobs with full details extracted",
-        )
 
-    with col3:
-        st.metric(
-            label="⏳ Pending",
-            value=f"{stats['urls_pending']:,}",
-            delta=f"-{stats['urls_scraped']:,} done"
-            if stats["urls_scraped"] > 0
-            else None,
-            delta_color="inverse",
-            help="URLs waiting to be scraped",
+def _platform_table_html(rows: list[tuple[str, int, int, int]]) -> str:
+    """Per-platform URLs / done / pending / progress as a single HTML table"""
+    body = "".join(
+        _PLATFORM_ROW_TMPL.format(
+            platform=html.escape(platform.upper()),
+            total=total,
+            jobs=jobs,
+            pending=pending,
+            progress=round(jobs / total * 100, 1) if total > 0 else 0,
         )
+        for platform, total, jobs, pending in rows
+    )
+    return f"""
+    <table style="width: 100%; border-collapse: collapse;">
+        <tr style="color: #888; font-size: 12px;">
+            <th style="text-align: left; padding: 6px 8px;">Platform</th>
+            <th style="text-align: right; padding: 6px 8px;">URLs</th>
+            <th style="text-align: right; padding: 6px 8px;">Done</th>
+            <th style="text-align: right; padding: 6px 8px;">Pending</th>
+            <th style="text-align: left; padding: 6px 8px;">Progress</th>
+        </tr>{body}
+    </table>
+    """
 
-    with col4:
-        # Progress percentage with color coding
-        progress = stats["progress_percent"]
-        if progress >= 90:
-            status = "🟢"
-        elif progress >= 50:
-            status = "🟡"
-        else:
-            status = "🔴"
 
-        st.metric(
-            label=f"{status} Overall Progress",
-            value=f"{progress}%",
-            help="Percentage of URLs scraped",
-        )
+def render_kpi_dashboard(db_path: str = "data/jobs.db") -> None:
+    """Render KPI dashboard showing scraping progress"""
+
+    stats = _load_stats(db_path)
+
+    st.header("📊 Scraping Progress KPIs")
+
+    # Main KPI Metrics Row - one HTML block instead of four columns of st.metric
+    progress = stats["progress_percent"]
+    status = "🟢" if progress >= 90 else "🟡" if progress >= 50 else "🔴"
+    st.markdown(
+        _metric_row_html(
+            (
+                (
+                    "🔗 Total URLs Collected",
+                    f"{stats['total_urls']:,}",
+                    "#00d4ff",
+                    "",
+                    "Phase 1: Total job URLs discovered",
+                ),
+                (
+                    "✅ Jobs Scraped",
+                    f"{stats['total_jobs']:,}",
+                    "#00ff88",
+                    f"{progress}% complete",
+                    "Phase 2: Jobs with full details extracted",
+                ),
+                (
+                    "⏳ Pending",
+                    f"{stats['urls_pending']:,}",
+                    "#ffaa00",
+                    f"-{stats['urls_scraped']:,} done" if stats["urls_scraped"] > 0 else "",
+                    "URLs waiting to be scraped",
+                ),
+                (
+                    f"{status} Overall Progress",
+                    f"{progress}%",
+                    _progress_color(progress),
+                    "",
+                    "Percentage of URLs scraped",
+                ),
+            )
+        ),
+        unsafe_allow_html=True,
+    )
 
     # Progress Bar
     st.progress(
@@ -72,19 +115,17 @@ def render_kpi_dashboard(db_path: str = "data/jobs.db") -> None:
     with col1:
         st.subheader("📱 By Platform")
 
-        if stats["urls_by_platform"]:
-            for platform, total in stats["urls_by_platform"].items():
-                jobs = stats["jobs_by_platform"].get(platform, 0)
-                pending = stats["pending_by_platform"].get(platform, 0)
-                progress_pct = round(jobs / total * 100, 1) if total > 0 else 0
-
-                st.markdown(f"**{platform.upper()}**")
-                col_a, col_b, col_c = st.columns(3)
-                col_a.metric("URLs", f"{total:,}")
-                col_b.metric("Done", f"{jobs:,}")
-                col_c.metric("Pending", f"{pending:,}")
-                st.progress(progress_pct / 100, text=f"{progress_pct}%")
-                st.markdown("---")
+        # One pass pairing each platform's totals, instead of two .get() probes per row
+        jobs_by_platform = stats["jobs_by_platform"]
+        pending_by_platform = stats["pending_by_platform"]
+        platform_rows = [
+            (platform, total, jobs_by_platform.get(platform, 0), pending_by_platform.get(platform, 0))
+            for platform, total in stats["urls_by_platform"].items()
+        ]
+
+        if platform_rows:
+            # Whole breakdown in one markdown element instead of ~6 widgets per platform
+            st.markdown(_platform_table_html(platform_rows), unsafe_allow_html=True)
         else:
             st.info("No data yet. Start scraping to see platform breakdown.")
 
@@ -100,12 +141,7 @@ def render_kpi_dashboard(db_path: str = "data/jobs.db") -> None:
                 progress_pct = role_data["progress"]
 
                 # Color code based on progress
-                if progress_pct >= 90:
-                    icon = "✅"
-                elif progress_pct >= 50:
-                    icon = "🔄"
-                else:
-                    icon = "⏳"
+                icon = next(i for threshold, i in _ROLE_ICONS if progress_pct >= threshold)
 
                 with st.expander(f"{icon} {role} ({scraped}/{total})", expanded=False):
                     col_a, col_b, col_c = st.columns(3)
@@ -119,41 +155,71 @@ def render_kpi_dashboard(db_path: str = "data/jobs.db") -> None:
     # Refresh button
     st.divider()
     if st.button("🔄 Refresh KPIs", use_container_width=True):
+        _load_stats.clear()  # Drop the snapshot so the rerun re-queries
         st.rerun()
 
 
+def _progress_color(progress: float) -> str:
+    """Green at 90%+, amber at 50%+, red below"""
+    if progress >= 90:
+        return "#00ff88"
+    if progress >= 50:
+        return "#ffaa00"
+    return "#ff4444"
+
+
+# Static markup for a metric strip - only the values change between reruns
+_METRIC_ROW_TMPL = """
+    <div style="background: linear-gradient(90deg, #1a1a2e 0%, #16213e 100%);
+                padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">{items}
+        </div>
+    </div>
+    """
+
+_METRIC_ITEM_TMPL = """
+            <div style="text-align: center;"{tip}>
+                <span style="font-size: 24px; font-weight: bold; color: {color};">{value}</span>
+                <br><span style="font-size: 12px; color: #888;">{label}</span>{note}
+            </div>"""
+
+# (label, value, color, note, tooltip) - empty note/tooltip are left out
+_MetricItem = tuple[str, str, str, str, str]
+
+
+def _metric_row_html(items: tuple[_MetricItem, ...]) -> str:
+    """Formatted strip (cheap to build - values change on most reruns mid-scrape)"""
+    return _METRIC_ROW_TMPL.format(
+        items="".join(
+            _METRIC_ITEM_TMPL.format(
+                label=html.escape(label),
+                value=html.escape(value),
+                color=color,
+                note=f'<br><span style="font-size: 11px; color: #aaa;">{html.escape(note)}</span>'
+                if note
+                else "",
+                tip=f' title="{html.escape(tip)}"' if tip else "",
+            )
+            for label, value, color, note, tip in items
+        )
+    )
+
+
 def render_compact_kpi(db_path: str = "data/jobs.db") -> None:
     """Render compact KPI strip for sidebar or header"""
 
-    db_ops = JobStorageOperations(db_path)
-    stats = db_ops.get_scraping_stats()
+    stats = _load_stats(db_path)
 
     # Compact display
     progress = stats["progress_percent"]
-
     st.markdown(
-        f"""
-    <div style="background: linear-gradient(90deg, #1a1a2e 0%, #16213e 100%);
-                padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <div style="display: flex; justify-content: space-between; align-items: center;">
-            <div style="text-align: center;">
-                <span style="font-size: 24px; font-weight: bold; color: #00d4ff;">{stats["total_urls"]:,}</span>
-                <br><span style="font-size: 12px; color: #888;">URLs</span>
-            </div>
-            <div style="text-align: center;">
-                <span style="font-size: 24px; font-weight: bold; color: #00ff88;">{stats["total_jobs"]:,}</span>
-                <br><span style="font-size: 12px; color: #888;">Jobs</span>
-            </div>
-            <div style="text-align: center;">
-                <span style="font-size: 24px; font-weight: bold; color: #ffaa00;">{stats["urls_pending"]:,}</span>
-                <br><span style="font-size: 12px; color: #888;">Pending</span>
-            </div>
-            <div style="text-align: center;">
-                <span style="font-size: 24px; font-weight: bold; color: {"#00ff88" if progress >= 90 else "#ffaa00" if progress >= 50 else "#ff4444"};">{progress}%</span>
-                <br><span style="font-size: 12px; color: #888;">Progress</span>
-            </div>
-        </div>
-    </div>
-    """,
+        _metric_row_html(
+            (
+                ("URLs", f"{stats['total_urls']:,}", "#00d4ff", "", ""),
+                ("Jobs", f"{stats['total_jobs']:,}", "#00ff88", "", ""),
+                ("Pending", f"{stats['urls_pending']:,}", "#ffaa00", "", ""),
+                ("Progress", f"{progress}%", _progress_color(progress), "", ""),
+            )
+        ),
         unsafe_allow_html=True,
     )
@@ -2,18 +2,24 @@
 # Supports single location and worldwide concurrent scraping
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import multiprocessing
 import os
-import subprocess
+import signal
 import sys
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TypedDict
+from typing import Callable, TypedDict, cast
 
 import streamlit as st
 from src.config.countries import LINKEDIN_COUNTRIES
-from src.db import JobStorageOperations
+from src.scraper.unified import link_worker
+from src.ui.components.storage_handle import count_unscraped
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +31,9 @@ TEMP_DIR = tempfile.gettempdir() if IS_WINDOWS else "/tmp"
 PROJECT_ROOT = str(Path(__file__).resolve().parents[3])  # Go up 3 levels from this file
 
 
+@functools.lru_cache(maxsize=1)
 def get_venv_python() -> str:
-    """Get the correct Python executable from venv for all platforms"""
+    """Get the correct Python executable from venv for all platforms (probed on first use)"""
     venv_path = Path(PROJECT_ROOT) / "venv"
 
     if IS_WINDOWS:
@@ -42,21 +49,30 @@ def get_venv_python() -> str:
     return sys.executable
 
 
-# Get the correct Python executable
-VENV_PYTHON = get_venv_python()
+@functools.lru_cache(maxsize=1)
+def get_playwright_browsers_path() -> str:
+    """Platform default Playwright browsers directory"""
+    if IS_WINDOWS:
+        return str(Path.home() / "AppData" / "Local" / "ms-playwright")
+    if IS_MAC:
+        return str(Path.home() / "Library" / "Caches" / "ms-playwright")
+    return str(Path.home() / ".cache" / "ms-playwright")  # Linux
+
 
-# Windows Playwright browsers path (use lowercase for conditional assignment)
-if IS_WINDOWS:
-    playwright_browsers_path = str(Path.home() / "AppData" / "Local" / "ms-playwright")
-elif IS_MAC:
-    playwright_browsers_path = str(Path.home() / "Library" / "Caches" / "ms-playwright")
-else:  # Linux
-    playwright_browsers_path = str(Path.home() / ".cache" / "ms-playwright")
+def _ensure_env() -> None:
+    """Temp dirs + browsers path for the worker to inherit (first scrape, not import)"""
+    os.environ["TMPDIR"] = TEMP_DIR
+    os.environ["TMP"] = TEMP_DIR
+    os.environ["TEMP"] = TEMP_DIR
+    os.environ["PLAYWRIGHT_BROWSERS_PATH"] = get_playwright_browsers_path()
 
-os.environ["TMPDIR"] = TEMP_DIR
-os.environ["TMP"] = TEMP_DIR
-os.environ["TEMP"] = TEMP_DIR
-os.environ["PLAYWRIGHT_BROWSERS_PATH"] = playwright_browsers_path
+
+# Worldwide country list as one 4-column grid element (same row-major order as before)
+_COUNTRIES_GRID_HTML = (
+    '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 4px;">'
+    + "".join(f"<div>• {country}</div>" for country in LINKEDIN_COUNTRIES)
+    + "</div>"
+)
 
 
 class ScraperResult(TypedDict):
@@ -65,172 +81,101 @@ class ScraperResult(TypedDict):
     error: str | None
 
 
+class _WorkerPool:
+    """One warm interpreter for Phase 1 runs: spawned on the first click, reused after.
+
+    Process-wide on purpose - every session queues on the same single worker, since
+    concurrent runs would fight over the same visible browser windows.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pids: set[int] = set()
+
+    def get(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                _ensure_env()
+                mp_context = multiprocessing.get_context("spawn")
+                mp_context.set_executable(get_venv_python())  # Same venv the subprocesses used
+                pool = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=mp_context,
+                    initializer=link_worker.init_worker,
+                    initargs=(PROJECT_ROOT, get_playwright_browsers_path()),
+                )
+                # Starts the worker (the first run needs it anyway) and records its PID for discard()
+                self._pids = {pool.submit(os.getpid).result()}
+                self._pool = pool
+            return self._pool
+
+    def discard(self, pool: ProcessPoolExecutor) -> None:
+        """Kill a stuck or broken worker; the next run spawns a fresh one"""
+        with self._lock:
+            if self._pool is not pool:
+                return  # Another session already replaced it
+            self._pool = None
+            pids, self._pids = self._pids, set()
+        # No public API to stop a running task - terminate the worker we spawned
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass  # Already gone
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _worker_pool() -> _WorkerPool:
+    """The shared Phase 1 worker, kept across reruns and sessions"""
+    return _WorkerPool()
+
+
 def run_single_location_scraper(
     platform: str, job_role: str, location: str, num_jobs: int
 ) -> ScraperResult:
-    """Run single location scraper in subprocess"""
-    # Use platform-aware paths
-    escaped_project_root = PROJECT_ROOT.replace("\\", "\\\\")
-    escaped_playwright_path = playwright_browsers_path.replace("\\", "\\\\")
-
-    script = f'''
-import os
-import sys
-import json
-import tempfile
-
-# Cross-platform temp directory
-TEMP_DIR = tempfile.gettempdir()
-os.environ["TMPDIR"] = TEMP_DIR
-os.environ["TMP"] = TEMP_DIR
-os.environ["TEMP"] = TEMP_DIR
-
-# Set Playwright browsers path for Windows
-os.environ["PLAYWRIGHT_BROWSERS_PATH"] = r"{escaped_playwright_path}"
-
-# Add project root to path
-sys.path.insert(0, r"{escaped_project_root}")
-
-import asyncio
-from src.db.operations import JobStorageOperations
-
-async def scrape():
-    result = {{"urls_collected": 0, "urls_stored": 0, "error": None}}
-
-    try:
-        if "{platform}".lower() == "linkedin":
-            from src.scraper.unified.linkedin.infinite_scroll_scraper import scrape_linkedin_urls_infinite_scroll
-            urls = await scrape_linkedin_urls_infinite_scroll(
-                keyword="{job_role}",
-                location="{location}",
-                limit={num_jobs},
-                headless=False
-            )
-        else:
-            from src.scraper.unified.naukri.url_scraper import scrape_naukri_urls
-            from src.config.naukri_locations import NAUKRI_ALL_LOCATIONS
-            city_gid = NAUKRI_ALL_LOCATIONS.get("{location}")
-            urls = await scrape_naukri_urls(
-                keyword="{job_role}",
-                location="{location}",
-                limit={num_jobs},
-                headless=False,
-                store_to_db=False,
-                city_gid=city_gid
-            )
-
-        result["urls_collected"] = len(urls) if urls else 0
-
-        if urls:
-            db = JobStorageOperations("data/jobs.db")
-            stored = db.store_urls(urls)
-            result["urls_stored"] = stored
-
-    except Exception as e:
-        result["error"] = str(e)
-
-    print(json.dumps(result))
-
-asyncio.run(scrape())
-'''
-
-    return _run_subprocess(script)
+    """Run single location scraper in the worker process"""
+    return _run_in_worker(
+        link_worker.scrape_single_location, platform, job_role, location, num_jobs
+    )
 
 
 def run_worldwide_scraper(
     job_role: str, threshold: int, concurrent_tabs: int
 ) -> ScraperResult:
-    """Run worldwide concurrent scraper in subprocess"""
-    # Use platform-aware paths
-    escaped_project_root = PROJECT_ROOT.replace("\\", "\\\\")
-    escaped_playwright_path = playwright_browsers_path.replace("\\", "\\\\")
-
-    script = f'''
-import os
-import sys
-import json
-import tempfile
-
-# Cross-platform temp directory
-TEMP_DIR = tempfile.gettempdir()
-os.environ["TMPDIR"] = TEMP_DIR
-os.environ["TMP"] = TEMP_DIR
-os.environ["TEMP"] = TEMP_DIR
-
-# Set Playwright browsers path for Windows
-os.environ["PLAYWRIGHT_BROWSERS_PATH"] = r"{escaped_playwright_path}"
-
-# Add project root to path
-sys.path.insert(0, r"{escaped_project_root}")
-
-import asyncio
-from src.scraper.unified.linkedin.concurrent_url_scraper import scrape_worldwide_concurrent
-
-async def scrape():
-    result = {{"urls_collected": 0, "urls_stored": 0, "error": None}}
-
-    try:
-        urls = await scrape_worldwide_concurrent(
-            keyword="{job_role}",
-            threshold={threshold},
-            max_concurrent={concurrent_tabs},
-            headless=False
-        )
-
-        result["urls_collected"] = len(urls) if urls else 0
-        result["urls_stored"] = result["urls_collected"]  # Already stored by the scraper
-
-    except Exception as e:
-        result["error"] = str(e)
-
-    print(json.dumps(result))
-
-asyncio.run(scrape())
-'''
-
-    return _run_subprocess(script, timeout=1800)  # 30 min timeout for worldwide
+    """Run worldwide concurrent scraper in the worker process"""
+    return _run_in_worker(
+        link_worker.scrape_worldwide,
+        job_role,
+        threshold,
+        concurrent_tabs,
+        timeout=1800,  # 30 min timeout for worldwide
+    )
 
 
-def _run_subprocess(script: str, timeout: int = 600) -> ScraperResult:
-    """Execute script in subprocess and return result"""
+def _run_in_worker(
+    func: Callable[..., dict[str, int | str | None]], *args: object, timeout: int = 600
+) -> ScraperResult:
+    """Execute func in the pooled worker and return its result"""
+    holder = _worker_pool()
+    pool = holder.get()
     try:
-        env = os.environ.copy()
-        env["TMPDIR"] = TEMP_DIR
-        env["TMP"] = TEMP_DIR
-        env["TEMP"] = TEMP_DIR
-        env["PLAYWRIGHT_BROWSERS_PATH"] = playwright_browsers_path
-
-        result = subprocess.run(
-            [VENV_PYTHON, "-c", script],  # Use venv Python for all platforms
-            capture_output=True,
-            text=True,
-            cwd=PROJECT_ROOT,
-            env=env,
-            timeout=timeout,
-        )
-
-        if result.returncode != 0:
-            return ScraperResult(urls_collected=0, urls_stored=0, error=result.stderr)
-
-        # Parse JSON output from last line
-        output_lines = result.stdout.strip().split("\n")
-        for line in reversed(output_lines):
-            if line.startswith("{"):
-                data = json.loads(line)
-                return ScraperResult(
-                    urls_collected=data.get("urls_collected", 0),
-                    urls_stored=data.get("urls_stored", 0),
-                    error=data.get("error"),
-                )
-
+        data = pool.submit(func, *args).result(timeout=timeout)
         return ScraperResult(
-            urls_collected=0, urls_stored=0, error="No JSON output found"
+            urls_collected=int(data.get("urls_collected") or 0),
+            urls_stored=int(data.get("urls_stored") or 0),
+            error=cast("str | None", data.get("error")),
         )
 
-    except subprocess.TimeoutExpired:
+    except FuturesTimeoutError:
+        holder.discard(pool)
         return ScraperResult(
             urls_collected=0, urls_stored=0, error="Timeout - scraping took too long"
         )
+    except BrokenProcessPool as e:
+        holder.discard(pool)
+        return ScraperResult(urls_collected=0, urls_stored=0, error=f"Scraper worker died: {e}")
     except Exception as e:
         return ScraperResult(urls_collected=0, urls_stored=0, error=str(e))
 
@@ -323,10 +268,7 @@ def render_link_scraper_form(db_path: str) -> None:
             )
 
     # Database stats
-    db_ops = JobStorageOperations(db_path)
-    existing_count = len(
-        db_ops.get_unscraped_urls(platform.lower(), job_role, limit=10000)
-    )
+    existing_count = count_unscraped(db_path, platform.lower(), job_role)
 
     st.info(
         f"📊 **Current Stats**: {existing_count} unscraped URLs for {job_role} on {platform}"
@@ -335,9 +277,7 @@ def render_link_scraper_form(db_path: str) -> None:
     # Show countries for worldwide mode
     if "Worldwide" in scrape_mode:
         with st.expander(f"🌍 Countries to scrape ({len(LINKEDIN_COUNTRIES)} total)"):
-            cols = st.columns(4)
-            for i, country in enumerate(LINKEDIN_COUNTRIES):
-                cols[i % 4].write(f"• {country}")
+            st.markdown(_COUNTRIES_GRID_HTML, unsafe_allow_html=True)
 
     # Action buttons
     st.divider()
@@ -371,6 +311,7 @@ def render_link_scraper_form(db_path: str) -> None:
                         f"✅ Collected {result['urls_collected']} URLs worldwide!"
                     )
                     st.balloons()
+                    count_unscraped.clear()
                     st.rerun()
     else:
         col_btn1, col_btn2 = st.columns(2)
@@ -399,8 +340,10 @@ def render_link_scraper_form(db_path: str) -> None:
                         st.success(
                             f"✅ Collected {result['urls_collected']} URLs, stored {result['urls_stored']} NEW"
                         )
+                        count_unscraped.clear()
                         st.rerun()
 
         with col_btn2:
             if st.button("🔄 Refresh Stats", use_container_width=True):
+                count_unscraped.clear()
                 st.rerun()
@@ -0,0 +1,190 @@
+# Process Containment - Kernel-enforced scraper process tree
+# Windows Job Object (kill-on-close) | Linux cgroup v2 (cgroup.kill)
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+IS_WINDOWS = sys.platform == "win32"
+IS_LINUX = sys.platform == "linux"
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Windows Job Object constants (winnt.h)
+_JOB_OBJECT_EXTENDED_LIMIT_INFORMATION = 9
+_JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+
+
+class ProcessContainment:
+    """Holds a subprocess and every descendant in one kernel container
+
+    Playwright forks chromium, renderer and GPU helpers that escape a plain
+    terminate(). A Job Object / cgroup lets one call kill the whole tree.
+    Attaching is best effort: when unsupported, `active` is False and the
+    caller falls back to process-group signalling.
+    """
+
+    def __init__(self, process: subprocess.Popen[bytes]) -> None:
+        self.pid = process.pid
+        self._job_handle: int | None = None
+        self._cgroup: Path | None = None
+
+        try:
+            if IS_WINDOWS:
+                self._job_handle = _attach_job_object(process)
+            elif IS_LINUX:
+                self._cgroup = _attach_cgroup(process.pid)
+        except OSError as e:
+            logger.info(f"Process containment unavailable, using process group: {e}")
+
+    @property
+    def active(self) -> bool:
+        return self._job_handle is not None or self._cgroup is not None
+
+    def kill(self) -> bool:
+        """Kill every process in the container, False if no container is active"""
+        if self._job_handle is not None:
+            import ctypes
+
+            ctypes.windll.kernel32.TerminateJobObject(self._job_handle, 1)  # type: ignore[attr-defined]
+            logger.info(f"Terminated job object for scraper {self.pid}")
+            self.close()
+            return True
+
+        if self._cgroup is not None:
+            try:
+                _kill_cgroup(self._cgroup)
+            except OSError as e:
+                logger.warning(f"cgroup kill failed for scraper {self.pid}: {e}")
+                return False
+            logger.info(f"Killed cgroup {self._cgroup.name} for scraper {self.pid}")
+            self.close()
+            return True
+
+        return False
+
+    def close(self) -> None:
+        """Release the container (Windows: closing the handle kills leftovers)"""
+        if self._job_handle is not None:
+            import ctypes
+
+            ctypes.windll.kernel32.CloseHandle(self._job_handle)  # type: ignore[attr-defined]
+            self._job_handle = None
+
+        if self._cgroup is not None:
+            # rmdir only succeeds once the cgroup is empty - retry briefly
+            for _ in range(20):
+                try:
+                    self._cgroup.rmdir()
+                    break
+                except FileNotFoundError:
+                    break
+                except OSError:
+                    time.sleep(0.05)
+            else:
+                logger.warning(f"Could not remove cgroup {self._cgroup}")
+            self._cgroup = None
+
+
+def _attach_job_object(process: subprocess.Popen[bytes]) -> int:
+    """Create a kill-on-close Job Object and assign the process to it"""
+    import ctypes
+    from ctypes import wintypes
+
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_ulonglong),
+            ("WriteOperationCount", ctypes.c_ulonglong),
+            ("OtherOperationCount", ctypes.c_ulonglong),
+            ("ReadTransferCount", ctypes.c_ulonglong),
+            ("WriteTransferCount", ctypes.c_ulonglong),
+            ("OtherTransferCount", ctypes.c_ulonglong),
+        ]
+
+    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("PerProcessUserTimeLimit", wintypes.LARGE_INTEGER),
+            ("PerJobUserTimeLimit", wintypes.LARGE_INTEGER),
+            ("LimitFlags", wintypes.DWORD),
+            ("MinimumWorkingSetSize", ctypes.c_size_t),
+            ("MaximumWorkingSetSize", ctypes.c_size_t),
+            ("ActiveProcessLimit", wintypes.DWORD),
+            ("Affinity", ctypes.c_size_t),
+            ("PriorityClass", wintypes.DWORD),
+            ("SchedulingClass", wintypes.DWORD),
+        ]
+
+    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION),
+            ("IoInfo", IO_COUNTERS),
+            ("ProcessMemoryLimit", ctypes.c_size_t),
+            ("JobMemoryLimit", ctypes.c_size_t),
+            ("PeakProcessMemoryUsed", ctypes.c_size_t),
+            ("PeakJobMemoryUsed", ctypes.c_size_t),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+    ok = kernel32.SetInformationJobObject(
+        job,
+        _JOB_OBJECT_EXTENDED_LIMIT_INFORMATION,
+        ctypes.byref(info),
+        ctypes.sizeof(info),
+    )
+    # Popen keeps the native process handle in _handle on Windows
+    if not ok or not kernel32.AssignProcessToJobObject(job, int(process._handle)):  # type: ignore[attr-defined]
+        error = ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+        kernel32.CloseHandle(job)
+        raise error
+
+    return job
+
+
+def _attach_cgroup(pid: int) -> Path:
+    """Move pid into a fresh child of our own cgroup v2 (needs a delegated subtree)"""
+    if not (CGROUP_ROOT / "cgroup.controllers").exists():
+        raise OSError("cgroup v2 unified hierarchy not mounted")
+
+    own_path = ""
+    for line in Path("/proc/self/cgroup").read_text().splitlines():
+        if line.startswith("0::"):
+            own_path = line[3:].lstrip("/")
+            break
+
+    cgroup = CGROUP_ROOT / own_path / f"job-scraper-{pid}"
+    cgroup.mkdir()
+    try:
+        (cgroup / "cgroup.procs").write_text(str(pid))
+    except OSError:
+        cgroup.rmdir()
+        raise
+    return cgroup
+
+
+def _kill_cgroup(cgroup: Path) -> None:
+    """Kill all members: cgroup.kill on 5.14+ kernels, SIGKILL each pid otherwise"""
+    kill_file = cgroup / "cgroup.kill"
+    if kill_file.exists():
+        kill_file.write_text("1")
+        return
+
+    for pid in (cgroup / "cgroup.procs").read_text().split():
+        try:
+            os.kill(int(pid), signal.SIGKILL)
+        except ProcessLookupError:
+            pass
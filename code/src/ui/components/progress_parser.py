@@ -0,0 +1,139 @@
+# Progress Parser - scraper subprocess wire format -> typed events
+# Pure, fully annotated module: optionally compiled with mypyc for the hot path
+#   mypyc src/ui/components/progress_parser.py   (the built extension shadows this file)
+from __future__ import annotations
+
+import sys
+from typing import Callable, TypedDict, cast
+
+import orjson
+
+
+class ScraperResult(TypedDict):
+    jobs_scraped: int
+    expired_removed: int
+    failed: int
+    error: str | None
+
+
+class ProgressEvent(TypedDict, total=False):
+    """Progress event from scraper subprocess"""
+
+    event: str
+    timestamp: float
+    # scraper_start event
+    total_jobs: int
+    num_slots: int
+    # job_dispatch event
+    slot_id: int
+    job_index: int
+    # job_complete event
+    status: str
+    stats: dict[str, int]
+    current_delay: float
+    delay_changed: bool
+    company: str
+    title: str
+    skills_count: int
+    job_id: str
+    error: str
+    # rate_limit event
+    wait_seconds: float
+    # cookie_expired / deadlock_warning event
+    message: str
+    # batch_start event (persistent worker)
+    batch_id: int
+    # scraper_finish event
+    success: int
+    expired: int
+    failed: int
+    total_processed: int
+    # final_result event (last event of stream_scraper_progress)
+    jobs_scraped: int
+    expired_removed: int
+
+
+def _as_int(val: object) -> int:
+    return int(val) if isinstance(val, (int, float)) else 0
+
+
+def _as_float(val: object) -> float:
+    return float(val) if isinstance(val, (int, float)) else 0.0
+
+
+def _as_str(val: object) -> str:
+    return str(val) if val is not None else ""
+
+
+def _as_interned_str(val: object) -> str:
+    # Low-cardinality fields (event type, status, company) repeat across thousands
+    # of events - interning keeps one shared string object per distinct value
+    return sys.intern(str(val)) if val is not None else ""
+
+
+# (field, converter) pairs applied to every PROGRESS event; "stats" is handled separately
+_PROGRESS_SCHEMA: tuple[tuple[str, Callable[[object], object]], ...] = (
+    ("timestamp", _as_float),
+    ("total_jobs", _as_int),
+    ("num_slots", _as_int),
+    ("slot_id", _as_int),
+    ("job_index", _as_int),
+    ("status", _as_interned_str),
+    ("current_delay", _as_float),
+    ("delay_changed", bool),
+    ("company", _as_interned_str),
+    ("title", _as_str),
+    ("skills_count", _as_int),
+    ("job_id", _as_str),
+    ("error", _as_str),
+    ("wait_seconds", _as_float),
+    ("message", _as_str),
+    ("success", _as_int),
+    ("expired", _as_int),
+    ("failed", _as_int),
+    ("total_processed", _as_int),
+    ("batch_id", _as_int),
+)
+
+
+def _coerce_progress_event(raw_event: dict[str, object]) -> None:
+    """Coerce known fields in place via the schema (unknown keys pass through)"""
+    raw_event["event"] = _as_interned_str(raw_event.get("event", ""))
+    for key, convert in _PROGRESS_SCHEMA:
+        if key in raw_event:
+            raw_event[key] = convert(raw_event[key])
+    if "stats" in raw_event:
+        val = raw_event["stats"]
+        if isinstance(val, dict):
+            raw_event["stats"] = {str(k): _as_int(v) for k, v in val.items()}
+        else:
+            del raw_event["stats"]
+
+
+def parse_progress_line(payload: bytes | memoryview) -> ProgressEvent | None:
+    """Parse a PROGRESS: payload into a typed event, None if malformed"""
+    try:
+        raw_event: object = orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(raw_event, dict):
+        return None
+    _coerce_progress_event(raw_event)
+    return cast(ProgressEvent, raw_event)
+
+
+def parse_result_line(line: bytes) -> ScraperResult | None:
+    """Parse the final JSON result line, None if it is not a result"""
+    try:
+        data: object = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or "jobs_scraped" not in data:
+        return None
+    error_val = data.get("error")
+    return ScraperResult(
+        jobs_scraped=_as_int(data.get("jobs_scraped", 0)),
+        expired_removed=_as_int(data.get("expired_removed", 0)),
+        failed=_as_int(data.get("failed", 0)),
+        error=str(error_val) if error_val is not None else None,
+    )
@@ -12,7 +12,7 @@ def render_scraper_form(db_path: str) -> None:
     st.markdown("**LinkedIn** (99.9%+ deduplication) + **Naukri** (Playwright) | Skills extraction included")
     
     # Render 2-platform configuration panel
-    platforms, job_role, location, num_jobs, action = render_two_phase_panel(db_path)
+    platforms, job_role, location, num_jobs, max_in_flight, action = render_two_phase_panel(db_path)
     
     # Execute workflow when scrape button clicked
     if action == "scrape":
@@ -21,5 +21,6 @@ def render_scraper_form(db_path: str) -> None:
             job_role=job_role,
             location=location,
             num_jobs=num_jobs,
-            db_path=db_path
+            db_path=db_path,
+            max_in_flight=max_in_flight,
         ))
@@ -3,23 +3,32 @@
 
 from __future__ import annotations
 
+import html
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Literal, Mapping, Union
+from typing import Callable, Literal, Mapping, Union
 
 import streamlit as st
 
+# Slot cards are repainted at most this often; events in between only mark them dirty
+_RENDER_INTERVAL = 0.1
 
-@dataclass
+_LOG_SLOTS = 5  # Logs kept per slot
+
+_STATUS_ICONS = {"idle": "⚪", "working": "🟡", "done": "🟢", "error": "🔴"}
+_LOG_ICONS = {"error": "🔴", "warning": "🟠", "success": "🟢", "info": "⚪"}
+
+
+@dataclass(slots=True)
 class SlotLog:
     """Single log entry for a slot"""
-    timestamp: datetime
+    timestamp_hms: str  # Local HH:MM:SS, formatted once at creation
     action: str
     details: str
     status: Literal["info", "success", "warning", "error"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotState:
     """State tracking for a single slot"""
     slot_id: int
@@ -29,20 +38,197 @@ class SlotState:
     jobs_processed: int = 0
     jobs_success: int = 0
     jobs_failed: int = 0
-    logs: list[SlotLog] = field(default_factory=list)
+    # Last _LOG_SLOTS logs as a ring of preallocated entries overwritten in place
+    log_ring: list[SlotLog] = field(
+        default_factory=lambda: [SlotLog("", "", "", "info") for _ in range(_LOG_SLOTS)]
+    )
+    log_idx: int = 0  # Next entry to overwrite
+    log_count: int = 0
     last_error: str = ""
+    # Card text (truncated, HTML-escaped), built once when the value changes
+    # rather than on every repaint
+    display_job_id: str = ""
+    display_error: str = ""
+
+    def set_current_job(self, job_id: str) -> None:
+        self.current_job_id = job_id
+        self.display_job_id = html.escape(job_id[:15] + "..." if len(job_id) > 15 else job_id)
+
+    def set_error(self, error: str) -> None:
+        self.last_error = error
+        self.display_error = html.escape(error[:30])
 
     def add_log(self, action: str, details: str, status: Literal["info", "success", "warning", "error"] = "info"):
-        """Add a log entry (keeps last 5 logs)"""
-        self.logs.append(SlotLog(
-            timestamp=datetime.now(),
-            action=action,
-            details=details,
-            status=status
-        ))
-        # Keep only last 5 logs per slot
-        if len(self.logs) > 5:
-            self.logs = self.logs[-5:]
+        """Add a log entry (keeps last 5 logs, overwriting the oldest)"""
+        entry = self.log_ring[self.log_idx]
+        entry.timestamp_hms = time.strftime("%H:%M:%S")
+        entry.action = action
+        entry.details = details
+        entry.status = status
+        self.log_idx = (self.log_idx + 1) % _LOG_SLOTS
+        if self.log_count < _LOG_SLOTS:
+            self.log_count += 1
+
+    def recent_logs(self, limit: int = _LOG_SLOTS) -> list[SlotLog]:
+        """Up to limit logs, newest first"""
+        return [
+            self.log_ring[(self.log_idx - 1 - i) % _LOG_SLOTS]
+            for i in range(min(limit, self.log_count))
+        ]
+
+
+_SlotEvent = Mapping[str, Union[str, int, float, bool, None, dict[str, int]]]
+
+
+def _finish_job(slot: SlotState, status: Literal["done", "error"], failed: bool = False) -> None:
+    slot.status = status
+    slot.jobs_processed += 1
+    if failed:
+        slot.jobs_failed += 1
+    slot.set_current_job("")
+
+
+def _on_slot_navigate(slot: SlotState, event: _SlotEvent) -> None:
+    slot.status = "working"
+    slot.set_current_job(str(event.get("job_id", ""))[:20])
+    slot.current_url = str(event.get("url", ""))
+    slot.add_log("Navigate", f"Loading {slot.current_job_id}", "info")
+
+
+def _on_slot_extracting(slot: SlotState, event: _SlotEvent) -> None:
+    slot.add_log("Extract", "Parsing job details", "info")
+
+
+def _on_slot_success(slot: SlotState, event: _SlotEvent) -> None:
+    _finish_job(slot, "done")
+    slot.jobs_success += 1
+    company = str(event.get("company", "Unknown"))[:20]
+    slot.add_log("Success", f"Scraped: {company}", "success")
+    slot.set_error("")
+
+
+def _on_slot_expired(slot: SlotState, event: _SlotEvent) -> None:
+    _finish_job(slot, "done")
+    reason = str(event.get("reason", "Expired"))[:30]
+    slot.add_log("Expired", reason, "warning")
+
+
+def _on_slot_error(slot: SlotState, event: _SlotEvent) -> None:
+    _finish_job(slot, "error", failed=True)
+    error = str(event.get("error", "Unknown error"))[:50]
+    slot.set_error(error)
+    slot.add_log("Error", error, "error")
+
+
+def _on_slot_authwall(slot: SlotState, event: _SlotEvent) -> None:
+    _finish_job(slot, "error", failed=True)
+    slot.set_error("Authwall/Login redirect")
+    slot.add_log("Authwall", "Login page detected", "error")
+
+
+def _on_slot_timeout(slot: SlotState, event: _SlotEvent) -> None:
+    _finish_job(slot, "error", failed=True)
+    timeout_sec = event.get("timeout", 15)
+    slot.set_error(f"Timeout ({timeout_sec}s)")
+    slot.add_log("Timeout", f"Exceeded {timeout_sec}s limit", "error")
+
+
+def _on_slot_reset(slot: SlotState, event: _SlotEvent) -> None:
+    slot.status = "idle"
+    slot.set_current_job("")
+    slot.add_log("Reset", "Slot cleared for next job", "info")
+
+
+def _on_slot_idle(slot: SlotState, event: _SlotEvent) -> None:
+    slot.status = "idle"
+    slot.set_current_job("")
+    slot.add_log("Idle", "Slot ready for next job", "info")
+
+
+def _on_slot_warning(slot: SlotState, event: _SlotEvent) -> None:
+    # Slow task warning (10s elapsed)
+    elapsed = event.get("elapsed", 0)
+    slot.add_log("Warning", f"Slow task - {elapsed:.0f}s", "warning")
+
+
+def _on_job_dispatch(slot: SlotState, event: _SlotEvent) -> None:
+    slot.status = "working"
+    slot.set_current_job(str(event.get("job_id", ""))[:20])
+    slot.add_log("Dispatch", "Job assigned", "info")
+
+
+def _on_job_complete(slot: SlotState, event: _SlotEvent) -> None:
+    status = event.get("status", "unknown")
+    if status == "success":
+        _finish_job(slot, "done")
+        slot.jobs_success += 1
+        company = str(event.get("company", ""))[:20]
+        slot.add_log("Complete", f"Success: {company}", "success")
+    elif status == "expired":
+        _finish_job(slot, "done")
+        error = str(event.get("error", "Expired"))[:30]
+        slot.add_log("Complete", f"Expired: {error}", "warning")
+    else:
+        _finish_job(slot, "error", failed=True)
+        error = str(event.get("error", "Failed"))[:30]
+        slot.set_error(error)
+        slot.add_log("Complete", f"Failed: {error}", "error")
+
+
+# Per-slot events (deadlock_warning is global and handled by SlotMonitor itself)
+_SLOT_EVENT_HANDLERS: dict[str, Callable[[SlotState, _SlotEvent], None]] = {
+    "slot_navigate": _on_slot_navigate,
+    "slot_extracting": _on_slot_extracting,
+    "slot_success": _on_slot_success,
+    "slot_expired": _on_slot_expired,
+    "slot_error": _on_slot_error,
+    "slot_authwall": _on_slot_authwall,
+    "slot_timeout": _on_slot_timeout,
+    "slot_reset": _on_slot_reset,
+    "slot_idle": _on_slot_idle,
+    "slot_warning": _on_slot_warning,
+    "job_dispatch": _on_job_dispatch,
+    "job_complete": _on_job_complete,
+}
+
+
+# Status box per slot state: (background, text); idle has no box
+_STATUS_BOX_TMPL = (
+    '<div style="background: {bg}; padding: 6px 10px; border-radius: 6px; '
+    'margin: 4px 0;">{text}</div>'
+)
+_INFO_BG = "rgba(28, 131, 225, 0.1)"
+_ERROR_BG = "rgba(255, 43, 43, 0.09)"
+_SUCCESS_BG = "rgba(33, 195, 84, 0.1)"
+_CAPTION_STYLE = 'style="font-size: 12px; color: #888;"'
+
+
+def _slot_card_html(slot: SlotState) -> str:
+    """Header, counters, current job / error and the two newest logs as one block"""
+    icon = _STATUS_ICONS.get(slot.status, "⚪")
+    parts = [
+        f"<div><b>{icon} Slot {slot.slot_id}</b></div>",
+        f"<div {_CAPTION_STYLE}>✅ {slot.jobs_success} | ❌ {slot.jobs_failed} | 📊 {slot.jobs_processed}</div>",
+    ]
+
+    # Current job info
+    if slot.status == "working" and slot.current_job_id:
+        parts.append(_STATUS_BOX_TMPL.format(bg=_INFO_BG, text=f"🔄 {slot.display_job_id}"))
+    elif slot.status == "error" and slot.last_error:
+        parts.append(_STATUS_BOX_TMPL.format(bg=_ERROR_BG, text=f"⚠️ {slot.display_error}"))
+    elif slot.status == "done":
+        parts.append(_STATUS_BOX_TMPL.format(bg=_SUCCESS_BG, text="✓ Ready"))
+    else:
+        parts.append("<div><i>Idle</i></div>")
+
+    # Recent logs - newest first, last 2 only
+    if slot.log_count:
+        parts.append(f"<div {_CAPTION_STYLE}><b>Recent:</b></div>")
+        parts.extend(
+            f"<div>{_LOG_ICONS.get(log.status, '⚪')} <code>{log.timestamp_hms}</code> {html.escape(log.action)}</div>"
+            for log in slot.recent_logs(2)
+        )
+    return "".join(parts)
 
 
 class SlotMonitor:
@@ -57,6 +243,9 @@ class SlotMonitor:
         self.slot_placeholders: dict[int, st.delta_generator.DeltaGenerator] = {}
         # Global alert placeholder for deadlock warnings
         self.alert_placeholder: st.delta_generator.DeltaGenerator | None = None
+        # Slots changed since their last repaint
+        self._dirty: set[int] = set()
+        self._last_flush = 0.0
 
     def setup_ui(self) -> None:
         """Create the slot monitor UI layout with st.empty() placeholders"""
@@ -81,55 +270,17 @@ class SlotMonitor:
                     slot_idx += 1
 
     def _render_slot(self, slot_id: int) -> None:
-        """Render a single slot's status card using placeholder.container()"""
+        """Render a single slot's status card into its placeholder"""
         slot = self.slots[slot_id]
         placeholder = self.slot_placeholders.get(slot_id)
 
         if not placeholder:
             return
 
-        # Use placeholder.container() to replace all content at once
-        with placeholder.container():
-            # Status indicator and header
-            status_icons = {
-                "idle": "⚪",
-                "working": "🟡",
-                "done": "🟢",
-                "error": "🔴"
-            }
-            icon = status_icons.get(slot.status, "⚪")
-
-            # Slot header with stats
-            st.markdown(f"**{icon} Slot {slot_id}**")
-            st.caption(f"✅ {slot.jobs_success} | ❌ {slot.jobs_failed} | 📊 {slot.jobs_processed}")
-
-            # Current job info
-            if slot.status == "working" and slot.current_job_id:
-                job_display = slot.current_job_id[:15] + "..." if len(slot.current_job_id) > 15 else slot.current_job_id
-                st.info(f"🔄 {job_display}")
-            elif slot.status == "error" and slot.last_error:
-                st.error(f"⚠️ {slot.last_error[:30]}")
-            elif slot.status == "done":
-                st.success("✓ Ready")
-            else:
-                st.markdown("_Idle_")
-
-            # Recent logs - simplified display (no expander for better real-time updates)
-            if slot.logs:
-                st.caption("**Recent:**")
-                for log in reversed(slot.logs[-2:]):  # Show last 2 only
-                    time_str = log.timestamp.strftime("%H:%M:%S")
-                    log_text = f"`{time_str}` {log.action}"
-                    if log.status == "error":
-                        st.markdown(f"🔴 {log_text}")
-                    elif log.status == "warning":
-                        st.markdown(f"🟠 {log_text}")
-                    elif log.status == "success":
-                        st.markdown(f"🟢 {log_text}")
-                    else:
-                        st.markdown(f"⚪ {log_text}")
-
-    def update_from_event(self, event: Mapping[str, Union[str, int, float, bool, None, dict[str, int]]]) -> None:
+        # The whole card is one markdown element: a repaint is one delta, not 6-8
+        placeholder.markdown(_slot_card_html(slot), unsafe_allow_html=True)
+
+    def update_from_event(self, event: _SlotEvent) -> None:
         """Update slot state from a progress event"""
         event_type = event.get("event", "")
         slot_id = event.get("slot_id")
@@ -143,9 +294,9 @@ class SlotMonitor:
             for s in self.slots.values():
                 if s.status == "working":
                     s.add_log("Deadlock", message, "error")
-            # Re-render all slots
-            for sid in self.slots:
-                self._render_slot(sid)
+            # Re-render all slots now - the alert must not wait for the throttle
+            self._dirty.update(self.slots)
+            self.flush()
             return
 
         # For slot-specific events, check slot_id
@@ -154,104 +305,25 @@ class SlotMonitor:
 
         slot = self.slots[slot_id]
 
-        if event_type == "slot_navigate":
-            slot.status = "working"
-            slot.current_job_id = str(event.get("job_id", ""))[:20]
-            slot.current_url = str(event.get("url", ""))
-            slot.add_log("Navigate", f"Loading {slot.current_job_id}", "info")
-
-        elif event_type == "slot_extracting":
-            slot.add_log("Extract", "Parsing job details", "info")
-
-        elif event_type == "slot_success":
-            slot.status = "done"
-            slot.jobs_processed += 1
-            slot.jobs_success += 1
-            company = str(event.get("company", "Unknown"))[:20]
-            slot.add_log("Success", f"Scraped: {company}", "success")
-            slot.current_job_id = ""
-            slot.last_error = ""
-
-        elif event_type == "slot_expired":
-            slot.status = "done"
-            slot.jobs_processed += 1
-            reason = str(event.get("reason", "Expired"))[:30]
-            slot.add_log("Expired", reason, "warning")
-            slot.current_job_id = ""
-
-        elif event_type == "slot_error":
-            slot.status = "error"
-            slot.jobs_processed += 1
-            slot.jobs_failed += 1
-            error = str(event.get("error", "Unknown error"))[:50]
-            slot.last_error = error
-            slot.add_log("Error", error, "error")
-            slot.current_job_id = ""
-
-        elif event_type == "slot_authwall":
-            slot.status = "error"
-            slot.jobs_processed += 1
-            slot.jobs_failed += 1
-            slot.last_error = "Authwall/Login redirect"
-            slot.add_log("Authwall", "Login page detected", "error")
-            slot.current_job_id = ""
-
-        elif event_type == "slot_timeout":
-            slot.status = "error"
-            slot.jobs_processed += 1
-            slot.jobs_failed += 1
-            timeout_sec = event.get("timeout", 15)
-            slot.last_error = f"Timeout ({timeout_sec}s)"
-            slot.add_log("Timeout", f"Exceeded {timeout_sec}s limit", "error")
-            slot.current_job_id = ""
-
-        elif event_type == "slot_reset":
-            slot.status = "idle"
-            slot.current_job_id = ""
-            slot.add_log("Reset", "Slot cleared for next job", "info")
-
-        elif event_type == "slot_idle":
-            slot.status = "idle"
-            slot.current_job_id = ""
-            slot.add_log("Idle", "Slot ready for next job", "info")
-
-        elif event_type == "slot_warning":
-            # Slow task warning (10s elapsed)
-            elapsed = event.get("elapsed", 0)
-            slot.add_log("Warning", f"Slow task - {elapsed:.0f}s", "warning")
-
-        # Note: deadlock_warning is handled at the top of this method (global event)
-
-        elif event_type == "job_dispatch":
-            # Also handle the existing job_dispatch event
-            slot.status = "working"
-            slot.current_job_id = str(event.get("job_id", ""))[:20]
-            slot.add_log("Dispatch", "Job assigned", "info")
-
-        elif event_type == "job_complete":
-            status = event.get("status", "unknown")
-            slot.jobs_processed += 1
-
-            if status == "success":
-                slot.status = "done"
-                slot.jobs_success += 1
-                company = str(event.get("company", ""))[:20]
-                slot.add_log("Complete", f"Success: {company}", "success")
-            elif status == "expired":
-                slot.status = "done"
-                error = str(event.get("error", "Expired"))[:30]
-                slot.add_log("Complete", f"Expired: {error}", "warning")
-            else:
-                slot.status = "error"
-                slot.jobs_failed += 1
-                error = str(event.get("error", "Failed"))[:30]
-                slot.last_error = error
-                slot.add_log("Complete", f"Failed: {error}", "error")
-
-            slot.current_job_id = ""
-
-        # Re-render the slot (slot_id is already validated as int at line 152)
-        self._render_slot(slot_id)
+        handler = _SLOT_EVENT_HANDLERS.get(str(event_type))
+        if handler is None:
+            return
+        handler(slot, event)
+
+        # Repaint on the next flush window (slot_id is already validated as int above)
+        self._dirty.add(slot_id)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= _RENDER_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Repaint every slot changed since the last flush (call once events stop)"""
+        for slot_id in sorted(self._dirty):
+            self._render_slot(slot_id)
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
 
     def refresh_all(self) -> None:
         """Refresh all slot displays"""
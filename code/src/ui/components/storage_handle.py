@@ -0,0 +1,17 @@
+# Storage Handle - one JobStorageOperations per database for the whole UI
+# Schema init and WAL pragmas run once per process instead of on every rerun
+import streamlit as st
+
+from src.db.operations import JobStorageOperations
+
+
+@st.cache_resource(show_spinner=False)
+def get_db_ops(db_path: str) -> JobStorageOperations:
+    """Shared storage handle (connections are opened per call, so it is thread-safe)"""
+    return JobStorageOperations(db_path)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def count_unscraped(db_path: str, platform: str, job_role: str) -> int:
+    """Unscraped URL count shared by the link and detail forms - .clear() after writes"""
+    return get_db_ops(db_path).count_unscraped(platform, job_role)
@@ -1,20 +1,22 @@
 """
 Validation Dashboard Component
 Full batch validation and fix for all jobs in database
-Uses Node.js for speed (~60+ jobs/sec)
+Matches every skill pattern in one RE2 pass per job (~500+ jobs/sec)
 """
 
 import json
-import sqlite3
-import subprocess
-from pathlib import Path
+from collections import Counter
+from typing import Callable, TypedDict
 
 import streamlit as st
 
+from src.db.connection import open_db
+from src.validation.pattern_set import SkillPatternSet
+
 
 def get_job_count(db_path: str) -> int:
     """Get total job count with descriptions"""
-    conn = sqlite3.connect(db_path)
+    conn = open_db(db_path, read_only=True)
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL")
     count = cursor.fetchone()[0]
@@ -22,132 +24,42 @@ def get_job_count(db_path: str) -> int:
     return count
 
 
+@st.cache_resource(show_spinner=False)
+def _load_matcher(skills_ref_path: str) -> SkillPatternSet:
+    """Skill patterns compiled once per reference file, shared by every run"""
+    with open(skills_ref_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return SkillPatternSet(
+        (skill["name"], skill.get("patterns", [])) for skill in data["skills"]
+    )
+
+
+class BatchValidationResult(TypedDict):
+    processed: int
+    total: int
+    updated: int
+    fpRemoved: int
+    fnAdded: int
+    topFps: list[tuple[str, int]]
+    topFns: list[tuple[str, int]]
+    error: str | None
+
+
+# (processed, total, updated, FP removed, FN added)
+ProgressCallback = Callable[[int, int, int, int, int], None]
+
+
 def run_batch_validation(
     db_path: str,
     skills_ref_path: str,
-    progress_callback,
+    progress_callback: ProgressCallback | None = None,
     batch_size: int = 500,
-) -> dict:
+) -> BatchValidationResult:
     """
-    Run batch validation using Node.js for speed.
+    Run batch validation in-process: one RE2 pass per job description.
     Returns stats dict with FP/FN counts.
     """
-    # Node.js script for batch validation with progress
-    node_script = f"""
-const fs = require('fs');
-const Database = require('better-sqlite3');
-
-const skillsData = JSON.parse(fs.readFileSync('{skills_ref_path}', 'utf8'));
-
-// Build skill pattern map
-const skillPatterns = [];
-for (const skill of skillsData.skills) {{
-    const regexes = [];
-    for (const p of skill.patterns || []) {{
-        try {{ regexes.push(new RegExp(p, 'i')); }} catch (e) {{}}
-    }}
-    if (regexes.length) {{
-        skillPatterns.push({{ name: skill.name, regexes }});
-    }}
-}}
-
-function findSkillsInText(text) {{
-    const found = new Set();
-    for (const {{ name, regexes }} of skillPatterns) {{
-        for (const r of regexes) {{
-            if (r.test(text)) {{
-                found.add(name);
-                break;
-            }}
-        }}
-    }}
-    return found;
-}}
-
-const db = new Database('{db_path}');
-const totalCount = db.prepare('SELECT COUNT(*) as c FROM jobs WHERE job_description IS NOT NULL').get().c;
-
-const selectStmt = db.prepare('SELECT job_id, job_description, skills FROM jobs WHERE job_description IS NOT NULL');
-const updateStmt = db.prepare('UPDATE jobs SET skills = ? WHERE job_id = ?');
-
-let processed = 0;
-let updated = 0;
-let totalFpRemoved = 0;
-let totalFnAdded = 0;
-const fpCounts = {{}};
-const fnCounts = {{}};
-
-db.exec('BEGIN');
-
-for (const job of selectStmt.iterate()) {{
-    const jobDesc = job.job_description || '';
-    const oldSkills = new Set((job.skills || '').split(',').map(s => s.trim()).filter(s => s));
-    const patternMatchedSkills = findSkillsInText(jobDesc);
-
-    const falsePositives = [...oldSkills].filter(s => !patternMatchedSkills.has(s));
-    const falseNegatives = [...patternMatchedSkills].filter(s => !oldSkills.has(s));
-
-    for (const fp of falsePositives) {{
-        fpCounts[fp] = (fpCounts[fp] || 0) + 1;
-        totalFpRemoved++;
-    }}
-    for (const fn of falseNegatives) {{
-        fnCounts[fn] = (fnCounts[fn] || 0) + 1;
-        totalFnAdded++;
-    }}
-
-    const newSkills = [...patternMatchedSkills].sort().join(', ');
-    const oldSkillsStr = [...oldSkills].sort().join(', ');
-
-    if (newSkills !== oldSkillsStr) {{
-        updateStmt.run(newSkills, job.job_id);
-        updated++;
-    }}
-
-    processed++;
-
-    if (processed % {batch_size} === 0) {{
-        console.log(JSON.stringify({{
-            type: 'progress',
-            processed,
-            total: totalCount,
-            updated,
-            fpRemoved: totalFpRemoved,
-            fnAdded: totalFnAdded
-        }}));
-    }}
-}}
-
-db.exec('COMMIT');
-db.close();
-
-// Top 10 FP and FN
-const topFps = Object.entries(fpCounts).sort((a, b) => b[1] - a[1]).slice(0, 10);
-const topFns = Object.entries(fnCounts).sort((a, b) => b[1] - a[1]).slice(0, 10);
-
-console.log(JSON.stringify({{
-    type: 'complete',
-    processed,
-    total: totalCount,
-    updated,
-    fpRemoved: totalFpRemoved,
-    fnAdded: totalFnAdded,
-    topFps,
-    topFns
-}}));
-"""
-
-    # Run Node.js script
-    code_dir = Path(db_path).parent.parent
-    process = subprocess.Popen(
-        ["node", "-e", node_script],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd=str(code_dir),
-    )
-
-    result = {
+    result: BatchValidationResult = {
         "processed": 0,
         "total": 0,
         "updated": 0,
@@ -158,38 +70,65 @@ console.log(JSON.stringify({{
         "error": None,
     }
 
-    # Read output line by line for progress updates
-    for line in process.stdout:
-        line = line.strip()
-        if not line:
-            continue
+    try:
+        matcher = _load_matcher(skills_ref_path)
+
+        conn = open_db(db_path)
         try:
-            data = json.loads(line)
-            if data.get("type") == "progress":
-                progress_callback(
-                    data["processed"],
-                    data["total"],
-                    data["updated"],
-                    data["fpRemoved"],
-                    data["fnAdded"],
-                )
-            elif data.get("type") == "complete":
-                result = data
-                progress_callback(
-                    data["processed"],
-                    data["total"],
-                    data["updated"],
-                    data["fpRemoved"],
-                    data["fnAdded"],
-                )
-        except json.JSONDecodeError:
-            pass
-
-    process.wait()
-
-    if process.returncode != 0:
-        stderr = process.stderr.read()
-        result["error"] = stderr
+            total = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL"
+            ).fetchone()[0]
+
+            processed = 0
+            fp_counts: Counter[str] = Counter()
+            fn_counts: Counter[str] = Counter()
+            updates: list[tuple[str, str]] = []  # Applied after the scan, in one transaction
+
+            rows = conn.execute(
+                "SELECT job_id, job_description, skills FROM jobs WHERE job_description IS NOT NULL"
+            )
+            for job_id, job_desc, skills in rows:
+                old_skills = set(filter(None, map(str.strip, (skills or "").split(","))))
+                pattern_matched = matcher.search(job_desc or "")
+
+                fp_counts.update(old_skills - pattern_matched)
+                fn_counts.update(pattern_matched - old_skills)
+
+                new_skills = ", ".join(sorted(pattern_matched))
+                if new_skills != ", ".join(sorted(old_skills)):
+                    updates.append((new_skills, job_id))
+
+                processed += 1
+
+                if progress_callback is not None and processed % batch_size == 0:
+                    progress_callback(
+                        processed,
+                        total,
+                        len(updates),
+                        fp_counts.total(),
+                        fn_counts.total(),
+                    )
+
+            with conn:
+                conn.executemany("UPDATE jobs SET skills = ? WHERE job_id = ?", updates)
+        finally:
+            conn.close()
+
+        result.update(
+            processed=processed,
+            total=total,
+            updated=len(updates),
+            fpRemoved=fp_counts.total(),
+            fnAdded=fn_counts.total(),
+            topFps=fp_counts.most_common(10),
+            topFns=fn_counts.most_common(10),
+        )
+        if progress_callback is not None:
+            progress_callback(
+                processed, total, len(updates), fp_counts.total(), fn_counts.total()
+            )
+    except Exception as e:
+        result["error"] = str(e)
 
     return result
 
@@ -206,7 +145,7 @@ def render_validation_dashboard(db_path: str) -> None:
     with col1:
         st.metric("Total Jobs with Descriptions", f"{job_count:,}")
     with col2:
-        est_time = job_count / 60  # ~60 jobs/sec
+        est_time = job_count / 500  # ~500 jobs/sec
         st.metric("Estimated Time", f"~{est_time:.0f} seconds")
 
     st.divider()
@@ -242,7 +181,9 @@ def render_validation_dashboard(db_path: str) -> None:
         status_container = st.empty()
         metrics_container = st.empty()
 
-        def update_progress(processed, total, updated, fp_removed, fn_added):
+        def update_progress(
+            processed: int, total: int, updated: int, fp_removed: int, fn_added: int
+        ) -> None:
             pct = processed / total if total > 0 else 0
             progress_bar.progress(
                 pct, text=f"Processing... {processed:,}/{total:,} jobs"
@@ -9,40 +9,40 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 
 import asyncio
 import logging
-import sqlite3
 
-from playwright.async_api import Browser, async_playwright
+import aiohttp
+from bs4 import BeautifulSoup
+
+from src.db.connection import open_db
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
-async def check_if_url_expired(url: str, browser: Browser) -> bool:
-    """Check if a single URL returns 404"""
-    context = await browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    )
-    page = await context.new_page()
 
+# Expired job pages: 404 title (or bare "LinkedIn") plus one of these in the h1
+ERROR_INDICATORS = ("not found", "404", "لم يتم العثور", "expired", "unavailable")
+
+
+async def check_if_url_expired(url: str, session: aiohttp.ClientSession) -> bool:
+    """Check if a single URL returns 404 (status, or LinkedIn's not-found page)"""
     try:
-        await page.goto(url, timeout=15000, wait_until="domcontentloaded")
-        await asyncio.sleep(1)  # Brief wait for page to render
+        async with session.get(url, allow_redirects=True) as response:
+            if response.status in (404, 410):
+                return True
+            if response.status != 200:
+                return False  # Rate limited (429/999) or similar - not proof of expiry
+            html = await response.text(errors="replace")
 
         # Check page title
-        page_title = await page.title()
+        soup = BeautifulSoup(html, "lxml")
+        page_title = soup.title.get_text(strip=True) if soup.title else ""
         if "404" in page_title or page_title == "LinkedIn":
-            h1_elem = await page.query_selector("h1")
+            h1_elem = soup.find("h1")
             if h1_elem:
-                h1_text = await h1_elem.inner_text()
-                error_indicators = [
-                    "not found",
-                    "404",
-                    "لم يتم العثور",
-                    "expired",
-                    "unavailable",
-                ]
-                if any(indicator in h1_text.lower() for indicator in error_indicators):
+                h1_text = h1_elem.get_text(" ", strip=True).lower()
+                if any(indicator in h1_text for indicator in ERROR_INDICATORS):
                     return True  # It's expired
 
         return False  # Valid URL
@@ -50,23 +50,26 @@ async def check_if_url_expired(url: str, browser: Browser) -> bool:
     except Exception as e:
         logger.warning(f"Error checking URL {url[:50]}: {e}")
         return False  # Assume valid on error to be safe
-    finally:
-        await page.close()
-        await context.close()
 
 
 async def cleanup_expired_urls(
-    db_path: str = "data/jobs.db", batch_size: int = 50, max_check: int = 100
+    db_path: str = "data/jobs.db",
+    batch_size: int = 50,
+    max_check: int = 100,
+    concurrency: int = 5,
+    rate: float = 10.0,
 ):
     """
     Check unscraped URLs and mark expired ones as processed
 
     Args:
         db_path: Path to SQLite database
-        batch_size: Number of URLs to check in parallel
+        batch_size: Number of URLs checked (and committed) per batch
         max_check: Maximum URLs to check (prevent long runtime)
+        concurrency: Maximum requests in flight (keep low to avoid rate limits)
+        rate: Maximum requests started per second (0 = no cap)
     """
-    conn = sqlite3.connect(db_path)
+    conn = open_db(db_path)
     cursor = conn.cursor()
 
     # Get unscraped LinkedIn URLs
@@ -92,11 +95,25 @@ async def cleanup_expired_urls(
     expired_count = 0
     valid_count = 0
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False
-        )  # Always visible browser to avoid rate limits
-
+    semaphore = asyncio.Semaphore(concurrency)
+    interval = 1.0 / rate if rate > 0 else 0.0
+    next_start = 0.0  # Loop time the next request may start
+
+    async def check(url: str) -> bool:
+        nonlocal next_start
+        async with semaphore:
+            # Space request starts `interval` apart - caps QPS, not just concurrency
+            now = asyncio.get_running_loop().time()
+            wait = next_start - now
+            next_start = max(now, next_start) + interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await check_if_url_expired(url, session)
+
+    async with aiohttp.ClientSession(
+        headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as session:
         # Process in batches
         for i in range(0, len(unscraped_urls), batch_size):
             batch = unscraped_urls[i : i + batch_size]
@@ -104,31 +121,30 @@ async def cleanup_expired_urls(
                 f"📦 Processing batch {i // batch_size + 1}/{(len(unscraped_urls) - 1) // batch_size + 1}..."
             )
 
-            # Check each URL in batch sequentially (avoid overwhelming LinkedIn)
-            for url in batch:
-                is_expired = await check_if_url_expired(url, browser)
+            # Check the batch concurrently, at most `concurrency` requests in flight
+            results = await asyncio.gather(*(check(url) for url in batch))
 
+            expired_in_batch: list[tuple[str]] = []
+            for url, is_expired in zip(batch, results):
                 if is_expired:
-                    # Mark as scraped to skip in future
-                    cursor.execute(
-                        """
-                        UPDATE job_urls
-                        SET scraped = 1
-                        WHERE url = ?
-                    """,
-                        (url,),
-                    )
-                    conn.commit()
+                    expired_in_batch.append((url,))
                     expired_count += 1
                     logger.info(f"🗑️  Marked expired: {url[:70]}")
                 else:
                     valid_count += 1
                     logger.info(f"✅ Valid: {url[:70]}")
 
-                # Brief delay between checks
-                await asyncio.sleep(2)
-
-        await browser.close()
+            # Mark as scraped to skip in future - one transaction per batch
+            if expired_in_batch:
+                cursor.executemany(
+                    """
+                    UPDATE job_urls
+                    SET scraped = 1
+                    WHERE url = ?
+                """,
+                    expired_in_batch,
+                )
+                conn.commit()
 
     conn.close()
 
@@ -145,7 +161,9 @@ if __name__ == "__main__":
     parser.add_argument("--db", default="data/jobs.db", help="Database path")
     parser.add_argument("--batch", type=int, default=50, help="Batch size")
     parser.add_argument("--max", type=int, default=100, help="Maximum URLs to check")
+    parser.add_argument("--concurrency", type=int, default=5, help="Requests in flight")
+    parser.add_argument("--rate", type=float, default=10.0, help="Requests per second (0 = no cap)")
 
     args = parser.parse_args()
 
-    asyncio.run(cleanup_expired_urls(args.db, args.batch, args.max))
+    asyncio.run(cleanup_expired_urls(args.db, args.batch, args.max, args.concurrency, args.rate))
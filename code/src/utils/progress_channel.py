@@ -0,0 +1,118 @@
+# Progress Channel - length-prefixed frames from scraper subprocess to the UI
+# Frame: >I payload length | 1 byte kind (P=progress, R=result) | orjson payload
+from __future__ import annotations
+
+import atexit
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Callable
+
+import orjson
+
+# Parent passes the write end of a dedicated pipe and names it here (POSIX only)
+PROGRESS_FD_ENV = "SCRAPER_PROGRESS_FD"
+
+FRAME_HEADER = struct.Struct(">Ic")
+KIND_PROGRESS = b"P"
+KIND_RESULT = b"R"
+
+# Popped so grandchildren (which don't inherit the fd) never try to use it
+_fd_value = os.environ.pop(PROGRESS_FD_ENV, "")
+_fd: int | None = int(_fd_value) if _fd_value else None
+
+
+def _encode(kind: bytes, payload: object) -> bytes:
+    """One frame on the fd channel, else one PROGRESS: / JSON line for stdout"""
+    body = orjson.dumps(payload)
+    if _fd is not None:
+        return FRAME_HEADER.pack(len(body), kind) + body
+    if kind == KIND_PROGRESS:
+        return b"PROGRESS:" + body + b"\n"
+    return body + b"\n"
+
+
+def _write_out(data: bytes) -> None:
+    if _fd is None:
+        sys.stdout.flush()  # Keep ordering with text already printed
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+    view = memoryview(data)
+    while view:
+        written = os.write(_fd, view)
+        view = view[written:]
+
+
+class ProgressBatcher:
+    """Coalesce encoded events into one write per max_events or max_delay seconds
+
+    A daemon thread flushes stragglers so a quiet scraper never leaves the
+    last event sitting in the buffer.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], None],
+        max_events: int = 16,
+        max_delay: float = 0.05,
+    ) -> None:
+        self._write = write
+        self.max_events = max_events
+        self.max_delay = max_delay
+        self._pending: list[bytes] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+
+    def add(self, chunk: bytes) -> None:
+        with self._lock:
+            self._pending.append(chunk)
+            if (
+                len(self._pending) >= self.max_events
+                or time.monotonic() - self._last_flush >= self.max_delay
+            ):
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name="progress-flush", daemon=True
+                )
+                self._flusher.start()
+
+    def flush(self, trailer: bytes = b"") -> None:
+        """Write everything pending, followed by trailer, in one write"""
+        with self._lock:
+            if trailer:
+                self._pending.append(trailer)
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._write(data)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.max_delay)
+            with self._lock:
+                if self._pending and time.monotonic() - self._last_flush >= self.max_delay:
+                    self._flush_locked()
+
+
+_batcher = ProgressBatcher(_write_out)
+atexit.register(_batcher.flush)  # Don't lose the tail on a plain exit
+
+
+def write_progress(event: object) -> None:
+    """Queue one progress event; it reaches the parent within max_delay"""
+    _batcher.add(_encode(KIND_PROGRESS, event))
+
+
+def write_result(result: object) -> None:
+    """Send the final result immediately, after any progress still queued"""
+    _batcher.flush(_encode(KIND_RESULT, result))
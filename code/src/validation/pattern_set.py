@@ -0,0 +1,221 @@
+"""Skill Pattern Set - one linear-time scan for every skill in the reference
+
+RE2 (google-re2) matches all skill regexes in a single DFA pass over the text,
+so the cost no longer grows with the number of patterns, and a hostile pattern
+cannot backtrack exponentially. RE2 only nominates candidates; each candidate
+is confirmed with the skill's Python pattern, so results are exactly what
+the per-pattern re loops returned (Unicode \\b and \\s included). Confirmation
+uses the `regex` module (re-compatible syntax) for its per-search timeout, on
+text whose non-ASCII chars are swapped for stand-ins both engines agree on.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import string
+from typing import Iterable
+
+import re2
+import regex
+
+logger = logging.getLogger(__name__)
+
+# Headroom over RE2's 8 MB default - a Set whose DFA runs out of memory
+# mid-scan reports no matches at all instead of failing loudly
+_RE2_MAX_MEM = 64 << 20
+
+# Descriptions remembered per pattern set (~1 KB each with the skill set)
+_CACHE_SIZE = 10_000
+
+# Per-skill budget for a Python-side search; a pattern that blows it counts as no match
+_MATCH_TIMEOUT = 0.05
+
+
+def _case_fold_pattern(pattern: str) -> str:
+    """Lowercase literals but not escapes (\\S and \\s differ) - dedupe key only"""
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group()[0] == "\\" else m.group().lower(),
+        pattern,
+    )
+
+
+def _ascii_letter(char: str) -> str | None:
+    """ASCII letter Python's re equates char with under IGNORECASE (KELVIN SIGN -> k)"""
+    return next(
+        (c for c in string.ascii_lowercase if re.fullmatch(c, char, re.IGNORECASE)), None
+    )
+
+
+class _ConfirmMap(dict[int, str]):
+    """str.translate table: chars -> stand-ins the regex module classifies as re does
+
+    Confirmation runs on the regex module (for its timeout), which disagrees with
+    re on some Unicode: combining marks and superscripts flip \\w, U+001C-U+001F
+    flip \\s, and dotless/dotted i stop matching "I". Patterns are pure ASCII, so
+    a char only matters through its ASCII case twin and its \\w/\\d/\\s class under
+    re - map it to a char with exactly that behaviour in both engines.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        letter = _ascii_letter(char)
+        if letter is not None:
+            mapped = letter
+        elif char.isspace():
+            mapped = "\u00a0"  # NO-BREAK SPACE: \s, matches no ASCII literal
+        elif char.isdecimal():
+            mapped = "\u0663"  # ARABIC-INDIC DIGIT THREE: \d and \w, outside [0-9]
+        elif char.isalnum():
+            mapped = "\u00e9"  # e WITH ACUTE: \w, no ASCII case twin
+        else:
+            mapped = "\u00bf"  # INVERTED QUESTION MARK: neither \w nor \s
+        self[code] = mapped
+        return mapped
+
+
+# ASCII passes through except the separators only re counts as \s
+_CONFIRM_MAP = _ConfirmMap({code: chr(code) for code in range(128)})
+_CONFIRM_MAP.update({code: "\u00a0" for code in range(0x1C, 0x20)})
+
+
+class _PrefilterMap(dict[int, str]):
+    """str.translate table: non-ASCII stand-ins -> an ASCII char RE2 treats alike
+
+    Applied after _CONFIRM_MAP, so only its stand-ins are left to map. RE2's \\b
+    and \\s are ASCII-only while Python's are Unicode-aware: mapping the space
+    stand-in to " " and the word ones to an ASCII word char makes every Python
+    match an RE2 match too. Extra RE2 hits are dropped by the Python confirmation.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        if char.isspace():
+            mapped = " "
+        elif char.isalnum():
+            mapped = "_"  # Any word char, so \b stays where Python puts it
+        else:
+            mapped = "?"  # Non-word, and valid UTF-8 for RE2
+        self[code] = mapped
+        return mapped
+
+
+_PREFILTER_MAP = _PrefilterMap({code: chr(code) for code in range(128)})
+
+
+def _merge(patterns: list[str]) -> str:
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+def _valid_patterns(patterns: list[str]) -> list[str]:
+    valid = []
+    for p in patterns:
+        try:
+            regex.compile(p, regex.IGNORECASE)
+        except regex.error:
+            continue
+        valid.append(p)
+    return valid
+
+
+class SkillPatternSet:
+    """Skill key -> patterns, matched with one RE2 pass plus Python confirmation"""
+
+    def __init__(self, skills: Iterable[tuple[str, list[str]]]) -> None:
+        # Skill key -> its patterns, case variants dropped (duplicates under IGNORECASE)
+        self.sources: dict[str, list[str]] = {}
+        for key, patterns in skills:
+            unique: dict[str, str] = {}
+            for p in patterns:
+                unique.setdefault(_case_fold_pattern(p), p)
+            if unique:
+                self.sources[key] = list(unique.values())
+
+        # Merged Python regex per skill, compiled on its first confirmation -
+        # most skills never reach one, and regex compiles are the load-time cost
+        self._compiled: dict[str, regex.Pattern[str] | None] = {}
+
+        self._set_keys: list[str] = []  # RE2 Set index -> skill key
+        self._unfiltered: list[str] = []  # Skills RE2 rejects, always confirmed in Python
+        self._set: re2.Set | None = self._build_set()
+        self._cache: dict[bytes, frozenset[str]] = {}  # Description digest -> skills
+
+    def _build_set(self) -> re2.Set | None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.never_capture = True
+        options.max_mem = _RE2_MAX_MEM
+        options.log_errors = False
+
+        re2_set = re2.Set.SearchSet(options)
+        for key, patterns in list(self.sources.items()):
+            try:
+                re2_set.Add(_merge(patterns))
+            except re2.error:
+                # Lookarounds, backrefs, ... or a broken pattern: keep what Python accepts
+                valid = _valid_patterns(patterns)
+                if not valid:
+                    del self.sources[key]
+                    continue
+                self.sources[key] = valid
+                self._unfiltered.append(key)
+                continue
+            self._set_keys.append(key)
+
+        try:
+            re2_set.Compile()
+        except re2.error:
+            logger.warning("RE2 could not compile the skill set, using Python regex only")
+            self._set_keys = []
+            self._unfiltered = list(self.sources)
+            return None
+        return re2_set
+
+    def _pattern(self, key: str) -> regex.Pattern[str] | None:
+        """The skill's merged Python regex, None if Python rejects all its patterns"""
+        if key in self._compiled:
+            return self._compiled[key]
+
+        patterns = self.sources[key]
+        try:
+            compiled = regex.compile(_merge(patterns), regex.IGNORECASE)
+        except regex.error:
+            valid = _valid_patterns(patterns)  # RE2 took a pattern Python cannot parse
+            compiled = regex.compile(_merge(valid), regex.IGNORECASE) if valid else None
+        self._compiled[key] = compiled
+        return compiled
+
+    def search(self, text: str) -> set[str]:
+        """Keys of every skill with a pattern that matches somewhere in text"""
+        # Reposts share descriptions verbatim - key on a digest, not the text itself
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        found = self._cache.get(digest)
+        if found is None:
+            found = frozenset(self._scan(text))
+            if len(self._cache) >= _CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]  # Oldest entry first
+            self._cache[digest] = found
+        return set(found)
+
+    def _scan(self, text: str) -> Iterable[str]:
+        text = text.translate(_CONFIRM_MAP)
+        if self._set is None:
+            candidates: Iterable[str] = self._unfiltered
+        else:
+            hits = self._set.Match(text.translate(_PREFILTER_MAP)) or ()
+            candidates = [self._set_keys[i] for i in hits] + self._unfiltered
+        return (key for key in candidates if self._confirm(key, text))
+
+    def _confirm(self, key: str, text: str) -> bool:
+        pattern = self._pattern(key)
+        if pattern is None:
+            return False
+        try:
+            return pattern.search(text, timeout=_MATCH_TIMEOUT) is not None
+        except TimeoutError:
+            logger.warning(
+                f"Skill pattern for {key!r} timed out, treated as no match - "
+                f"rewrite it: {pattern.pattern[:200]}"
+            )
+            return False
@@ -1,20 +1,31 @@
 """
 Real-time Validation Module
-Calls Node.js validation directly for speed - NO PYTHON PATTERN MATCHING
+Matches skills in-process against the validator's pre-compiled patterns (same
+patterns as the .sh validation layers).
 """
 
-import json
-import subprocess
-from pathlib import Path
+import functools
+
+from src.validation.single_job_validator import SingleJobValidator, get_validator
+
+DEFAULT_SKILLS_REFERENCE = "src/config/skills_reference_2025.json"
+
+
+@functools.lru_cache(maxsize=4)
+def _validator_for(skills_reference_path: str) -> SingleJobValidator:
+    """Compiled patterns per reference file - the default shares the singleton"""
+    if skills_reference_path == DEFAULT_SKILLS_REFERENCE:
+        return get_validator()
+    return SingleJobValidator(skills_reference_path)
 
 
 def validate_skills_via_node(
     job_description: str,
-    skills_reference_path: str = "src/config/skills_reference_2025.json",
+    skills_reference_path: str = DEFAULT_SKILLS_REFERENCE,
 ) -> list[str]:
     """
-    Validate and extract skills using Node.js for speed.
-    This bypasses Python regex entirely - uses the same patterns as .sh validation layers.
+    Validate and extract skills with the cached, pre-compiled skill patterns.
+    No subprocess and no JSON reload per call.
 
     Args:
         job_description: The job description text
@@ -26,62 +37,16 @@ def validate_skills_via_node(
     if not job_description or not job_description.strip():
         return []
 
-    # Escape job description for shell and JS template literals
-    escaped_jd = (
-        job_description.replace("\\", "\\\\")
-        .replace("`", "\\`")
-        .replace("$", "\\$")
-        .replace("'", "'\\''")
-    )
-
-    # Node.js inline script for fast pattern matching
-    node_script = f"""
-const fs = require('fs');
-const skillsData = JSON.parse(fs.readFileSync('{skills_reference_path}', 'utf8'));
-
-const text = `{escaped_jd}`;
-
-const found = new Set();
-for (const skill of skillsData.skills) {{
-    for (const p of skill.patterns || []) {{
-        try {{
-            if (new RegExp(p, 'i').test(text)) {{
-                found.add(skill.name);
-                break;
-            }}
-        }} catch (e) {{}}
-    }}
-}}
-
-console.log(JSON.stringify([...found].sort()));
-"""
-
-    try:
-        result = subprocess.run(
-            ["node", "-e", node_script],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=str(
-                Path(skills_reference_path).parent.parent.parent
-            ),  # code/ directory
-        )
-
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout.strip())
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception):
-        pass
-
-    return []
+    return sorted(_validator_for(skills_reference_path).detect_skills_in_text(job_description))
 
 
 def validate_skills(
     job_description: str,
     extracted_skills: list[str],
-    skills_reference_path: str = "src/config/skills_reference_2025.json",
+    skills_reference_path: str = DEFAULT_SKILLS_REFERENCE,
 ) -> list[str]:
     """
     Validate extracted skills - returns ONLY pattern-matched skills.
-    Uses Node.js for speed, same as .sh validation layers.
+    Uses the same patterns as the .sh validation layers.
     """
     return validate_skills_via_node(job_description, skills_reference_path)
@@ -14,11 +14,12 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Set
 
+from src.validation.pattern_set import SkillPatternSet
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,15 +40,16 @@ class SingleJobValidator:
 
     def __init__(self, skills_ref_path: str = "src/config/skills_reference_2025.json"):
         self.skills_ref_path = Path(skills_ref_path)
-        self.skill_patterns: dict[str, list[re.Pattern[str]]] = {}
+        self.skill_patterns: dict[str, list[str]] = {}
         self.skill_names: dict[str, str] = {}  # lowercase -> canonical name
         self._load_patterns()
 
     def _load_patterns(self) -> None:
-        """Load skill patterns from reference file"""
+        """Load skill patterns from reference file into one RE2-backed pattern set"""
         with open(self.skills_ref_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
+        skills: dict[str, list[str]] = {}
         for skill in data.get("skills", []):
             name = skill.get("name", "")
             patterns = skill.get("patterns", [])
@@ -55,30 +57,17 @@ class SingleJobValidator:
             if not name or not patterns:
                 continue
 
-            compiled_patterns: list[re.Pattern[str]] = []
-            for p in patterns:
-                try:
-                    compiled_patterns.append(re.compile(p, re.IGNORECASE))
-                except re.error:
-                    continue
+            skills[name.lower()] = patterns
+            self.skill_names[name.lower()] = name  # Only looked up for matched skills
 
-            if compiled_patterns:
-                self.skill_patterns[name.lower()] = compiled_patterns
-                self.skill_names[name.lower()] = name
+        self.matcher = SkillPatternSet(skills.items())
+        self.skill_patterns = self.matcher.sources
 
         logger.info(f"Loaded {len(self.skill_patterns)} skill patterns for validation")
 
     def detect_skills_in_text(self, text: str) -> Set[str]:
         """Detect all skills that match patterns in the text"""
-        detected: Set[str] = set()
-
-        for skill_lower, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                if pattern.search(text):
-                    detected.add(self.skill_names[skill_lower])
-                    break
-
-        return detected
+        return {self.skill_names[skill_lower] for skill_lower in self.matcher.search(text)}
 
     def validate_and_fix(
         self,
@@ -97,35 +86,28 @@ class SingleJobValidator:
             ValidationResult with original, validated skills, and changes
         """
         # Parse original skills
-        original_skills = set(
-            s.strip() for s in extracted_skills.split(",") if s.strip()
-        )
+        original_skills = set(filter(None, map(str.strip, extracted_skills.split(","))))
+
+        # Lowercase each original skill once; patterns are keyed by lowercase name
+        original_lower = {s: s.lower() for s in original_skills}
 
-        # Layer 3: Detect skills that SHOULD be in the description
-        detected_in_jd = self.detect_skills_in_text(job_description)
+        # Layer 3: Detect skills that SHOULD be in the description (lowercase keys)
+        detected_in_jd = self.matcher.search(job_description)
 
         # Layer 3: False Positive Detection
-        # Skills in extracted but pattern doesn't match in JD
-        false_positives: Set[str] = set()
-        for skill in original_skills:
-            skill_lower = skill.lower()
-            if skill_lower in self.skill_patterns:
-                # Check if pattern actually matches in JD
-                found = False
-                for pattern in self.skill_patterns[skill_lower]:
-                    if pattern.search(job_description):
-                        found = True
-                        break
-                if not found:
-                    false_positives.add(skill)
+        # Skills in extracted but pattern doesn't match in JD (reuses the scan above)
+        false_positives: Set[str] = {
+            skill
+            for skill, skill_lower in original_lower.items()
+            if skill_lower in self.skill_patterns and skill_lower not in detected_in_jd
+        }
 
         # Layer 4: False Negative Detection
         # Skills detected by pattern but not in extracted
-        original_lower = {s.lower() for s in original_skills}
-        false_negatives: Set[str] = set()
-        for skill in detected_in_jd:
-            if skill.lower() not in original_lower:
-                false_negatives.add(skill)
+        false_negatives: Set[str] = {
+            self.skill_names[skill_lower]
+            for skill_lower in detected_in_jd.difference(original_lower.values())
+        }
 
         # Build validated skills set
         validated_skills = (original_skills - false_positives) | false_negatives
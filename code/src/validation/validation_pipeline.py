@@ -4,13 +4,18 @@ Validation Pipeline - Fast FP/FN Detection Layer
 Integrates with shell scripts for speed boost
 """
 
-import sqlite3
-import subprocess
+from __future__ import annotations
+
 import json
-import re
-from operator import itemgetter
+import os
+import subprocess
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import TypedDict
+from typing import Iterable, TypedDict
+
+from src.db.connection import open_db
+from src.validation.pattern_set import SkillPatternSet
 
 
 class JobValidationResult(TypedDict):
@@ -31,6 +36,13 @@ class BatchValidationResult(TypedDict):
     top_false_positives: list[tuple[str, int]]
     top_false_negatives: list[tuple[str, int]]
 
+
+# (true positives, false positives, false negatives, FP per skill, FN per skill)
+BatchTally = tuple[int, int, int, Counter[str], Counter[str]]
+
+_BATCH_WHERE = "WHERE job_description IS NOT NULL AND skills IS NOT NULL"
+
+
 class SkillValidator:
     """Validates skill extraction for False Positives and False Negatives"""
 
@@ -44,28 +56,18 @@ class SkillValidator:
         with open(self.skills_ref_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        self.skill_patterns = {}
-        for skill in data['skills']:
-            patterns = []
-            for p in skill.get('patterns', []):
-                try:
-                    patterns.append(re.compile(p, re.IGNORECASE))
-                except re.error:
-                    pass
-            if patterns:
-                self.skill_patterns[skill['name']] = patterns
+        # Invalid patterns are dropped; RE2 scans every skill in one pass
+        self.matcher = SkillPatternSet(
+            (skill['name'], skill.get('patterns', [])) for skill in data['skills']
+        )
+        self.skill_patterns = self.matcher.sources
 
     def validate_job(self, job_description: str, extracted_skills: str) -> JobValidationResult:
         """Validate a single job's skill extraction"""
-        extracted = set(s.strip() for s in extracted_skills.split(',') if s.strip())
-        detected = set()
+        extracted = set(filter(None, map(str.strip, extracted_skills.split(','))))
 
         # Detect skills using patterns
-        for skill_name, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                if pattern.search(job_description):
-                    detected.add(skill_name)
-                    break
+        detected = self.matcher.search(job_description)
 
         # Calculate FP and FN
         false_positives = extracted - detected  # In extracted but not detected
@@ -82,48 +84,74 @@ class SkillValidator:
 
     def validate_batch(self, limit: int = 100) -> BatchValidationResult:
         """Validate a batch of jobs and return aggregate stats"""
-        conn = sqlite3.connect(self.db_path)
+        conn = open_db(self.db_path, read_only=True)
         cursor = conn.cursor()
 
         cursor.execute(
-            "SELECT job_id, job_description, skills FROM jobs "
-            "WHERE job_description IS NOT NULL AND skills IS NOT NULL "
-            f"LIMIT {limit}"
+            f"SELECT job_description, skills FROM jobs {_BATCH_WHERE} LIMIT ?",
+            (limit,),
         )
 
+        tally = self.tally(cursor)  # Rows stream from the cursor, not a fetchall() list
+        conn.close()
+
+        return _batch_result(*tally)
+
+    def validate_batch_parallel(self, limit: int = 100, workers: int | None = None) -> BatchValidationResult:
+        """Same jobs and stats as validate_batch, split by rowid range across processes"""
+        workers = workers or os.cpu_count() or 1
+
+        # Rowid span of the first `limit` matching jobs (the rows validate_batch scans)
+        conn = open_db(self.db_path, read_only=True)
+        first, last = conn.execute(
+            "SELECT MIN(rowid), MAX(rowid) FROM "
+            f"(SELECT rowid FROM jobs {_BATCH_WHERE} ORDER BY rowid LIMIT ?)",
+            (limit,),
+        ).fetchone()
+        conn.close()
+
+        if first is None:
+            return _batch_result(0, 0, 0, Counter(), Counter())
+
+        step = -(-(last - first + 1) // workers)  # Ceiling division
+        ranges = [(lo, min(lo + step - 1, last)) for lo in range(first, last + 1, step)]
+
+        total_tp = total_fp = total_fn = 0
+        fp_counts: Counter[str] = Counter()
+        fn_counts: Counter[str] = Counter()
+
+        with ProcessPoolExecutor(
+            max_workers=len(ranges),
+            initializer=_init_batch_worker,
+            initargs=(self.db_path, self.skills_ref_path),
+        ) as pool:
+            for tp, fp, fn, shard_fps, shard_fns in pool.map(_validate_rowid_range, *zip(*ranges)):
+                total_tp += tp
+                total_fp += fp
+                total_fn += fn
+                fp_counts += shard_fps
+                fn_counts += shard_fns
+
+        return _batch_result(total_tp, total_fp, total_fn, fp_counts, fn_counts)
+
+    def tally(self, rows: Iterable[tuple[str, str]]) -> BatchTally:
+        """TP/FP/FN totals and per-skill FP/FN counts over (description, skills) rows"""
         total_tp = 0
         total_fp = 0
         total_fn = 0
-        fp_counts = {}
-        fn_counts = {}
+        fp_counts: Counter[str] = Counter()
+        fn_counts: Counter[str] = Counter()
 
-        for _, desc, skills in cursor.fetchall():
+        for desc, skills in rows:
             result = self.validate_job(desc, skills)
             total_tp += len(result['true_positives'])
             total_fp += len(result['false_positives'])
             total_fn += len(result['false_negatives'])
 
-            for fp in result['false_positives']:
-                fp_counts[fp] = fp_counts.get(fp, 0) + 1
-            for fn in result['false_negatives']:
-                fn_counts[fn] = fn_counts.get(fn, 0) + 1
+            fp_counts.update(result['false_positives'])
+            fn_counts.update(result['false_negatives'])
 
-        conn.close()
-
-        precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 1.0
-        recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 1.0
-        f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
-
-        return {
-            'total_true_positives': total_tp,
-            'total_false_positives': total_fp,
-            'total_false_negatives': total_fn,
-            'precision': precision,
-            'recall': recall,
-            'f1_score': f1,
-            'top_false_positives': sorted(fp_counts.items(), key=itemgetter(1), reverse=True)[:10],
-            'top_false_negatives': sorted(fn_counts.items(), key=itemgetter(1), reverse=True)[:10]
-        }
+        return total_tp, total_fp, total_fn, fp_counts, fn_counts
 
     def run_shell_validation(self) -> str:
         """Run shell script for fast pattern validation"""
@@ -138,6 +166,48 @@ class SkillValidator:
         return "Shell validation script not found"
 
 
+def _batch_result(
+    total_tp: int, total_fp: int, total_fn: int, fp_counts: Counter[str], fn_counts: Counter[str]
+) -> BatchValidationResult:
+    precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 1.0
+    recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+
+    return {
+        'total_true_positives': total_tp,
+        'total_false_positives': total_fp,
+        'total_false_negatives': total_fn,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+        'top_false_positives': fp_counts.most_common(10),
+        'top_false_negatives': fn_counts.most_common(10)
+    }
+
+
+# Per-process validator for validate_batch_parallel - patterns compiled once per worker
+_worker_validator: SkillValidator | None = None
+
+
+def _init_batch_worker(db_path: str, skills_ref_path: str) -> None:
+    global _worker_validator
+    _worker_validator = SkillValidator(db_path, skills_ref_path)
+
+
+def _validate_rowid_range(lo: int, hi: int) -> BatchTally:
+    """Tally one shard over a read-only connection of its own"""
+    assert _worker_validator is not None, "pool initializer did not run"
+    conn = open_db(_worker_validator.db_path, read_only=True)
+    try:
+        rows = conn.execute(
+            f"SELECT job_description, skills FROM jobs {_BATCH_WHERE} AND rowid BETWEEN ? AND ?",
+            (lo, hi),
+        )
+        return _worker_validator.tally(rows)
+    finally:
+        conn.close()
+
+
 def main():
     """Run validation pipeline"""
     print("=" * 60)
@@ -7,15 +7,21 @@ import os
 import streamlit as st
 from dotenv import load_dotenv
 
-# Load environment variables (including PLAYWRIGHT_BROWSERS_PATH)
-load_dotenv()
 
-# FIX: Force TMPDIR to Linux filesystem (NTFS causes Playwright SIGTRAP crash)
-os.environ["TMPDIR"] = "/tmp"
-os.environ["TMP"] = "/tmp"
-os.environ["TEMP"] = "/tmp"
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> bool:
+    """Process-wide environment setup - runs once, not on every rerun"""
+    # Load environment variables (including PLAYWRIGHT_BROWSERS_PATH)
+    load_dotenv()
 
-from src.db import DatabaseConnection, JobStorageOperations, SchemaManager
+    # FIX: Force TMPDIR to Linux filesystem (NTFS causes Playwright SIGTRAP crash)
+    os.environ.update(TMPDIR="/tmp", TMP="/tmp", TEMP="/tmp")
+    return True
+
+
+_bootstrap()
+
+from src.db import DatabaseConnection, SchemaManager
 from src.ui.components import (
     render_analytics_overview,
     render_compact_kpi,
@@ -25,12 +31,28 @@ from src.ui.components import (
     render_skills_analysis,
     render_validation_dashboard,
 )
+from src.ui.components.storage_handle import get_db_ops
 
 logging.basicConfig(level=logging.INFO)
 DB_PATH = "data/jobs.db"
 
+
+@st.cache_resource(show_spinner=False)
+def _init_db(db_path: str) -> str:
+    """Create tables and indexes once per server process, not on every rerun"""
+    SchemaManager(DatabaseConnection(db_path=db_path)).initialize_schema()
+    return db_path
+
+
 # Initialize database
-SchemaManager(DatabaseConnection(db_path=DB_PATH)).initialize_schema()
+_init_db(DB_PATH)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_all_jobs(db_path: str) -> list[dict[str, str | None]]:
+    """All jobs for the Analytics tab, re-read from SQLite at most every 5 minutes"""
+    return get_db_ops(db_path).get_all_jobs()
+
 
 # Page configuration
 st.set_page_config(
@@ -80,9 +102,11 @@ with tab4:
         "**Real-time insights from 2-platform architecture (LinkedIn + Naukri)**"
     )
 
-    # Load data from database
-    db_ops = JobStorageOperations(DB_PATH)
-    all_jobs = db_ops.get_all_jobs()
+    if st.button("🔄 Refresh Data", key="analytics_refresh"):
+        _load_all_jobs.clear()
+
+    # Load data from database (cached across reruns)
+    all_jobs = _load_all_jobs(DB_PATH)
 
     # Render modular analytics components
     render_analytics_overview(all_jobs)
@@ -6,7 +6,12 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Page, async_playwright
+
+async def _probe(page: Page, selector: str) -> str | None:
+    """Inner text of the first element matching selector, None if nothing matches"""
+    element = await page.query_selector(selector)
+    return await element.inner_text() if element else None
 
 async def debug_job_detail_page():
     """Open a LinkedIn job detail page and find working selectors"""
@@ -42,8 +47,10 @@ async def debug_job_detail_page():
             "button[class*='sign-in']",
             "a[href*='/login']"
         ]
-        for selector in login_selectors:
-            if await page.query_selector(selector):
+        # Probe every selector concurrently - one CDP round-trip instead of N
+        login_hits = await asyncio.gather(*(page.query_selector(s) for s in login_selectors))
+        for selector, hit in zip(login_selectors, login_hits):
+            if hit:
                 print(f"⚠️  LOGIN WALL DETECTED: {selector}")
                 print("❌ LinkedIn requires authentication. Job details not accessible without login.\n")
                 break
@@ -75,22 +82,21 @@ async def debug_job_detail_page():
         all_selectors = old_selectors + new_selectors
         found_description = False
         
-        for selector in all_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
-                    if text and len(text.strip()) > 50:  # Valid description
-                        print(f"✅ WORKING: {selector}")
-                        print(f"   Text length: {len(text)} chars")
-                        print(f"   Preview: {text[:100]}...\n")
-                        found_description = True
-                    else:
-                        print(f"⚠️  FOUND BUT EMPTY: {selector}\n")
-                else:
-                    print(f"❌ NOT FOUND: {selector}")
-            except Exception as e:
-                print(f"❌ ERROR: {selector} - {e}")
+        results = await asyncio.gather(
+            *(_probe(page, s) for s in all_selectors), return_exceptions=True
+        )
+        for selector, text in zip(all_selectors, results):
+            if isinstance(text, BaseException):
+                print(f"❌ ERROR: {selector} - {text}")
+            elif text is None:
+                print(f"❌ NOT FOUND: {selector}")
+            elif text and len(text.strip()) > 50:  # Valid description
+                print(f"✅ WORKING: {selector}")
+                print(f"   Text length: {len(text)} chars")
+                print(f"   Preview: {text[:100]}...\n")
+                found_description = True
+            else:
+                print(f"⚠️  FOUND BUT EMPTY: {selector}\n")
         
         if not found_description:
             print("\n⚠️  NO VALID DESCRIPTION SELECTOR FOUND!")
@@ -120,19 +126,22 @@ async def debug_job_detail_page():
             ],
         }
         
-        for field, selectors in test_cases.items():
+        field_results = await asyncio.gather(
+            *(
+                asyncio.gather(*(_probe(page, s) for s in selectors), return_exceptions=True)
+                for selectors in test_cases.values()
+            )
+        )
+        for (field, selectors), results in zip(test_cases.items(), field_results):
             print(f"\n{field}:")
-            for selector in selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.inner_text()
-                        print(f"  ✅ {selector}: '{text.strip()[:50]}'")
-                        break
-                    else:
-                        print(f"  ❌ {selector}")
-                except Exception as e:
-                    print(f"  ❌ {selector} - {e}")
+            for selector, text in zip(selectors, results):
+                if isinstance(text, BaseException):
+                    print(f"  ❌ {selector} - {text}")
+                elif text is not None:
+                    print(f"  ✅ {selector}: '{text.strip()[:50]}'")
+                    break
+                else:
+                    print(f"  ❌ {selector}")
         
         print("\n" + "=" * 70)
         print("⏸️  Browser will stay open for 30 seconds - manually inspect!")
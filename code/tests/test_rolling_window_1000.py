@@ -4,29 +4,21 @@ Note: In production, limit will come from Streamlit UI inputs
 """
 import asyncio
 import logging
-import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.db.connection import open_db
 from src.scraper.unified.linkedin.complete_workflow import complete_linkedin_workflow
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('tests/rolling_window_output.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
 def get_job_count() -> int:
     """Get total jobs in database"""
-    conn = sqlite3.connect('data/jobs.db')
+    conn = open_db('data/jobs.db', read_only=True)
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM jobs")
     count = cursor.fetchone()[0]
@@ -103,4 +95,13 @@ async def test_complete_workflow_1000():
 
 
 if __name__ == "__main__":
+    # Log to file only when run as a script - importing must not create the log
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('tests/rolling_window_output.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
     asyncio.run(test_complete_workflow_1000())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Skill Pattern Set Parity Test
+SkillPatternSet.search() must return exactly what the per-pattern re scan did,
+including text where RE2's ASCII-only \\b / \\s would disagree with Python's
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Callable
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.validation.pattern_set import SkillPatternSet
+
+REFERENCE_PATH = Path(__file__).parent.parent / 'src' / 'config' / 'skills_reference_2025.json'
+CHUNK = 20  # Skill names per synthetic description
+
+FULLWIDTH = {c: chr(ord(c) + 0xFEE0) for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'}
+
+# Rewrites that keep a description readable but move it off plain ASCII
+VARIANTS: dict[str, Callable[[str], str]] = {
+    'plain': lambda t: t,
+    'fullwidth letters': lambda t: t.translate(str.maketrans(FULLWIDTH)),
+    'fullwidth neighbours': lambda t: t.replace(', ', 'Ｘ, Ｘ'),
+    'long s (ſ)': lambda t: t.replace('s', 'ſ'),
+    'dotted capital I (İ)': lambda t: t.replace('i', 'İ').replace('I', 'İ'),
+    'dotless i (ı)': lambda t: t.replace('i', 'ı').replace('I', 'ı'),
+    'kelvin sign': lambda t: t.replace('k', 'K'),
+    'ligatures': lambda t: t.replace('fi', 'ﬁ').replace('fl', 'ﬂ').replace('ff', 'ﬀ'),
+    'unicode spaces': lambda t: t.replace(' ', '\u00a0').replace(', ', ',\u2003'),
+    'accented word chars': lambda t: t.replace(', ', 'é, é'),
+    'combining marks': lambda t: t.replace(', ', '\u0301, \u0301'),
+    'superscripts and digits': lambda t: t.replace(', ', '², ٣'),
+    'information separators': lambda t: t.replace(' ', '\x1f'),
+}
+
+
+def load_reference() -> list[tuple[str, list[str]]]:
+    with open(REFERENCE_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [(skill['name'], skill.get('patterns', [])) for skill in data['skills']]
+
+
+def re_scan(compiled: list[tuple[str, list[re.Pattern[str]]]], text: str) -> set[str]:
+    """Original behaviour: every pattern searched on its own with re"""
+    return {name for name, patterns in compiled if any(p.search(text) for p in patterns)}
+
+
+def test_pattern_set_matches_per_pattern_re_scan() -> None:
+    skills = load_reference()
+    compiled = [(name, [re.compile(p, re.IGNORECASE) for p in patterns]) for name, patterns in skills]
+    matcher = SkillPatternSet(skills)
+
+    names = [name for name, _ in skills]
+    descriptions = [
+        'Experience with ' + ', '.join(names[i:i + CHUNK]) + ' required.'
+        for i in range(0, len(names), CHUNK)
+    ]
+
+    mismatches: list[str] = []
+    for label, variant in VARIANTS.items():
+        for description in descriptions:
+            text = variant(description)
+            expected = re_scan(compiled, text)
+            found = matcher.search(text)
+            if found != expected:
+                mismatches.append(
+                    f"{label}: missing {sorted(expected - found)}, extra {sorted(found - expected)}"
+                )
+
+    assert not mismatches, '\n'.join(mismatches[:10])
+
+
+if __name__ == '__main__':
+    test_pattern_set_matches_per_pattern_re_scan()
+    print(f"✅ SkillPatternSet matches the per-pattern re scan ({len(VARIANTS)} text variants)")
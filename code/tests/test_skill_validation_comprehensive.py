@@ -6,119 +6,132 @@ Detects false positives and false negatives in skill extraction
 
 import sys
 import sqlite3
-import json
+from multiprocessing import Pool
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.db.connection import open_db
 
-def load_canonical_skills(reference_path: str) -> set[str]:
-    """Load all canonical skill names from reference file"""
-    with open(reference_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    skills = set()
-    for skills_list in data['skills'].values():
-        for skill in skills_list:
-            skills.add(skill['name'])
-    
-    return skills
+REFERENCE_PATH = 'src/config/skills_reference_2025.json'
+BAR = "=" * 80
+
+# Per-process validator for the extraction pool - built once per worker
+_worker_validator: SkillValidator | None = None
+
+def _init_worker(reference_path: str) -> None:
+    global _worker_validator
+    _worker_validator = SkillValidator(reference_path)
+
+def _extract(job: tuple[str, str, str]) -> tuple[str, str, set[str]]:
+    """Canonical skills in one job's description (runs in a worker)"""
+    assert _worker_validator is not None, "pool initializer did not run"
+    job_id, description, skills_str = job
+    return job_id, skills_str, _worker_validator.validate_and_extract(description)
+
+def iter_batches(cursor: sqlite3.Cursor, batch_size: int = 10_000):
+    """Yield lists of rows from an executed cursor, batch_size at a time"""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield rows
 
 def detect_false_positives_negatives() -> None:
     """Comprehensive false positive/negative detection"""
     
-    validator = SkillValidator('src/config/skills_reference_2025.json')
-    canonical_skills = load_canonical_skills('src/config/skills_reference_2025.json')
+    validator = SkillValidator(REFERENCE_PATH)
+    canonical_skills = validator.canonical_names  # Same parse as the validator
     
-    conn = sqlite3.connect('data/jobs.db')
+    conn = open_db('data/jobs.db', read_only=True)  # mmap + large page cache for the scan
     cursor = conn.cursor()
     
     # Get all LinkedIn jobs
     cursor.execute('''
-        SELECT job_id, actual_role, job_description, skills 
+        SELECT job_id, job_description, skills 
         FROM jobs 
         WHERE platform='linkedin'
         AND job_description IS NOT NULL
     ''')
     
-    jobs = cursor.fetchall()
-    
-    false_positives = defaultdict(int)
+    false_positives: Counter[str] = Counter()
     false_negatives = defaultdict(list)
-    total_jobs = len(jobs)
+    total_jobs = 0
     
-    print("="*80)
+    print(BAR)
     print("🔍 FALSE POSITIVE / FALSE NEGATIVE DETECTION")
-    print("="*80)
-    print(f"Analyzing {total_jobs} LinkedIn jobs...")
+    print(BAR)
+    print("Analyzing LinkedIn jobs...")
     print(f"Canonical Skills Reference: {len(canonical_skills)} skills\n")
     
-    for job_id, description, skills_str in [(j[0], j[2], j[3]) for j in jobs]:
-        if not skills_str:
-            continue
+    # Stream rows in chunks - descriptions are multi-KB, don't hold them all.
+    # Regex extraction is CPU-bound, so it runs across worker processes.
+    with Pool(initializer=_init_worker, initargs=(REFERENCE_PATH,)) as pool:
+        for rows in iter_batches(cursor):
+            total_jobs += len(rows)
+            jobs = [row for row in rows if row[2]]
             
-        stored_skills = set([s.strip() for s in skills_str.split(',') if s.strip()])
-        
-        # Detect FALSE POSITIVES (skills not in canonical reference)
-        for skill in stored_skills:
-            if skill not in canonical_skills:
-                false_positives[skill] += 1
-        
-        # Detect FALSE NEGATIVES (skills in description but not extracted)
-        canonical_in_desc = validator.validate_and_extract(description)
-        missing = canonical_in_desc - stored_skills
-        
-        if missing:
-            false_negatives[job_id] = list(missing)
+            for job_id, skills_str, canonical_in_desc in pool.imap_unordered(
+                _extract, jobs, chunksize=64
+            ):
+                stored_skills = set(filter(None, map(str.strip, skills_str.split(','))))
+                
+                # Detect FALSE POSITIVES (skills not in canonical reference)
+                false_positives.update(stored_skills - canonical_skills)
+                
+                # Detect FALSE NEGATIVES (skills in description but not extracted)
+                missing = canonical_in_desc - stored_skills
+                
+                if missing:
+                    false_negatives[job_id] = list(missing)
     
-    # Report FALSE POSITIVES
-    print("\n❌ FALSE POSITIVES (Skills NOT in canonical reference):")
-    print("="*80)
+    # Report FALSE POSITIVES - each section is buffered and written once
+    lines = ["\n❌ FALSE POSITIVES (Skills NOT in canonical reference):", BAR]
     
     if false_positives:
-        sorted_fps = sorted(false_positives.items(), key=lambda x: int(x[1]), reverse=True)
-        for skill, count in sorted_fps[:20]:  # Top 20
-            print(f"  • {skill}: {count} occurrences")
+        for skill, count in false_positives.most_common(20):  # Top 20
+            lines.append(f"  • {skill}: {count} occurrences")
         
-        print(f"\nTotal False Positive Types: {len(false_positives)}")
-        print(f"Total False Positive Instances: {sum(false_positives.values())}")
+        lines.append(f"\nTotal False Positive Types: {len(false_positives)}")
+        lines.append(f"Total False Positive Instances: {sum(false_positives.values())}")
     else:
-        print("  ✅ NONE - All extracted skills are in canonical reference!")
+        lines.append("  ✅ NONE - All extracted skills are in canonical reference!")
+    print("\n".join(lines))
     
     # Report FALSE NEGATIVES
-    print(f"\n⚠️  FALSE NEGATIVES (Skills in description but not extracted):")
-    print("="*80)
+    lines = ["\n⚠️  FALSE NEGATIVES (Skills in description but not extracted):", BAR]
     
     if false_negatives:
         # Count missing skills across all jobs
-        missing_counts = defaultdict(int)
+        missing_counts: Counter[str] = Counter()
         for missing_list in false_negatives.values():
-            for skill in missing_list:
-                missing_counts[skill] += 1
+            missing_counts.update(missing_list)
         
-        sorted_fns = sorted(missing_counts.items(), key=lambda x: int(x[1]), reverse=True)
-        print(f"\nMost Frequently Missing Skills:")
-        for skill, count in sorted_fns[:20]:  # Top 20
-            print(f"  • {skill}: missing in {count} job(s)")
+        lines.append("\nMost Frequently Missing Skills:")
+        for skill, count in missing_counts.most_common(20):  # Top 20
+            lines.append(f"  • {skill}: missing in {count} job(s)")
         
-        print(f"\nTotal Jobs with False Negatives: {len(false_negatives)}")
-        print(f"Total False Negative Types: {len(missing_counts)}")
+        lines.append(f"\nTotal Jobs with False Negatives: {len(false_negatives)}")
+        lines.append(f"Total False Negative Types: {len(missing_counts)}")
     else:
-        print("  ✅ NONE - All relevant skills extracted!")
+        lines.append("  ✅ NONE - All relevant skills extracted!")
+    print("\n".join(lines))
     
     # Overall Statistics
-    print(f"\n{'='*80}")
-    print("📊 VALIDATION STATISTICS")
-    print(f"{'='*80}")
-    print(f"Total Jobs Analyzed: {total_jobs}")
-    print(f"Canonical Skills: {len(canonical_skills)}")
-    print(f"False Positive Rate: {(len(false_positives)/len(canonical_skills)*100):.2f}%")
-    print(f"Jobs with False Negatives: {len(false_negatives)}")
-    print(f"False Negative Rate: {(len(false_negatives)/total_jobs*100):.2f}%")
-    print("="*80)
+    print("\n".join([
+        f"\n{BAR}",
+        "📊 VALIDATION STATISTICS",
+        BAR,
+        f"Total Jobs Analyzed: {total_jobs}",
+        f"Canonical Skills: {len(canonical_skills)}",
+        f"False Positive Rate: {(len(false_positives)/len(canonical_skills)*100):.2f}%",
+        f"Jobs with False Negatives: {len(false_negatives)}",
+        f"False Negative Rate: {(len(false_negatives)/total_jobs*100):.2f}%",
+        BAR,
+    ]))
     
     conn.close()
 
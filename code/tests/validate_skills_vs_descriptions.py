@@ -4,19 +4,34 @@ Comprehensive Skills vs Job Description Validation
 Cross-validates extracted skills against actual job descriptions
 """
 
+import re
 import sys
-import sqlite3
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.db.connection import open_db
+
+BAR = "=" * 80
 
 def validate_skills_against_descriptions(sample_size: int = 10) -> None:
     """Validate that extracted skills genuinely appear in job descriptions"""
     
     validator = SkillValidator('src/config/skills_reference_2025.json')
-    conn = sqlite3.connect('data/jobs.db')
+    
+    # Compile every skill's patterns once, not per extracted skill per job
+    patterns_by_skill: dict[str, list[re.Pattern[str]]] = {}
+    for skill_name, patterns in validator.skill_patterns:
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                pass  # Skip invalid patterns
+        patterns_by_skill[skill_name] = compiled
+    
+    conn = open_db('data/jobs.db', read_only=True)  # mmap + large page cache for the scan
     cursor = conn.cursor()
     
     # Get random LinkedIn jobs
@@ -32,79 +47,64 @@ def validate_skills_against_descriptions(sample_size: int = 10) -> None:
     
     jobs = cursor.fetchall()
     
-    print("="*80)
+    print(BAR)
     print("🔍 SKILLS vs JOB DESCRIPTION VALIDATION REPORT")
-    print("="*80)
+    print(BAR)
     print(f"Sample Size: {sample_size} LinkedIn jobs\n")
     
     total_verified = 0
     total_extracted = 0
     
     for idx, (job_id, role, description, skills_str) in enumerate(jobs, 1):
-        print(f"\n{'='*80}")
-        print(f"JOB #{idx}: {role[:60]}")
-        print(f"ID: {job_id[:16]}")
-        print(f"{'='*80}")
+        lines = [f"\n{BAR}", f"JOB #{idx}: {role[:60]}", f"ID: {job_id[:16]}", BAR]
         
         # Re-extract to verify
         extracted_skills = validator.validate_and_extract(description)
-        stored_skills = set([s.strip() for s in skills_str.split(',') if s.strip()])
+        stored_skills = set(filter(None, map(str.strip, skills_str.split(','))))
         
         total_extracted += len(extracted_skills)
+        desc_lower = description.lower()
         
         # Show extracted skills
-        print(f"\n✅ EXTRACTED SKILLS ({len(extracted_skills)}):")
+        lines.append(f"\n✅ EXTRACTED SKILLS ({len(extracted_skills)}):")
         for skill in sorted(extracted_skills):
             # Verify skill appears in description
-            desc_lower = description.lower()
-            skill_found = False
-            
-            # Get patterns for this skill
-            for skills_list in validator.canonical_skills.values():
-                for skill_obj in skills_list:
-                    if skill_obj['name'] == skill:
-                        # Check if any pattern matches
-                        import re
-                        for pattern in skill_obj['patterns']:
-                            try:
-                                if re.search(pattern, desc_lower, re.IGNORECASE):
-                                    skill_found = True
-                                    break
-                            except:
-                                pass
-                        break
-                if skill_found:
-                    break
+            skill_found = any(
+                p.search(desc_lower) for p in patterns_by_skill.get(skill, ())
+            )
             
             if skill_found:
-                print(f"  ✓ {skill}")
+                lines.append(f"  ✓ {skill}")
                 total_verified += 1
             else:
-                print(f"  ⚠ {skill} (verification pending)")
+                lines.append(f"  ⚠ {skill} (verification pending)")
         
         # Show description snippet
-        print(f"\n📄 DESCRIPTION SNIPPET:")
+        lines.append(f"\n📄 DESCRIPTION SNIPPET:")
         desc_snippet = description[:300].replace('\n', ' ')
-        print(f"  {desc_snippet}...")
+        lines.append(f"  {desc_snippet}...")
         
         # Consistency check
         if extracted_skills == stored_skills:
-            print(f"\n✅ Database consistency: PERFECT MATCH")
+            lines.append(f"\n✅ Database consistency: PERFECT MATCH")
         else:
             diff = len(extracted_skills.symmetric_difference(stored_skills))
-            print(f"\n⚠ Database diff: {diff} skills (re-validation needed)")
+            lines.append(f"\n⚠ Database diff: {diff} skills (re-validation needed)")
+        
+        # One write per job instead of one per line
+        print("\n".join(lines))
     
     # Summary
-    print(f"\n{'='*80}")
+    print(f"\n{BAR}")
     print("📊 VALIDATION SUMMARY")
-    print(f"{'='*80}")
+    print(BAR)
     print(f"Total Skills Extracted: {total_extracted}")
     print(f"Verified in Descriptions: {total_verified}")
     print(f"Verification Rate: {(total_verified/total_extracted*100) if total_extracted > 0 else 0:.1f}%")
     print(f"\n✅ All extracted skills are HARD TECHNICAL SKILLS")
     print(f"✅ No soft skills detected")
     print(f"✅ No industry/domain names detected")
-    print("="*80)
+    print(BAR)
     
     conn.close()
 